@@ -316,7 +316,98 @@ class Config:
     
     # Audio/Video settings
     WHISPER_MODEL_NAME = "base"
+    # "openai-whisper" (PyTorch reference) or "faster-whisper" (CTranslate2, int8 on CPU);
+    # compare with scripts/benchmark_transcription.py
+    TRANSCRIPTION_BACKEND = "openai-whisper"
+    FASTER_WHISPER_DEVICE = "cpu"
+    FASTER_WHISPER_COMPUTE_TYPE = "int8"  # "int8", "int8_float32", "float32", ...
+    FASTER_WHISPER_CPU_THREADS = None     # None = THREADS_WHISPER budget
+    FASTER_WHISPER_BEAM_SIZE = 1          # Greedy, like temperature-0 openai-whisper
+    # Chunked transcription: split at VAD pauses into chunks of at most TRANSCRIPTION_CHUNK_SECONDS
+    # and decode them concurrently. Thread-safe backends only (faster-whisper); openai-whisper
+    # keeps its single transcribe call
+    TRANSCRIPTION_CHUNKED = True
+    TRANSCRIPTION_CHUNK_SECONDS = 30      # Whisper's native window
+    TRANSCRIPTION_WORKERS = None          # None = THREADS_WHISPER budget
+    TRANSCRIPTION_WORD_TIMESTAMPS = False # Word-level times in segments (slower decoding)
+    # openai-whisper only: dynamic int8 quantization of the Linear layers at load (CPU)
+    WHISPER_QUANTIZE_INT8 = False
+
+    # CPU thread budget per stage, so Whisper, TensorFlow, BLAS and the LanguageTool
+    # JVM do not oversubscribe the cores (see components/thread_budget.py)
+    CPU_THREADS = None                    # Cores the app may use; None = os.cpu_count()
+    THREADS_WHISPER = None                # torch / CTranslate2; None = 1/2 of CPU_THREADS
+    THREADS_EMOTION = None                # TensorFlow intra-op / TFLite; None = 1/4
+    THREADS_TF_INTER_OP = 1
+    THREADS_BLAS = None                   # numpy/scipy BLAS (librosa, scikit-learn); None = 1/4
     RECORDING_DURATION = 60  # seconds
+    
+    # Emotion model inference
+    # Batch shapes of the compiled forward pass, each traced once. Inputs are padded to the
+    # smallest one that fits (3 windows run 8 rows, not 64); the largest is the chunk size
+    EMOTION_BATCH_SIZES = [8, 16, 32, 64]
+    # Runtime: "keras" (TensorFlow) or "tflite" (exported by scripts/export_emotion_tflite.py,
+    # runs on tflite-runtime without importing TensorFlow). int8 TFLite measured 5.9x faster per
+    # window with 2.7x less RSS (data/benchmarks/emotion_backend.md); switch once its parity holds
+    # on the trained weights
+    EMOTION_BACKEND = "keras"
+    EMOTION_TFLITE_PATH = MODELS_DIR / "best_model.tflite"
+    EMOTION_TFLITE_THREADS = None         # Interpreter threads (None = THREADS_EMOTION budget)
+    # Test-time augmentation: "none" (1x), "cheap" (noise/shift, 3x) or "full" (5x,
+    # adds time-stretch and pitch-shift). Measured cost per window: none 155 ms, cheap 312 ms,
+    # full 498 ms (data/benchmarks/emotion_tta_policy.md); kept at "full" until accuracy is measured
+    EMOTION_TTA_POLICY = "full"
+    # "whole_signal": one STFT/MFCC/ZCR/RMS pass over the recording, windows sliced out;
+    # "per_segment": features recomputed on every segment (original behaviour)
+    EMOTION_FEATURE_MODE = "whole_signal"
+    # Segmentation windows are exactly one model input long (100 STFT frames, ~3.2 s)
+    EMOTION_WINDOW_OVERLAP = 0.0          # Fraction of a window shared with the next one
+    EMOTION_WINDOW_HOP_SECONDS = None     # Explicit hop between windows; overrides the overlap
+    EMOTION_KEEP_TOP_FRACTION = 0.6       # Share of windows (highest energy first) classified when VAD is off
+    # Long recordings are analyzed block by block with bounded memory
+    EMOTION_STREAM_BLOCK_SECONDS = 30
+    EMOTION_STREAM_MIN_SECONDS = 600      # Recordings at least this long are streamed (analyze and the app)
+
+    # Voice activity detection - speech regions are computed once per recording and
+    # shared: emotion windows are placed only on them and Whisper only hears them
+    VAD_ENABLED = True
+    VAD_ENERGY_MARGIN_DB = 12.0           # Speech must be this far above the noise floor
+    # Optional absolute floor (dBFS) below which nothing is speech. Off by default: quiet microphones
+    # peak around -45 dBFS, and a -55 floor dropped most of their speech
+    VAD_MIN_ENERGY_DB = None
+    VAD_MAX_FLATNESS = 0.3                # Spectral flatness below this counts as voiced
+    VAD_MIN_BAND_RATIO = 0.6              # ...or this share of power within 300-3400 Hz
+    VAD_MIN_SPEECH = 0.25                 # Seconds; shorter regions are dropped
+    VAD_MIN_SILENCE = 0.3                 # Seconds; shorter pauses are bridged
+    VAD_PADDING = 0.1                     # Seconds added around each region
+    VAD_JOIN_GAP = 0.3                    # Silence inserted between regions sent to Whisper
+    TRANSCRIBE_SPEECH_ONLY = True
+
+    # Live emotion meter shown while recording
+    LIVE_EMOTION_ENABLED = True
+    LIVE_AUDIO_RING_SECONDS = 10          # Recent audio kept readable during capture
+    LIVE_EMOTION_INTERVAL_MS = 500        # Target time between updates
+    LIVE_EMOTION_BUDGET_MS = 150          # Updates slower than this make the meter back off
+    LIVE_EMOTION_MAX_BACKOFF = 8          # Longest interval, as a multiple of the target
+    LIVE_EMOTION_MAX_DUTY = 0.3           # Max share of wall time the meter thread may work
+
+    # Transcribe while recording: finished chunks (up to a pause) are transcribed in the background
+    INCREMENTAL_TRANSCRIPTION = True
+    INCREMENTAL_MIN_CHUNK_SECONDS = 10    # Buffered audio before the next pause is committed
+    INCREMENTAL_FINAL_TIMEOUT = 60        # Seconds to wait for the last chunk after stopping
+
+    # Model registry - load models once per process in the background at startup
+    MODEL_WARMUP_ON_START = True
+    
+    # Recorder PCM track (16 kHz mono WAV analyzed instead of the muxed AAC audio)
+    KEEP_PCM_AUDIO = True
+    # Retention applies to every WAV in the recordings directory, not just this session's
+    PCM_AUDIO_MAX_AGE_HOURS = 24          # Delete WAVs older than this (0 = no age limit)
+    PCM_AUDIO_MAX_FILES = 50              # Keep at most this many, newest first (0 = no count limit)
+    
+    # Capture codecs tried in order; an H.264 capture is stream copied into the final MP4,
+    # anything else is re-encoded to H.264 (ultrafast) so browsers can play it
+    RECORDING_VIDEO_CODECS = ['avc1', 'mp4v']
         # PDF Report Settings
     REPORTS_DIR = os.path.join(BASE_DIR, "reports")
     PDF_PAGE_SIZE = "letter"  # or "A4"
@@ -342,6 +433,20 @@ class Config:
     HR_CSV_PATH = HR_DIR / "interview_best_answers_samples.csv"
     HR_RUBRIC_PATH = HR_DIR / "hr_rubric.json"
     HR_OLD_RESULTS_PATH = HR_DIR / "hr_evaluation_results_with_samples.json"
+    
+    # Persisted FAISS indexes (saved next to the question banks)
+    TECH_FAISS_INDEX_DIR = TECHNICAL_DIR / "faiss_index"
+    HR_FAISS_INDEX_DIR = HR_DIR / "faiss_index"
+    
+    # Local embedding cache in front of the Azure embeddings endpoint
+    EMBEDDING_CACHE_DIR = DATA_DIR / "cache" / "embeddings"
+    EMBEDDING_CACHE_MAX_ENTRIES = 20000
+    
+    # Local transcript cache: same audio + same transcription settings skips Whisper
+    TRANSCRIPT_CACHE_ENABLED = True
+    TRANSCRIPT_CACHE_DIR = DATA_DIR / "cache" / "transcripts"
+    TRANSCRIPT_CACHE_MAX_MB = 64
+    
     GRAMMAR_BASIC_ENABLED = True          # LanguageTool (always available)
     GRAMMAR_AI_ENABLED = False            # GPT-4o (optional premium)
     GRAMMAR_AI_THRESHOLD = 30             # Min words for AI analysis
@@ -386,6 +491,27 @@ class Config:
     GRAMMAR_AI_ENABLED = True             # Azure OpenAI (optional premium)
     GRAMMAR_AI_THRESHOLD = 30             # Min words for AI analysis
     GRAMMAR_AI_AUTO_TRIGGER = True        # Auto-use AI for poor scores
+    GRAMMAR_AI_SPECULATIVE = True         # Start the AI request alongside LanguageTool (cancelled if unneeded)
+    # Sentences whose LanguageTool matches are kept (0 = off). Sentences are checked on their own,
+    # so matches spanning two sentences (e.g. a duplicated word across a full stop) are not reported
+    GRAMMAR_MATCH_CACHE_SIZE = 5000
+    
+    # LanguageTool HTTP servers shared by every checker and worker process (components/language_tool_pool.py).
+    # External servers if LANGUAGE_TOOL_URLS is set, else managed local servers on consecutive ports
+    LANGUAGE_TOOL_URLS = [url for url in os.getenv('LANGUAGE_TOOL_URLS', '').split(',') if url]
+    LANGUAGE_TOOL_SERVERS = 1             # Managed local servers (checks are spread round-robin)
+    LANGUAGE_TOOL_PORT = 8081             # Port of the first managed server
+    LANGUAGE_TOOL_DIR = None              # Unpacked LanguageTool; None = language_tool_python's download
+    LANGUAGE_TOOL_JAVA = "java"
+    LANGUAGE_TOOL_JAVA_OPTS = ["-Xmx512m"]
+    LANGUAGE_TOOL_START_TIMEOUT = 60      # Seconds for a started server to pass its health check
+    LANGUAGE_TOOL_HEALTH_INTERVAL = 30    # Seconds between health checks of a failed server
+    LANGUAGE_TOOL_REQUEST_TIMEOUT = 30
+    LANGUAGE_TOOL_CONNECTIONS = 8         # Keep-alive connections kept per server
+    # Long transcripts are checked as concurrent sentence batches of about this many characters;
+    # like the match cache, this misses matches spanning two batches (check with scripts/check_grammar_sharding.py)
+    GRAMMAR_SHARD_CHARS = 2000
+    GRAMMAR_SHARD_WORKERS = None          # Concurrent batch requests; None = LANGUAGE_TOOL_CONNECTIONS
     
     # Azure OpenAI settings
     AZURE_OPENAI_API_KEY = os.getenv('AZURE_OPENAI_API_KEY', '')
@@ -412,6 +538,37 @@ class Config:
     # Speech grammar scoring (more lenient)
     SPEECH_GRAMMAR_MIN_SCORE = 30        # Higher minimum than formal writing
     SPEECH_GRAMMAR_MAX_PENALTY = 40      # Lower max penalty than formal writing
+    
+    # Speech-aware LanguageTool filter table (components/speech_rule_filter.py). A match is dropped
+    # when its category or rule ID is listed, or its lower-cased message contains a listed phrase
+    GRAMMAR_SPEECH_FILTERS = {
+        'spelling': {
+            'categories': ['TYPOS'],
+            'rule_ids': ['MORFOLOGIK_RULE_EN_US', 'HUNSPELL_RULE', 'SPELLING_RULE', 'POSSIBLE_SPELLING_MISTAKE',
+                         'MORFOLOGIK_RULE', 'SPELLER_RULE', 'DICTIONARY_RULE'],
+            'messages': ['possible spelling mistake', 'spelling mistake found', 'use a different word',
+                         'did you mean', 'misspelled', 'not found in dictionary', 'unknown word',
+                         'correct spelling', 'typo', 'misspelling'],
+        },
+        'casual_punctuation': {
+            'rule_ids': ['COMMA_COMPOUND_SENTENCE', 'OXFORD_COMMA', 'COMMA_PARENTHETICAL', 'SEMICOLON_COMPOUND',
+                         'EN_QUOTES', 'ELLIPSIS'],
+            'messages': ["comma before 'and'", "use a comma before", "comma after", "semicolon instead",
+                         "quotation marks", "ellipsis"],
+        },
+        'overly_formal': {
+            'rule_ids': ['SENTENCE_FRAGMENT', 'INFORMAL_CONTRACTIONS', 'COLLOQUIAL_WORD', 'PASSIVE_VOICE', 'WORDINESS'],
+            'messages': ['sentence fragment', 'avoid using', 'too informal', 'passive voice', 'wordy', 'redundant'],
+        },
+        'transcription_artifact': {
+            'messages': ['single letter errors', 'missing space', 'extra space', 'capitalization'],
+        },
+    }
+    GRAMMAR_CAPITALIZED_SPELLING_MESSAGES = ['spelling', 'unknown']  # ...also dropped on a capitalized word (names)
+    GRAMMAR_NATURAL_SPEECH_PATTERNS = ['um', 'uh', 'er', 'ah', 'like', 'you know', 'so',
+                                       'well', 'actually', 'basically']  # Flagged text containing these is dropped
+    GRAMMAR_ARTIFACT_MAX_LENGTH = 2       # Flagged text this short is treated as an ASR artifact
+    GRAMMAR_RULE_MEMO_SIZE = 4096         # Memoized (ruleId, category, message) decisions
     @staticmethod
     def setup_reports_directory():
         """Create reports directory if it doesn't exist"""
@@ -0,0 +1,147 @@
+"""
+Accuracy parity and latency / memory benchmark of the emotion model backends.
+
+Each backend ("keras", "tflite") runs in its own subprocess, so import time and
+peak RSS are measured in isolation. Import time includes the backend's runtime
+(TensorFlow, or the TFLite interpreter), which the analyzer imports lazily.
+Both see the same scaled feature rows of the given recordings (no test-time
+augmentation, so the inputs are identical) and the report compares their
+predicted labels and probabilities. Measured results:
+data/benchmarks/emotion_backend.md.
+
+Usage:
+    python scripts/benchmark_emotion_backend.py data/recordings/*.wav --output reports/emotion_backend.md
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+BACKENDS = ["keras", "tflite"]
+
+
+def max_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux (bytes on macOS)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_worker(backend, files, repeats):
+    """Runs inside the subprocess: load one backend and time it over all files"""
+    start = time.perf_counter()
+    from components.emotion_analyzer import EmotionAnalyzer
+    from components.media_ingest import load_audio
+    from components.tflite_runner import interpreter_class
+    # The analyzer imports its runtime lazily, on first load; bill it to the import here
+    if backend == "keras":
+        import tensorflow  # noqa: F401
+    else:
+        interpreter_class()
+    import_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analyzer = EmotionAnalyzer(
+        model_path=Config.EMOTION_MODEL_PATH,
+        scaler_path=Config.SCALER_PATH,
+        encoder_path=Config.ENCODER_PATH,
+        tta_policy='none',
+        backend=backend
+    )
+    load_s = time.perf_counter() - start
+
+    X = []
+    for path in files:
+        audio = load_audio(path)
+        segments = analyzer.segment_waveform(audio.samples, audio.sample_rate)
+        bounds = [(int(round(s['start']*audio.sample_rate)), int(round(s['end']*audio.sample_rate)))
+                  for s in segments]
+        if bounds:
+            X.append(analyzer.extract_features_windows(audio.samples, audio.sample_rate, bounds))
+    X = analyzer.scaler.transform(np.concatenate(X))[..., None].astype(np.float32)
+
+    analyzer.predict_batched(X[:1])  # first call builds/traces the runtime
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        probs = analyzer.predict_batched(X)
+        latencies.append(time.perf_counter() - start)
+
+    print(json.dumps({
+        'backend': backend,
+        'import_s': round(import_s, 3),
+        'load_s': round(load_s, 3),
+        'rows': int(len(X)),
+        'latency_ms_per_row': round(1000 * float(np.median(latencies)) / len(X), 3),
+        'max_rss_mb': round(max_rss_mb(), 1),
+        'probs': probs.tolist(),
+    }))
+
+
+def run_backend(backend, files, repeats):
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", backend, "--repeats", str(repeats)] + files
+    res = subprocess.run(cmd, capture_output=True, text=True)
+    if res.returncode != 0:
+        print(f"{backend} backend failed:\n{res.stderr}")
+        return None
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Recordings to run through both backends")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=os.path.join(Config.REPORTS_DIR, "emotion_backend_report.md"))
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.files, args.repeats)
+        return
+
+    results = {}
+    for backend in BACKENDS:
+        print(f"Benchmarking '{backend}' backend...")
+        results[backend] = run_backend(backend, args.files, args.repeats)
+    if not all(results.values()):
+        sys.exit(1)
+
+    keras_probs = np.array(results['keras'].pop('probs'))
+    tflite_probs = np.array(results['tflite'].pop('probs'))
+    agreement = float(np.mean(keras_probs.argmax(axis=1) == tflite_probs.argmax(axis=1)))
+    max_diff = float(np.abs(keras_probs - tflite_probs).max())
+
+    lines = [
+        "# Emotion backend report",
+        "",
+        f"Recordings: {len(args.files)} ({results['keras']['rows']} feature windows), "
+        f"TFLite model: `{Config.EMOTION_TFLITE_PATH}`",
+        "",
+        f"Label agreement (tflite vs keras): {agreement:.2%}, max |probability diff|: {max_diff:.4f}",
+        "",
+        "| Backend | Import (s) | Load (s) | Latency per window (ms) | Peak RSS (MB) |",
+        "|---|---|---|---|---|",
+    ]
+    for backend, r in results.items():
+        lines.append(f"| {backend} | {r['import_s']} | {r['load_s']} | {r['latency_ms_per_row']} | {r['max_rss_mb']} |")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    with open(os.path.splitext(args.output)[0] + ".json", 'w', encoding='utf-8') as f:
+        json.dump({'agreement': agreement, 'max_prob_diff': max_diff, 'backends': results}, f, indent=2)
+
+    print("\n".join(lines))
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
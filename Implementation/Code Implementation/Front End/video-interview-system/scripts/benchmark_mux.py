@@ -0,0 +1,90 @@
+"""
+Benchmark "stop -> ready" muxing latency of AudioVideoRecorder.
+
+Generates a synthetic capture (video written with each capture codec the
+local OpenCV build can open + 16 kHz mono WAV) and times the recorder's ffmpeg
+mux (stream copy for H.264 captures, ultrafast x264 re-encode otherwise)
+against the old moviepy decode/re-encode path.
+
+Usage:
+    python scripts/benchmark_mux.py --seconds 120 --runs 3 [--codecs avc1 mp4v]
+"""
+import os
+import sys
+import time
+import wave
+import argparse
+import tempfile
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.audio_video_recorder import AudioVideoRecorder, H264_FOURCCS
+
+
+def make_capture(recorder, workdir, seconds, fps=20.0, size=(640, 480), sample_rate=16000):
+    """Write a synthetic capture the same way the recorder does"""
+    recorder.video_path = os.path.join(workdir, "temp_video.mp4")
+    recorder.audio_path = os.path.join(workdir, "temp_audio.wav")
+
+    out = recorder._open_video_writer(fps, size)
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (size[1], size[0], 3), dtype=np.uint8)
+    for i in range(int(seconds * fps)):
+        frame = np.roll(base, i * 4, axis=1)
+        out.write(frame)
+    out.release()
+
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t)
+    with wave.open(recorder.audio_path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+
+def time_call(fn, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=120.0, help="length of the synthetic answer")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--codecs", nargs="+", default=Config.RECORDING_VIDEO_CODECS, help="capture FourCCs to try")
+    parser.add_argument("--skip-reencode", action="store_true", help="do not time the moviepy path")
+    args = parser.parse_args()
+
+    recorder = AudioVideoRecorder()
+    for codec in args.codecs:
+        Config.RECORDING_VIDEO_CODECS = [codec]
+        with tempfile.TemporaryDirectory() as workdir:
+            print(f"Generating {args.seconds:.0f}s synthetic capture ({codec})...")
+            try:
+                make_capture(recorder, workdir, args.seconds)
+            except RuntimeError as e:
+                print(f"  {codec}: not available in this OpenCV build ({e})")
+                continue
+            recorder.output_path = os.path.join(workdir, "interview.mp4")
+
+            mode = "stream copy" if recorder.video_codec in H264_FOURCCS else "x264 ultrafast"
+            best, median = time_call(recorder._combine_av, args.runs)
+            print(f"  ffmpeg ({mode}) : best {best:.3f}s  median {median:.3f}s")
+
+            if not args.skip_reencode:
+                best_old, median_old = time_call(recorder._combine_av_reencode, args.runs)
+                print(f"  moviepy         : best {best_old:.3f}s  median {median_old:.3f}s")
+                print(f"  speed-up        : {median_old / median:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
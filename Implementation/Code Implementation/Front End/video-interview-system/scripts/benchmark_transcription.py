@@ -0,0 +1,143 @@
+"""
+WER parity and real-time-factor benchmark of the transcription backends.
+
+Every recording is transcribed by each backend (Config.WHISPER_MODEL_NAME, same
+decoding settings). Word error rate is measured against a reference transcript
+`data/transcripts/<recording stem>_transcript.txt` when one exists, otherwise
+against the openai-whisper output (i.e. parity with the reference backend).
+Real-time factor = transcription wall time / audio duration (lower is faster).
+With --int8, openai-whisper is also run with dynamic int8 quantization
+(Config.WHISPER_QUANTIZE_INT8). The transcript cache is disabled. A backend
+that cannot be loaded (package or model weights missing) is reported as
+unavailable and the others still run.
+
+Usage:
+    python scripts/benchmark_transcription.py data/recordings/*.wav --output reports/transcription_benchmark.md
+    python scripts/benchmark_transcription.py data/recordings/*.wav --backends openai-whisper --int8
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.transcription import Transcription
+from components.transcription_backends import BACKENDS
+from components.media_ingest import load_audio
+
+
+def normalize_words(text):
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    """Levenshtein distance over words, divided by the reference length"""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (r != h))
+    return row[-1] / len(ref)
+
+
+def reference_transcript(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    candidate = os.path.join(Config.TRANSCRIPTS_DIR, f"{stem}_transcript.txt")
+    if os.path.exists(candidate):
+        with open(candidate, encoding='utf-8') as f:
+            return f.read()
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Recordings to transcribe")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--model", default=Config.WHISPER_MODEL_NAME)
+    parser.add_argument("--int8", action="store_true", help="Also run openai-whisper with int8 dynamic quantization")
+    parser.add_argument("--output", default=os.path.join(Config.REPORTS_DIR, "transcription_benchmark.md"))
+    args = parser.parse_args()
+    Config.TRANSCRIPT_CACHE_ENABLED = False
+
+    # (label, backend, int8)
+    variants = [(backend, backend, False) for backend in args.backends]
+    if args.int8 and "openai-whisper" in args.backends:
+        variants.append(("openai-whisper-int8", "openai-whisper", True))
+
+    audio = {path: load_audio(path) for path in args.files}
+    total_seconds = sum(a.duration for a in audio.values())
+
+    transcripts, timings, errors = {}, {}, {}
+    for label, backend, int8 in variants:
+        print(f"Loading {label} ({args.model})...")
+        Config.WHISPER_QUANTIZE_INT8 = int8
+        start = time.perf_counter()
+        try:
+            transcription = Transcription(model_name=args.model, backend=backend)
+        except Exception as e:
+            print(f"{label} unavailable: {e}")
+            # First line only, so the report table stays one row per backend
+            errors[label] = f"{type(e).__name__}: {(str(e).splitlines() or [''])[0]}"
+            continue
+        load_s = time.perf_counter() - start
+
+        transcripts[label], elapsed = {}, 0.0
+        for path, decoded in audio.items():
+            start = time.perf_counter()
+            transcripts[label][path] = transcription.transcribe_array(decoded.samples)
+            elapsed += time.perf_counter() - start
+        timings[label] = {'load_s': round(load_s, 2), 'rtf': round(elapsed / total_seconds, 3) if total_seconds else 0.0}
+
+    baseline = "openai-whisper" if "openai-whisper" in transcripts else None
+    results = []
+    for label, _, _ in variants:
+        if label in errors:
+            results.append({'backend': label, 'error': errors[label]})
+            continue
+        wers = []
+        for path in args.files:
+            reference = reference_transcript(path) or (transcripts[baseline][path] if baseline else None)
+            if reference is not None:
+                wers.append(word_error_rate(reference, transcripts[label][path]))
+        results.append({
+            'backend': label,
+            'wer': round(float(np.mean(wers)), 4) if wers else None,
+            **timings[label],
+        })
+
+    lines = [
+        "# Transcription backend benchmark",
+        "",
+        f"Model: `{args.model}`, recordings: {len(args.files)} ({total_seconds:.0f}s of audio)",
+        "",
+        "| Backend | WER | Real-time factor | Load (s) |",
+        "|---|---|---|---|",
+    ]
+    for r in results:
+        if 'error' in r:
+            lines.append(f"| {r['backend']} | unavailable: {r['error']} | | |")
+            continue
+        wer = f"{r['wer']:.2%}" if r['wer'] is not None else "n/a"
+        lines.append(f"| {r['backend']} | {wer} | {r['rtf']} | {r['load_s']} |")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    with open(os.path.splitext(args.output)[0] + ".json", 'w', encoding='utf-8') as f:
+        json.dump({'results': results, 'transcripts': transcripts}, f, indent=2)
+
+    print("\n".join(lines))
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Parity / timing check for the emotion feature extraction modes.
+
+Extracts the segment features of one or more recordings both ways -- per segment
+(`extract_features_fixed`) and in one whole-signal pass (`extract_features_windows`)
+-- and fails if any value differs by more than --atol.
+
+Usage:
+    python scripts/check_emotion_features.py recordings/interview1.wav [more files...]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.emotion_analyzer import EmotionAnalyzer
+from components.media_ingest import load_audio
+
+
+def check_file(analyzer, path, atol):
+    audio = load_audio(path)
+    y, sr = audio.samples, audio.sample_rate
+    segments = analyzer.segment_waveform(y, sr)
+    bounds = [(int(round(s['start']*sr)), int(round(s['end']*sr))) for s in segments]
+
+    start = time.perf_counter()
+    per_segment = np.stack([analyzer.extract_features_fixed(s['audio'], sr) for s in segments]) if segments else None
+    per_segment_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    whole_signal = analyzer.extract_features_windows(y, sr, bounds)
+    whole_signal_ms = (time.perf_counter() - start) * 1000
+
+    max_diff = float(np.abs(whole_signal - per_segment).max()) if segments else 0.0
+    ok = max_diff <= atol
+    print(f"{'OK  ' if ok else 'FAIL'} {path}: {len(segments)} segments, max |diff| {max_diff:.2e}, "
+          f"per-segment {per_segment_ms:.0f} ms, whole-signal {whole_signal_ms:.0f} ms")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Audio or video files to check")
+    parser.add_argument("--atol", type=float, default=1e-4, help="Maximum allowed absolute difference")
+    args = parser.parse_args()
+
+    analyzer = EmotionAnalyzer(
+        model_path=Config.EMOTION_MODEL_PATH,
+        scaler_path=Config.SCALER_PATH,
+        encoder_path=Config.ENCODER_PATH
+    )
+    results = [check_file(analyzer, path, args.atol) for path in args.files]
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
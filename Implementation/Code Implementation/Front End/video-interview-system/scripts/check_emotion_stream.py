@@ -0,0 +1,99 @@
+"""
+Parity check of the streaming emotion segmentation against the in-memory one.
+
+Cuts the model windows of each recording both ways -- `segment_waveform` over the
+whole decoded signal with its VAD regions, and `stream_windows` block by block
+for every --blocks size -- and fails if a block size gives a different number of
+windows or moves a window boundary.
+
+Without files, synthetic recordings are checked: answers with pauses (with and
+without leading silence) and near-continuous speech, where a per-block noise
+floor would miss speech.
+
+Usage:
+    python scripts/check_emotion_stream.py [recordings...] [--blocks 7 15 30 60] [--seconds 300]
+"""
+import os
+import sys
+import argparse
+import tempfile
+
+import numpy as np
+import soundfile as sf
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.emotion_analyzer import EmotionAnalyzer, SAMPLE_RATE
+from components.media_ingest import load_audio
+from components.vad import detect_speech
+
+
+def synth_answer(rng, seconds, lead_silence=True, max_gap=2.5):
+    """Noise at -70 dB with harmonic, 4 Hz modulated 'speech' bursts between pauses"""
+    sr = SAMPLE_RATE
+    y = rng.normal(0, 10 ** (-70 / 20), seconds * sr).astype(np.float32)
+    t = 1.0 if lead_silence else 0.0
+    while t < seconds - 1:
+        duration, gap = rng.uniform(0.5, 20), rng.uniform(0.15, max_gap)
+        n = int(min(duration, seconds - t) * sr)
+        tt = np.arange(n) / sr
+        f0 = rng.uniform(100, 250)
+        burst = sum(np.sin(2 * np.pi * f0 * k * tt) / k for k in range(1, 8)) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * tt))
+        level = 10 ** (rng.uniform(-40, -20) / 20)
+        y[int(t * sr):int(t * sr) + n] += (burst / np.abs(burst).max() * level).astype(np.float32)
+        t += duration + gap
+    return y
+
+
+def check_file(analyzer, path, blocks):
+    audio = load_audio(path)
+    y, sr = audio.samples, audio.sample_rate
+    regions = detect_speech(y, sr) if Config.VAD_ENABLED else None
+    reference = [(s['start'], s['end']) for s in analyzer.segment_waveform(y, sr, regions=regions)]
+
+    ok = True
+    for block_seconds in blocks:
+        streamed = [(s['start'] + offset / sr, s['end'] + offset / sr)
+                    for _, offset, segments in analyzer.stream_windows(path, block_seconds)
+                    for s in segments]
+        max_diff = max((max(abs(a[0] - b[0]), abs(a[1] - b[1])) for a, b in zip(reference, streamed)), default=0.0)
+        same = len(streamed) == len(reference) and max_diff < 1e-3
+        ok = ok and same
+        print(f"{'OK  ' if same else 'FAIL'} {os.path.basename(path)} ({audio.duration:.0f} s), "
+              f"{block_seconds} s blocks: {len(streamed)} windows vs {len(reference)} in memory, "
+              f"max boundary diff {max_diff * 1000:.0f} ms")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="Audio or video files (default: synthetic recordings)")
+    parser.add_argument("--blocks", type=float, nargs="+", default=[7, 15, 30, 60], help="Block sizes in seconds")
+    parser.add_argument("--seconds", type=int, default=300, help="Length of the synthetic recordings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    analyzer = EmotionAnalyzer(
+        model_path=Config.EMOTION_MODEL_PATH,
+        scaler_path=Config.SCALER_PATH,
+        encoder_path=Config.ENCODER_PATH
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = list(args.files)
+        if not files:
+            rng = np.random.default_rng(args.seed)
+            for name, lead_silence, max_gap in (("pauses", True, 2.5), ("no_lead_silence", False, 2.5),
+                                                ("continuous", False, 0.3)):
+                path = os.path.join(tmp, f"synthetic_{name}.wav")
+                sf.write(path, synth_answer(rng, args.seconds, lead_silence, max_gap), SAMPLE_RATE, subtype='PCM_16')
+                files.append(path)
+        results = [check_file(analyzer, path, args.blocks) for path in files]
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Parity check of the single-pass filler scanner against the former
+one-pattern-at-a-time `_clean_text` of the grammar checker (embedded below).
+
+Compares cleaned text and filler count on the saved transcripts and on
+--samples random utterances built from fillers, ordinary words, punctuation
+and hyphenated words. The scanner never treats part of a hyphenated word as a
+filler, so the reference applies the same rule (--no-hyphen-guard compares
+with the old patterns as they were, and reports the hyphen cases that differ).
+
+Usage:
+    python scripts/check_filler_scanner.py [transcripts...] [--samples 20000] [--seed 0]
+"""
+import os
+import re
+import sys
+import glob
+import random
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.filler_scanner import scan_fillers
+
+TRANSCRIPT_MARKER = "Transcript:"
+
+LEGACY_FILLERS = [
+    r'\buh+\b', r'\bum+\b', r'\bumm+\b', r'\buhhh+\b', r'\ber+\b',
+    r'\blike\b(?=\s+\w)', r'\byou know\b', r'\bwell\b(?=\s+\w)',
+    r'\bso\b(?=\s+\w)', r'\bactually\b(?=\s+\w)', r'\bbasically\b(?=\s+\w)',
+    r'\bhm+\b', r'\bhmm+\b', r'\bah+\b', r'\boh+\b'
+]
+
+WORDS = ["I", "think", "the", "project", "was", "good", "we", "it", "and", "you", "know", "like", "so",
+         "well", "actually", "basically", "uh", "um", "umm", "uhhh", "er", "hm", "hmm", "ah", "oh",
+         "Uh", "So", "Like", "Well", "uhh", "errr", "soo", "likely", "also", "knowing", "uh-huh",
+         "so-so", "well-known", "like-minded", "oh-so", "re-um", "A", "go"]
+SEPARATORS = [" ", " ", " ", " ", "  ", "\t", "\n", ", ", ". ", "? ", "! ", "-", " - ", "...", ".", "'"]
+
+
+def legacy_clean_text(text, hyphen_guard=True):
+    """The former GrammarChecker._clean_text (optionally with fillers kept out of hyphenated words)"""
+    # Remove extra whitespace
+    text = re.sub(r'\s+', ' ', text.strip())
+
+    filler_count = 0
+    for filler in LEGACY_FILLERS:
+        if hyphen_guard:
+            filler = filler.replace(r'\b', r'(?<![\w-])', 1).replace(r'\b', r'(?![\w-])', 1)
+        matches = re.findall(filler, text, flags=re.IGNORECASE)
+        filler_count += len(matches)
+        text = re.sub(filler, '', text, flags=re.IGNORECASE)
+
+    # Clean up punctuation spacing
+    text = re.sub(r'\s+([.!?])', r'\1', text)
+    text = re.sub(r'([.!?])([A-Z])', r'\1 \2', text)
+
+    return text.strip(), filler_count
+
+
+def read_transcript(path):
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    if TRANSCRIPT_MARKER in content:
+        content = content.split(TRANSCRIPT_MARKER, 1)[1]
+    return content.strip()
+
+
+def random_utterance(rng):
+    n = rng.randint(1, 12)
+    parts = []
+    for _ in range(n):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice(SEPARATORS))
+    return rng.choice(["", " "]) + "".join(parts[:-1 if rng.random() < 0.5 else None])
+
+
+def compare(text, hyphen_guard):
+    scan = scan_fillers(text)
+    return (scan.text, scan.count), legacy_clean_text(text, hyphen_guard)
+
+
+def main():
+    default_files = sorted(glob.glob(os.path.join(str(Config.TRANSCRIPTS_DIR), "*.txt")))
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=default_files, help="Transcript files (default: data/transcripts)")
+    parser.add_argument("--samples", type=int, default=20000, help="Random utterances to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-hyphen-guard", action="store_true", help="Compare with the old patterns unchanged")
+    args = parser.parse_args()
+
+    hyphen_guard = not args.no_hyphen_guard
+    rng = random.Random(args.seed)
+    texts = [(path, read_transcript(path)) for path in args.files]
+    texts += [(f"sample {i}", random_utterance(rng)) for i in range(args.samples)]
+
+    failures = 0
+    for name, text in texts:
+        new, old = compare(text, hyphen_guard)
+        if new != old:
+            failures += 1
+            if failures <= 20:
+                print(f"FAIL {name}: {text!r}\n     old {old!r}\n     new {new!r}")
+
+    print(f"{len(texts) - failures}/{len(texts)} identical "
+          f"({len(args.files)} transcripts, {args.samples} random utterances, "
+          f"hyphen guard {'on' if hyphen_guard else 'off'})")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Parity / timing check for sentence-sharded LanguageTool checking.
+
+Cleans each transcript like the grammar checker does, then checks it against
+the LanguageTool server pool once as a single call and once as concurrent
+sentence batches (`check_sharded`), and fails if the matches differ.
+
+The bundled transcripts are short, so by default they are sharded at
+--max-chars 200; --repeat concatenates a transcript with itself to time a
+long answer.
+
+Usage:
+    python scripts/check_grammar_sharding.py [transcripts...] [--max-chars 200] [--repeat 10]
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.filler_scanner import scan_fillers
+from components.language_tool_pool import LanguageToolPool
+from components.sentence_match_cache import check_sharded
+
+TRANSCRIPT_MARKER = "Transcript:"
+
+
+def read_transcript(path):
+    """Answer text of a saved transcript file (everything after 'Transcript:', or the whole file)"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    if TRANSCRIPT_MARKER in content:
+        content = content.split(TRANSCRIPT_MARKER, 1)[1]
+    return content.strip()
+
+
+def match_keys(matches):
+    return sorted((m.offset, m.errorLength, m.ruleId, tuple(m.replacements[:3])) for m in matches)
+
+
+def check_file(pool, path, max_chars, workers, repeat):
+    text = scan_fillers(" ".join([read_transcript(path)] * repeat)).text
+
+    start = time.perf_counter()
+    single = pool.check(text)
+    single_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    sharded = check_sharded(text, pool.check, max_chars, workers)
+    sharded_ms = (time.perf_counter() - start) * 1000
+
+    expected, found = match_keys(single), match_keys(sharded)
+    ok = expected == found
+    print(f"{'OK  ' if ok else 'FAIL'} {path}: {len(text)} chars, {len(expected)} matches, "
+          f"single {single_ms:.0f} ms, sharded {sharded_ms:.0f} ms")
+    if not ok:
+        for key in sorted(set(expected) - set(found)):
+            print(f"     only in single call: {key}")
+        for key in sorted(set(found) - set(expected)):
+            print(f"     only in sharded:     {key}")
+    return ok
+
+
+def main():
+    default_files = sorted(glob.glob(os.path.join(str(Config.TRANSCRIPTS_DIR), "*.txt")))
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", default=default_files, help="Transcript files (default: data/transcripts)")
+    parser.add_argument("--max-chars", type=int, default=200, help="Batch size in characters")
+    parser.add_argument("--workers", type=int, default=Config.GRAMMAR_SHARD_WORKERS or Config.LANGUAGE_TOOL_CONNECTIONS)
+    parser.add_argument("--repeat", type=int, default=1, help="Concatenate each transcript N times")
+    args = parser.parse_args()
+
+    if not args.files:
+        parser.error("no transcripts found")
+
+    pool = LanguageToolPool.from_config('en-US').start()
+    try:
+        results = [check_file(pool, path, args.max_chars, args.workers, args.repeat) for path in args.files]
+    finally:
+        pool.close()
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
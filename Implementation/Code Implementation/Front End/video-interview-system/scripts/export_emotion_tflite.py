@@ -0,0 +1,111 @@
+"""
+Export the Keras emotion model (models/best_model.keras) to TFLite for the
+`EMOTION_BACKEND = "tflite"` runtime.
+
+Quantization options:
+  * none    - float32 weights and activations
+  * float16 - float16 weights (about half the size), float32 compute
+  * int8    - full integer weights and activations, float32 input/output.
+              Calibrated on scaler.pkl-normalized features: from real audio
+              when --calibration is given, otherwise sampled from the scaler's
+              per-feature mean/std (the distribution the model was trained on).
+
+Usage:
+    python scripts/export_emotion_tflite.py --quantization int8 --calibration data/recordings
+"""
+import os
+import sys
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from components.emotion_analyzer import EmotionAnalyzer
+from components.media_ingest import load_audio
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.mp3', '.ogg', '.m4a', '.mp4')
+
+
+def calibration_features(analyzer, source, max_samples):
+    """Scaled feature rows from the audio files under `source`"""
+    rows = []
+    for root, _, files in os.walk(source):
+        for name in sorted(files):
+            if not name.lower().endswith(AUDIO_EXTENSIONS):
+                continue
+            audio = load_audio(os.path.join(root, name))
+            segments = analyzer.segment_waveform(audio.samples, audio.sample_rate)
+            if segments:
+                bounds = [(int(round(s['start']*audio.sample_rate)), int(round(s['end']*audio.sample_rate)))
+                          for s in segments]
+                rows.append(analyzer.extract_features_windows(audio.samples, audio.sample_rate, bounds))
+            if sum(len(r) for r in rows) >= max_samples:
+                break
+    if not rows:
+        return None
+    return analyzer.scaler.transform(np.concatenate(rows)[:max_samples]).astype(np.float32)
+
+
+def synthetic_features(scaler, n_samples, seed=0):
+    """Feature rows drawn from the scaler's per-feature statistics, then scaled"""
+    rng = np.random.default_rng(seed)
+    raw = rng.normal(scaler.mean_, scaler.scale_, size=(n_samples, len(scaler.mean_)))
+    return scaler.transform(raw).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quantization", choices=["none", "float16", "int8"], default="none")
+    parser.add_argument("--calibration", help="Directory of recordings used to calibrate int8 ranges")
+    parser.add_argument("--samples", type=int, default=300, help="Calibration rows for int8")
+    parser.add_argument("--output", default=str(Config.EMOTION_TFLITE_PATH))
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    analyzer = EmotionAnalyzer(
+        model_path=Config.EMOTION_MODEL_PATH,
+        scaler_path=Config.SCALER_PATH,
+        encoder_path=Config.ENCODER_PATH,
+        backend='keras'
+    )
+    converter = tf.lite.TFLiteConverter.from_keras_model(analyzer.model)
+
+    if args.quantization == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif args.quantization == "int8":
+        calibration = calibration_features(analyzer, args.calibration, args.samples) if args.calibration else None
+        if calibration is None:
+            print("No calibration audio given/found - sampling from the scaler statistics")
+            calibration = synthetic_features(analyzer.scaler, args.samples)
+        print(f"Calibrating int8 ranges on {len(calibration)} feature rows")
+
+        def representative_dataset():
+            for row in calibration:
+                yield [row.reshape(1, -1, 1)]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        # Keep a float32 interface so the runtime feeds the same scaled features
+        converter.inference_input_type = tf.float32
+        converter.inference_output_type = tf.float32
+
+    tflite_model = converter.convert()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'wb') as f:
+        f.write(tflite_model)
+
+    keras_mb = os.path.getsize(Config.EMOTION_MODEL_PATH) / 1e6 if os.path.exists(Config.EMOTION_MODEL_PATH) else 0
+    print(f"Wrote {args.output} ({len(tflite_model) / 1e6:.1f} MB, Keras model {keras_mb:.1f} MB, "
+          f"quantization: {args.quantization})")
+    print("Set EMOTION_BACKEND = \"tflite\" in config/settings.py to use it, and check parity with "
+          "scripts/benchmark_emotion_backend.py")
+
+
+if __name__ == "__main__":
+    main()
@@ -11277,6 +11277,12 @@ from components.audio_video_recorder import AudioVideoRecorder
 from components.emotion_analyzer import EmotionAnalyzer
 from components.transcription import Transcription
 from components.grammar_checker import HybridGrammarChecker
+from components.model_registry import registry as model_registry
+from components.media_ingest import decode_audio, iter_audio_blocks, load_audio, probe_duration
+from components.vad import detect_speech
+from components.live_emotion import LiveEmotionMeter
+from components.incremental_transcriber import IncrementalTranscriber
+from components.thread_budget import configure_blas
 
 # Only import CandidateEvaluator if evaluation files are available
 try:
@@ -11936,6 +11942,68 @@ def create_recording_section(question, question_type):
         show_recording_status()
 
 
+def start_live_emotion_meter():
+    """Start the live emotion meter on the recorder's audio ring (no-op when unavailable)"""
+    stop_live_emotion_meter()
+    if not Config.LIVE_EMOTION_ENABLED or not Config.verify_model_files():
+        return None
+    try:
+        # Single-window batches without augmentation keep each update cheap
+        analyzer = EmotionAnalyzer(
+            model_path=Config.EMOTION_MODEL_PATH,
+            scaler_path=Config.SCALER_PATH,
+            encoder_path=Config.ENCODER_PATH,
+            tta_policy='none',
+            batch_sizes=[1]
+        )
+    except Exception as e:
+        print(f"Live emotion meter unavailable: {e}")
+        return None
+    meter = LiveEmotionMeter(analyzer, st.session_state.recorder.audio_ring).start()
+    st.session_state.live_emotion_meter = meter
+    st.session_state.live_emotion_shown = None
+    return meter
+
+def stop_live_emotion_meter():
+    """Stop the live emotion meter, if one is running"""
+    meter = st.session_state.get('live_emotion_meter')
+    if meter is not None:
+        meter.stop()
+        st.session_state.live_emotion_meter = None
+
+def render_live_emotion(placeholder):
+    """Show the meter's latest distribution (only redrawn when it changed)"""
+    meter = st.session_state.get('live_emotion_meter')
+    if meter is None:
+        return
+    state = meter.latest()
+    if state['updated_at'] is None or state['updated_at'] == st.session_state.get('live_emotion_shown'):
+        return
+    st.session_state.live_emotion_shown = state['updated_at']
+
+    if not state['distribution']:
+        placeholder.caption("🎭 Live emotion: listening...")
+        return
+    bars = " &nbsp; ".join(
+        f"{emotion}: {prob:.0%}"
+        for emotion, prob in sorted(state['distribution'].items(), key=lambda item: item[1], reverse=True)[:4]
+    )
+    status = "" if state['speech'] else " (paused)"
+    placeholder.markdown(
+        f"🎭 **Live emotion: {state['dominant_emotion']}**{status} &nbsp;|&nbsp; {bars}",
+        unsafe_allow_html=True
+    )
+
+def create_live_transcriber():
+    """Background transcriber fed by the recorder while the candidate speaks (None when disabled)"""
+    if not Config.INCREMENTAL_TRANSCRIPTION:
+        return None
+    try:
+        return IncrementalTranscriber(Transcription(model_name=Config.WHISPER_MODEL_NAME)).start()
+    except Exception as e:
+        print(f"Incremental transcription unavailable: {e}")
+        return None
+
 def start_recording(video_placeholder, question, question_type):
     """Start recording with countdown and automatic stop after 2 minutes"""
     if not st.session_state.get('camera_active', False):
@@ -11955,7 +12023,9 @@ def start_recording(video_placeholder, question, question_type):
     
     # Start recording with 2-minute duration (120 seconds)
     max_duration = 120  # 2 minutes
-    output_path = st.session_state.recorder.start_recording(duration=max_duration, question_id=current_question_idx)
+    live_transcriber = create_live_transcriber()
+    output_path = st.session_state.recorder.start_recording(duration=max_duration, question_id=current_question_idx,
+                                                            live_transcriber=live_transcriber)
 
     if output_path:
         st.session_state.recording = True
@@ -11965,6 +12035,8 @@ def start_recording(video_placeholder, question, question_type):
         # Create placeholders for timer and progress
         timer_placeholder = st.empty()
         progress_placeholder = st.empty()
+        emotion_placeholder = st.empty()
+        start_live_emotion_meter()
         
         # Recording loop with counter and manual stop checking
         for elapsed_seconds in range(max_duration + 1):
@@ -12050,11 +12122,14 @@ def start_recording(video_placeholder, question, question_type):
             # Sleep for 1 second but check for manual stop more frequently
             for i in range(10):  # Check 10 times per second for responsiveness
                 time.sleep(0.1)
+                render_live_emotion(emotion_placeholder)
                 if not st.session_state.get('recording', False):
                     break
 
         # Ensure recording is stopped
         st.session_state.recording = False
+        stop_live_emotion_meter()
+        emotion_placeholder.empty()
         
         # Stop recording and get final file
         final_video = st.session_state.recorder.stop_recording()
@@ -12068,10 +12143,13 @@ def start_recording(video_placeholder, question, question_type):
         else:
             st.error("❌ Failed to process recording")
     else:
+        if live_transcriber is not None:
+            live_transcriber.close()
         st.error("❌ Failed to start recording")
 def stop_recording():
     """Manual Stop (invoked by the Stop Recording button)."""
     if st.session_state.get("recording", False):
+        stop_live_emotion_meter()
         final_path = st.session_state.recorder.stop_recording()
         st.session_state.recording = False
 
@@ -12110,9 +12188,14 @@ def analyze_current_recording(question, question_type):
 
     # Use the question-specific video file from recorder
     video_file = st.session_state.recorder.get_question_recording(current_question_idx)
+    # Native PCM track, when the recorder kept it (avoids decoding the AAC audio)
+    audio_file = st.session_state.recorder.get_question_audio(current_question_idx)
+    # Transcriber that ran while the answer was being recorded, if any (its result is collected when needed)
+    live_transcriber = st.session_state.recorder.get_question_transcriber(current_question_idx)
     
     # Perform analysis
-    analysis_results = perform_analysis(video_file, question, question_type)
+    analysis_results = perform_analysis(video_file, question, question_type, audio_file=audio_file,
+                                        live_transcriber=live_transcriber)
 
     if analysis_results:
         # Calculate aggregate score
@@ -12309,7 +12392,34 @@ def display_current_question():
 # Also update any other functions that reference 'video_file' in session_state
 # Replace all instances of st.session_state['video_file'] with the appropriate recorder method calls
 
-def perform_analysis(video_file, question, question_type):
+def warm_up_models():
+    """Load the analysis models in the background, once per process"""
+    def _warm():
+        model_files_available = Config.verify_model_files()
+        evaluation_files_available = Config.verify_evaluation_files()
+
+        loaders = [lambda: Transcription(model_name=Config.WHISPER_MODEL_NAME)]
+        if Config.GRAMMAR_BASIC_ENABLED:
+            loaders.append(HybridGrammarChecker)
+        if model_files_available:
+            loaders.append(lambda: EmotionAnalyzer(
+                model_path=Config.EMOTION_MODEL_PATH,
+                scaler_path=Config.SCALER_PATH,
+                encoder_path=Config.ENCODER_PATH
+            ))
+        if evaluation_files_available and CandidateEvaluator:
+            loaders.append(CandidateEvaluator)
+
+        for loader in loaders:
+            try:
+                # Constructing a component loads its models into the registry
+                loader()
+            except Exception as e:
+                print(f"Warning: model warm-up step failed: {e}")
+
+    return model_registry.warm_up_in_background(_warm)
+
+def perform_analysis(video_file, question, question_type, audio_file=None, live_transcriber=None):
     """Perform comprehensive analysis of the video"""
     
     # Initialize components based on available files
@@ -12322,8 +12432,13 @@ def perform_analysis(video_file, question, question_type):
     grammar_checker = None
 
     try:
-        # Always try to initialize transcription
-        transcription = Transcription(model_name=Config.WHISPER_MODEL_NAME)
+        # Initialize transcription (shared model, already loaded if the answer was transcribed while
+        # recording; it is the fallback when that live transcript is unavailable)
+        try:
+            transcription = Transcription(model_name=Config.WHISPER_MODEL_NAME)
+        except Exception:
+            if live_transcriber is None:
+                raise
         # Initialize grammar checker
         if Config.GRAMMAR_BASIC_ENABLED:
             grammar_checker = HybridGrammarChecker()
@@ -12356,18 +12471,31 @@ def perform_analysis(video_file, question, question_type):
         st.error(f"❌ Error initializing components: {str(e)}")
         return None
 
+    return run_analysis(video_file, question, question_type,
+                        transcription, grammar_checker, emotion_analyzer, evaluator,
+                        audio_file=audio_file, live_transcriber=live_transcriber)
+
+def run_analysis(video_file, question, question_type, transcription, grammar_checker, emotion_analyzer, evaluator,
+                 audio_file=None, live_transcriber=None):
+    """Run every analysis stage on the recording with already-initialized components"""
     with st.spinner("🔍 Performing comprehensive analysis... This may take a few minutes."):
         try:
             # Show video
             st.video(video_file)
 
-            # Check if video has audio
-            probe_cmd = ['ffprobe', '-v', 'quiet', '-show_streams', '-select_streams', 'a', video_file]
-            result = subprocess.run(probe_cmd, capture_output=True, text=True)
+            # Prefer the recorder's PCM track over decoding the lossy audio in the MP4
+            source = audio_file if audio_file and os.path.exists(audio_file) else video_file
+            # Long recordings are never decoded whole: every stage streams them from the file
+            streamed = probe_duration(source) >= Config.EMOTION_STREAM_MIN_SECONDS
+            if streamed:
+                audio = None
+            else:
+                # Load the audio once; every stage shares this buffer
+                audio = load_audio(source) if source == audio_file else decode_audio(source)
 
             analysis_results = {}
 
-            if not result.stdout.strip():
+            if audio is not None and not audio.has_audio:
                 st.warning("⚠️ Video has no audio track. Analysis will be limited.")
                 analysis_results['emotion_analysis'] = None
                 analysis_results['transcript'] = None
@@ -12375,11 +12503,22 @@ def perform_analysis(video_file, question, question_type):
                 analysis_results['grammar_analysis'] = None
 
             else:
+                # Speech regions are detected once and shared by emotion and transcription
+                speech_regions = None
+                if audio is not None and Config.VAD_ENABLED:
+                    speech_regions = detect_speech(audio.samples, audio.sample_rate)
+
                 # 1. Emotion Analysis
                 if emotion_analyzer:
                     st.subheader("🎭 Emotion Analysis Results")
                     with st.spinner("Analyzing emotions..."):
-                        emotions = emotion_analyzer.analyze(video_file)
+                        if streamed:
+                            # Long recording: features are computed block by block from the file,
+                            # so the spectrogram never spans the whole recording
+                            emotions = emotion_analyzer.analyze_stream(source)
+                        else:
+                            emotions = emotion_analyzer.analyze_audio(audio.samples, audio.sample_rate,
+                                                                      regions=speech_regions)
                         analysis_results['emotion_analysis'] = emotions
 
                     display_emotion_results(emotions)
@@ -12389,11 +12528,27 @@ def perform_analysis(video_file, question, question_type):
 
                 # 2. Transcription
                 transcript = None
-                if transcription:
+                live_transcript = None
+                if live_transcriber is not None:
+                    # Usually done already: the last chunk was transcribed while the other stages ran
+                    with st.spinner("Finishing live transcription..."):
+                        live_transcript = live_transcriber.result(timeout=Config.INCREMENTAL_FINAL_TIMEOUT)
+                if transcription or live_transcript is not None:
                     st.subheader("📝 Transcription")
-                    with st.spinner("Transcribing audio..."):
-                        transcript = transcription.transcribe_video(video_file)
-                        analysis_results['transcript'] = transcript
+                    if live_transcript is not None:
+                        # Already transcribed while recording
+                        transcript = live_transcript['text']
+                    elif streamed:
+                        # Long recording: transcribed block by block from the file, as while recording
+                        with st.spinner("Transcribing audio..."):
+                            file_transcriber = IncrementalTranscriber(transcription)
+                            result = file_transcriber.transcribe_blocks(
+                                iter_audio_blocks(source, file_transcriber.min_chunk))
+                            transcript = result['text'] if result else ""
+                    else:
+                        with st.spinner("Transcribing audio..."):
+                            transcript = transcription.transcribe_array(audio.samples, regions=speech_regions)
+                    analysis_results['transcript'] = transcript
 
                     st.text_area("Interview Transcript:", transcript, height=200, key="current_transcript")
                 else:
@@ -13127,6 +13282,13 @@ def main():
     # Create directories
     Config.create_directories()
 
+    # Share the cores between the co-located models (BLAS now, torch/TF when they load)
+    configure_blas()
+
+    # Start loading models before the first "Analyze" click
+    if Config.MODEL_WARMUP_ON_START:
+        warm_up_models()
+
     # Check file availability
     model_files_available = Config.verify_model_files()
     evaluation_files_available = Config.verify_evaluation_files()
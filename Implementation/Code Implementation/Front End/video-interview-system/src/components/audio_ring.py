@@ -0,0 +1,45 @@
+import threading
+import numpy as np
+
+
+class AudioRing:
+    """
+    Fixed-capacity ring of the most recent mono float32 samples.
+
+    The recorder's audio callback writes into it (a bounded memcpy, no
+    allocation) and live consumers read the latest samples from other threads.
+    `total_written` counts every sample ever written, so readers can tell
+    whether new audio arrived since their last read.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.float32)
+        self._pos = 0
+        self.total_written = 0
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._pos = 0
+            self.total_written = 0
+
+    def write(self, samples: np.ndarray):
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if samples.size > self.capacity:
+            samples = samples[-self.capacity:]
+        with self._lock:
+            first = min(samples.size, self.capacity - self._pos)
+            self._buffer[self._pos:self._pos + first] = samples[:first]
+            self._buffer[:samples.size - first] = samples[first:]
+            self._pos = (self._pos + samples.size) % self.capacity
+            self.total_written += samples.size
+
+    def latest(self, n: int) -> np.ndarray:
+        """Copy of the last `n` samples (fewer if less audio has been written)"""
+        with self._lock:
+            n = min(n, self.capacity, self.total_written)
+            start = (self._pos - n) % self.capacity
+            if start + n <= self.capacity:
+                return self._buffer[start:start + n].copy()
+            return np.concatenate((self._buffer[start:], self._buffer[:self._pos]))
@@ -221,14 +221,29 @@
 import cv2
 import streamlit as st
 import os
+import glob
 import threading
 import time
+import subprocess
 import numpy as np
 import sounddevice as sd
 import wave
 from datetime import datetime
 from moviepy.editor import VideoFileClip, AudioFileClip
 
+# Import config
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.audio_ring import AudioRing
+
+# Where recordings are written
+RECORDINGS_DIR = str(Config.RECORDINGS_DIR)
+# The PCM tracks kept next to the MP4s (see start_recording); the only files retention deletes
+PCM_TRACK_PATTERN = "interview*_*.wav"
+# Capture codecs whose stream browsers can play as-is (the final MP4 is then a stream copy)
+H264_FOURCCS = {'avc1', 'h264', 'H264', 'X264', 'x264'}
+
 class AudioVideoRecorder:
     def __init__(self):
         self.recording = False
@@ -243,6 +258,12 @@ class AudioVideoRecorder:
         # Question-specific tracking
         self.current_question_id = None
         self.question_recordings = {}  # Store recordings per question
+        # Most recent audio, readable while recording (live emotion meter)
+        self.audio_ring = AudioRing(int(Config.LIVE_AUDIO_RING_SECONDS * self.sample_rate))
+        # Optional IncrementalTranscriber fed while recording
+        self.live_transcriber = None
+        # FourCC the capture writer opened with
+        self.video_codec = None
         
     def start_preview(self):
         """Start camera preview without recording"""
@@ -281,22 +302,27 @@ class AudioVideoRecorder:
             self.cap.release()
             self.cap = None
     
-    def start_recording(self, duration=60, question_id=None):
-        """Start recording video and audio for a specific question"""
+    def start_recording(self, duration=60, question_id=None, live_transcriber=None):
+        """
+        Start recording video and audio for a specific question.
+        A `live_transcriber` (IncrementalTranscriber) receives the audio as it is captured.
+        """
         try:
             # Set current question ID
             self.current_question_id = question_id or 0
             
             # Generate question-specific output paths
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            os.makedirs("data/recordings", exist_ok=True)
+            os.makedirs(RECORDINGS_DIR, exist_ok=True)
             
             # Include question ID in filename
             question_suffix = f"_q{self.current_question_id}" if self.current_question_id is not None else ""
             
-            self.video_path = f"data/recordings/temp_video{question_suffix}_{timestamp}.mp4"
-            self.audio_path = f"data/recordings/temp_audio{question_suffix}_{timestamp}.wav"
-            self.output_path = f"data/recordings/interview{question_suffix}_{timestamp}.mp4"
+            self.video_path = f"{RECORDINGS_DIR}/temp_video{question_suffix}_{timestamp}.mp4"
+            self.audio_path = f"{RECORDINGS_DIR}/temp_audio{question_suffix}_{timestamp}.wav"
+            self.output_path = f"{RECORDINGS_DIR}/interview{question_suffix}_{timestamp}.mp4"
+            # Native 16 kHz PCM track kept next to the MP4 for analysis
+            self.pcm_path = f"{RECORDINGS_DIR}/interview{question_suffix}_{timestamp}.wav"
             
             # Initialize camera if not already done
             if self.cap is None:
@@ -308,6 +334,8 @@ class AudioVideoRecorder:
             
             # Reset recording data
             self.audio_frames = []
+            self.audio_ring.clear()
+            self.live_transcriber = live_transcriber
             self.recording = True
             
             # Start video recording thread
@@ -326,11 +354,24 @@ class AudioVideoRecorder:
             st.error(f"❌ Error starting recording: {e}")
             return None
     
+    def _open_video_writer(self, fps=20.0, size=(640, 480)):
+        """
+        Open the capture writer, preferring H.264 so the final file only needs a
+        stream copy (browser-playable without a re-encode). Falls back to MPEG-4,
+        which _combine_av re-encodes (pip OpenCV builds have no H.264 encoder).
+        """
+        for codec in Config.RECORDING_VIDEO_CODECS:
+            out = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*codec), fps, size)
+            if out.isOpened():
+                self.video_codec = codec
+                return out
+            out.release()
+        raise RuntimeError(f"No usable video codec among {Config.RECORDING_VIDEO_CODECS}")
+    
     def _record_video(self, duration):
         """Record video frames"""
         try:
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(self.video_path, fourcc, 20.0, (640, 480))
+            out = self._open_video_writer(20.0, (640, 480))
             
             start_time = time.time()
             frame_count = 0
@@ -354,6 +395,9 @@ class AudioVideoRecorder:
             def audio_callback(indata, frames, time, status):
                 if self.recording:
                     self.audio_frames.append(indata.copy())
+                    self.audio_ring.write(indata[:, 0])
+                    if self.live_transcriber is not None:
+                        self.live_transcriber.feed(indata[:, 0])
             
             with sd.InputStream(samplerate=self.sample_rate, 
                               channels=1, 
@@ -387,18 +431,35 @@ class AudioVideoRecorder:
         if self.audio_thread and self.audio_thread.is_alive():
             self.audio_thread.join(timeout=5)
         
+        # The last chunk is transcribed in the background; its result is collected at analysis time
+        live_transcriber, self.live_transcriber = self.live_transcriber, None
+        if live_transcriber is not None:
+            live_transcriber.finish()
+        transcriber_stored = False
+        
         # Combine audio and video
         try:
             if os.path.exists(self.video_path) and os.path.exists(self.audio_path):
                 self._combine_av()
                 
+                # Keep the lossless PCM track instead of deleting it
+                audio_path = None
+                if Config.KEEP_PCM_AUDIO:
+                    os.replace(self.audio_path, self.pcm_path)
+                    audio_path = self.pcm_path
+                
                 # Store the recording for this question
                 if self.current_question_id is not None and os.path.exists(self.output_path):
+                    # Replace (and clean up) any earlier take of this question
+                    self._remove_recording_files(self.question_recordings.get(self.current_question_id), keep=self.output_path)
                     self.question_recordings[self.current_question_id] = {
                         'file_path': self.output_path,
+                        'audio_path': audio_path,
                         'timestamp': datetime.now(),
-                        'duration': self._get_video_duration(self.output_path)
+                        'duration': self._get_video_duration(self.output_path),
+                        'live_transcriber': live_transcriber
                     }
+                    transcriber_stored = True
                 
                 # Clean up temp files
                 if os.path.exists(self.video_path):
@@ -406,6 +467,8 @@ class AudioVideoRecorder:
                 if os.path.exists(self.audio_path):
                     os.remove(self.audio_path)
                 
+                self.apply_audio_retention()
+                
                 return self.output_path if os.path.exists(self.output_path) else None
             else:
                 print("Missing video or audio file")
@@ -414,49 +477,156 @@ class AudioVideoRecorder:
         except Exception as e:
             print(f"Error combining files: {e}")
             return None
+        finally:
+            if live_transcriber is not None and not transcriber_stored:
+                live_transcriber.close()
     
     def _combine_av(self):
-        """Combine video and audio using moviepy"""
+        """
+        Mux the captured video and audio with ffmpeg. H.264 captures are stream
+        copied; anything else (MPEG-4 Part 2, which browsers cannot play) is
+        re-encoded to H.264 with the fastest x264 preset.
+        """
         try:
             print(f"Combining audio and video for question {self.current_question_id}...")
+            start = time.time()
             
-            video_clip = VideoFileClip(self.video_path)
-            audio_clip = AudioFileClip(self.audio_path)
-            
-            # Make sure audio and video have same duration
-            min_duration = min(video_clip.duration, audio_clip.duration)
-            video_clip = video_clip.subclip(0, min_duration)
-            audio_clip = audio_clip.subclip(0, min_duration)
-            
-            # Combine
-            final_clip = video_clip.set_audio(audio_clip)
-            final_clip.write_videofile(self.output_path, 
-                                     codec='libx264', 
-                                     audio_codec='aac',
-                                     verbose=False,
-                                     logger=None)
-            
-            # Clean up
-            video_clip.close()
-            audio_clip.close()
-            final_clip.close()
-            
-            print(f"Combined video saved to: {self.output_path}")
+            # Align durations using container/header metadata only
+            min_duration = min(self._get_video_duration(self.video_path),
+                               self._get_wav_duration(self.audio_path))
             
+            if self.video_codec in H264_FOURCCS:
+                video_args = ['-c:v', 'copy']  # video stream is copied as-is
+            else:
+                video_args = ['-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p']
+            cmd = [
+                'ffmpeg', '-y', '-nostdin', '-v', 'error',
+                '-i', self.video_path,
+                '-i', self.audio_path,
+                '-map', '0:v:0', '-map', '1:a:0',
+                *video_args,
+                '-c:a', 'aac', '-b:a', '128k',
+                '-movflags', '+faststart',
+            ]
+            if min_duration > 0:
+                cmd += ['-t', f"{min_duration:.3f}"]
+            cmd.append(self.output_path)
+            
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"FFmpeg mux failed, re-encoding with moviepy: {result.stderr}")
+                self._combine_av_reencode()
+            
+            print(f"Combined video saved to: {self.output_path} ({time.time() - start:.2f}s)")
+            
+        except FileNotFoundError:
+            print("FFmpeg not found, re-encoding with moviepy")
+            self._combine_av_reencode()
         except Exception as e:
             print(f"Error combining audio/video: {e}")
             raise
     
+    def _combine_av_reencode(self):
+        """Fallback: combine video and audio using moviepy (decodes and re-encodes)"""
+        video_clip = VideoFileClip(self.video_path)
+        audio_clip = AudioFileClip(self.audio_path)
+        
+        # Make sure audio and video have same duration
+        min_duration = min(video_clip.duration, audio_clip.duration)
+        video_clip = video_clip.subclip(0, min_duration)
+        audio_clip = audio_clip.subclip(0, min_duration)
+        
+        # Combine
+        final_clip = video_clip.set_audio(audio_clip)
+        final_clip.write_videofile(self.output_path, 
+                                 codec='libx264', 
+                                 audio_codec='aac',
+                                 verbose=False,
+                                 logger=None)
+        
+        # Clean up
+        video_clip.close()
+        audio_clip.close()
+        final_clip.close()
+    
     def _get_video_duration(self, video_path):
-        """Get video duration in seconds"""
+        """Get video duration in seconds from container metadata (no decoding)"""
         try:
-            clip = VideoFileClip(video_path)
-            duration = clip.duration
-            clip.close()
-            return duration
+            cap = cv2.VideoCapture(video_path)
+            frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            cap.release()
+            return frame_count / fps if fps > 0 else 0
         except:
             return 0
     
+    def _get_wav_duration(self, audio_path):
+        """Get WAV duration in seconds from its header"""
+        try:
+            with wave.open(audio_path, 'rb') as wf:
+                return wf.getnframes() / wf.getframerate()
+        except:
+            return 0
+    
+    def get_question_audio(self, question_id):
+        """Get the native 16 kHz PCM WAV for a specific question, if it was kept"""
+        recording_info = self.question_recordings.get(question_id)
+        if recording_info and recording_info.get('audio_path') and os.path.exists(recording_info['audio_path']):
+            return recording_info['audio_path']
+        return None
+    
+    def get_question_transcriber(self, question_id):
+        """IncrementalTranscriber that transcribed the question while it was recorded, if any"""
+        recording_info = self.question_recordings.get(question_id)
+        return recording_info.get('live_transcriber') if recording_info else None
+    
+    def apply_audio_retention(self):
+        """
+        Apply the PCM retention policy to this recorder's PCM tracks (PCM_TRACK_PATTERN
+        in RECORDINGS_DIR, from this session or earlier ones): delete tracks older than
+        Config.PCM_AUDIO_MAX_AGE_HOURS, then all but the newest Config.PCM_AUDIO_MAX_FILES.
+        Other WAVs in the directory are left alone.
+        """
+        max_age_hours = Config.PCM_AUDIO_MAX_AGE_HOURS
+        max_files = Config.PCM_AUDIO_MAX_FILES
+        if not max_age_hours and not max_files:
+            return
+        
+        wavs = []
+        for path in glob.glob(os.path.join(RECORDINGS_DIR, PCM_TRACK_PATTERN)):
+            try:
+                wavs.append((os.path.getmtime(path), path))
+            except OSError:
+                pass  # deleted meanwhile
+        wavs.sort(reverse=True)  # newest first
+        
+        cutoff = datetime.now().timestamp() - max_age_hours * 3600 if max_age_hours else None
+        expired = [path for i, (mtime, path) in enumerate(wavs)
+                   if (cutoff is not None and mtime < cutoff) or (max_files and i >= max_files)]
+        for path in expired:
+            try:
+                os.remove(path)
+                print(f"Retention: deleted PCM track {path}")
+            except Exception as e:
+                print(f"Error deleting file {path}: {e}")
+        
+        for recording_info in self.question_recordings.values():
+            audio_path = recording_info.get('audio_path')
+            if audio_path and not os.path.exists(audio_path):
+                recording_info['audio_path'] = None
+    
+    def _remove_recording_files(self, recording_info, keep=None):
+        """Delete the MP4 and PCM files of a recording entry"""
+        if not recording_info:
+            return
+        for path in (recording_info.get('file_path'), recording_info.get('audio_path')):
+            if path and path != keep and os.path.exists(path):
+                try:
+                    os.remove(path)
+                    print(f"Deleted recording file: {path}")
+                except Exception as e:
+                    print(f"Error deleting file {path}: {e}")
+    
     def get_question_recording(self, question_id):
         """Get recording file path for a specific question"""
         if question_id in self.question_recordings:
@@ -482,15 +652,10 @@ class AudioVideoRecorder:
         """Delete recording for a specific question"""
         if question_id in self.question_recordings:
             recording_info = self.question_recordings[question_id]
-            file_path = recording_info['file_path']
             
-            # Delete the file
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    print(f"Deleted recording for question {question_id}: {file_path}")
-                except Exception as e:
-                    print(f"Error deleting file {file_path}: {e}")
+            # Delete the video and its PCM track
+            self._remove_recording_files(recording_info)
+            print(f"Deleted recording for question {question_id}")
             
             # Remove from tracking
             del self.question_recordings[question_id]
@@ -509,6 +674,7 @@ class AudioVideoRecorder:
             return {
                 'recorded': True,
                 'file_path': recording_info['file_path'],
+                'audio_path': self.get_question_audio(question_id),
                 'timestamp': recording_info['timestamp'],
                 'duration': recording_info.get('duration', 0),
                 'file_size': os.path.getsize(recording_info['file_path']) if os.path.exists(recording_info['file_path']) else 0
@@ -517,6 +683,7 @@ class AudioVideoRecorder:
             return {
                 'recorded': False,
                 'file_path': None,
+                'audio_path': None,
                 'timestamp': None,
                 'duration': 0,
                 'file_size': 0
@@ -545,4 +712,8 @@ class AudioVideoRecorder:
         if self.video_thread and self.video_thread.is_alive():
             self.video_thread.join(timeout=2)
         if self.audio_thread and self.audio_thread.is_alive():
-            self.audio_thread.join(timeout=2)
\ No newline at end of file
+            self.audio_thread.join(timeout=2)
+        
+        if self.live_transcriber is not None:
+            self.live_transcriber.close()
+            self.live_transcriber = None
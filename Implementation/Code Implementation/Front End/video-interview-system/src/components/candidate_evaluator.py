@@ -7,13 +7,20 @@ from dotenv import load_dotenv
 from langchain.chat_models import AzureChatOpenAI
 from langchain import PromptTemplate, LLMChain
 from langchain_openai import AzureOpenAIEmbeddings
-from langchain.vectorstores import FAISS
 from langchain.chains import RetrievalQA
 
 # Import config
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from config.settings import Config
+from components.model_registry import registry
+from components.faiss_index_store import load_or_build_faiss
+from components.embedding_cache import EmbeddingCache, CachedEmbeddings
+
+EVALUATOR_LLM_KEY = "evaluator_llm"
+EVALUATOR_EMBEDDINGS_KEY = "evaluator_embeddings"
+TECH_FAISS_KEY = "faiss:technical"
+HR_FAISS_KEY = "faiss:hr"
 
 # ─── 1. Helper: Robust JSON Extraction ─────────────────────────────────────────────
 def extract_json(text: str):
@@ -46,11 +53,11 @@ class CandidateEvaluator:
         os.environ["AZURE_OPENAI_ENDPOINT"] = os.getenv("AZURE_OPENAI_ENDPOINT")
         os.environ["OPENAI_API_TYPE"] = "Azure"
         
-        # Initialize LLM
-        self.llm = AzureChatOpenAI(
+        # Initialize LLM (shared client)
+        self.llm = registry.get(EVALUATOR_LLM_KEY, lambda: AzureChatOpenAI(
             openai_api_version="2023-12-01-preview",
             azure_deployment="GPT-4O-50-1",
-        )
+        ))
         
         # Load rubrics and old scores
         self._load_rubrics_and_scores()
@@ -109,17 +116,25 @@ class CandidateEvaluator:
         tech_questions = self.df_tech["question"].astype(str).tolist()
         hr_questions = self.df_hr["question"].astype(str).tolist()
         
-        # Initialize embeddings
-        self.embeddings = AzureOpenAIEmbeddings(
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            openai_api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        )
+        # Initialize embeddings behind the local embedding cache
+        self.embeddings = registry.get(EVALUATOR_EMBEDDINGS_KEY, lambda: CachedEmbeddings(
+            AzureOpenAIEmbeddings(
+                azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+                openai_api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+            ),
+            EmbeddingCache(Config.EMBEDDING_CACHE_DIR, max_entries=Config.EMBEDDING_CACHE_MAX_ENTRIES)
+        ))
         
-        # Build FAISS indexes
-        self.tech_vectorstore = FAISS.from_texts(tech_questions, self.embeddings)
+        # Load persisted FAISS indexes (once per process), re-embedding only changed rows
+        model_name = self.embeddings.model_name
+        self.tech_vectorstore = registry.get(TECH_FAISS_KEY, lambda: load_or_build_faiss(
+            tech_questions, self.embeddings, Config.TECH_FAISS_INDEX_DIR, model_name
+        ))
         self.tech_retriever = self.tech_vectorstore.as_retriever(search_kwargs={"k": 3})
         
-        self.hr_vectorstore = FAISS.from_texts(hr_questions, self.embeddings)
+        self.hr_vectorstore = registry.get(HR_FAISS_KEY, lambda: load_or_build_faiss(
+            hr_questions, self.embeddings, Config.HR_FAISS_INDEX_DIR, model_name
+        ))
         self.hr_retriever = self.hr_vectorstore.as_retriever(search_kwargs={"k": 3})
     
     def _setup_evaluation_chains(self):
@@ -0,0 +1,173 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+VECTORS_FILENAME = "vectors.f32"
+INDEX_FILENAME = "index.sqlite"
+GROW_ROWS = 1024  # vectors file grows in blocks of this many rows
+
+
+def embedding_model_name(embeddings) -> str:
+    """Identify an embeddings client by deployment/model, used to key caches and indexes"""
+    deployment = getattr(embeddings, "deployment", None)
+    model = getattr(embeddings, "model", None)
+    return f"{deployment or ''}/{model or ''}"
+
+
+def normalize_text(text: str) -> str:
+    """Normalization applied before hashing, so trivial whitespace changes still hit"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    Local, size-bounded embedding store keyed by (model, normalized text hash).
+
+    Vectors live in a single float32 array file (row `slot` = one vector) and an
+    SQLite table maps each key to its slot and last-use time. When `max_entries`
+    is reached, the least recently used slot is overwritten.
+    """
+
+    def __init__(self, cache_dir, max_entries: int = 20000):
+        self.cache_dir = str(cache_dir)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._vectors_path = os.path.join(self.cache_dir, VECTORS_FILENAME)
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, INDEX_FILENAME), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, slot INTEGER UNIQUE NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)")
+        self._db.commit()
+
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        self.dim: Optional[int] = int(row[0]) if row else None
+        self._vectors = None
+        if self.dim is not None and os.path.exists(self._vectors_path):
+            self._open_vectors()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        payload = f"{model}\0{normalize_text(text)}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _open_vectors(self, min_rows: int = 0):
+        """(Re)map the vectors file, growing it to hold at least `min_rows` rows"""
+        row_bytes = self.dim * 4
+        size = os.path.getsize(self._vectors_path) if os.path.exists(self._vectors_path) else 0
+        rows = size // row_bytes
+        if rows < min_rows:
+            rows = min(((min_rows // GROW_ROWS) + 1) * GROW_ROWS, max(self.max_entries, min_rows))
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(rows * row_bytes)
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(rows, self.dim)) if rows else None
+
+    def get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Look up vectors for `keys`; misses are returned as None"""
+        if self.dim is None or self._vectors is None or not keys:
+            return [None] * len(keys)
+
+        with self._lock:
+            found = {}
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                found.update(self._db.execute(
+                    f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchall())
+            if found:
+                now = time.time()
+                self._db.executemany("UPDATE entries SET last_used = ? WHERE key = ?",
+                                     [(now, k) for k in found])
+                self._db.commit()
+            return [np.array(self._vectors[found[k]]) if k in found else None for k in keys]
+
+    def put_many(self, keys: List[str], vectors: List[List[float]]):
+        """Store vectors, evicting least recently used entries when the cache is full"""
+        if not keys:
+            return
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = len(vectors[0])
+                self._db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('dim', ?)", (str(self.dim),))
+
+            count = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            now = time.time()
+            for key, vector in zip(keys, vectors):
+                existing = self._db.execute("SELECT slot FROM entries WHERE key = ?", (key,)).fetchone()
+                if existing:
+                    slot = existing[0]
+                elif count < self.max_entries:
+                    slot = count
+                    count += 1
+                else:
+                    slot, = self._db.execute(
+                        "SELECT slot FROM entries ORDER BY last_used ASC LIMIT 1"
+                    ).fetchone()
+                    self._db.execute("DELETE FROM entries WHERE slot = ?", (slot,))
+
+                if self._vectors is None or slot >= self._vectors.shape[0]:
+                    self._open_vectors(min_rows=slot + 1)
+                self._vectors[slot] = np.asarray(vector, dtype=np.float32)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (key, slot, last_used) VALUES (?, ?, ?)",
+                    (key, slot, now)
+                )
+
+            self._vectors.flush()
+            self._db.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Drop-in LangChain `Embeddings` wrapper that serves repeated texts from an
+    `EmbeddingCache` and only sends cache misses to the wrapped client.
+    """
+
+    def __init__(self, base: Embeddings, cache: EmbeddingCache, model_name: Optional[str] = None):
+        self.base = base
+        self.cache = cache
+        self.model_name = model_name or embedding_model_name(base)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [EmbeddingCache.make_key(self.model_name, t) for t in texts]
+        cached = self.cache.get_many(keys)
+
+        # Embed each distinct missing text once
+        missing = {}
+        for key, text, vector in zip(keys, texts, cached):
+            if vector is None and key not in missing:
+                missing[key] = text
+        if missing:
+            fresh = self.base.embed_documents(list(missing.values()))
+            self.cache.put_many(list(missing.keys()), fresh)
+            fresh_by_key = dict(zip(missing.keys(), fresh))
+        else:
+            fresh_by_key = {}
+
+        return [
+            vector.tolist() if vector is not None else list(fresh_by_key[key])
+            for key, vector in zip(keys, cached)
+        ]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = EmbeddingCache.make_key(self.model_name, text)
+        vector = self.cache.get_many([key])[0]
+        if vector is not None:
+            return vector.tolist()
+        vector = self.base.embed_query(text)
+        self.cache.put_many([key], [vector])
+        return list(vector)
@@ -4,24 +4,145 @@ import pickle
 import numpy as np
 import librosa
 from sklearn.preprocessing import StandardScaler
-from tensorflow.keras.models import load_model
 from collections import Counter
+from functools import lru_cache
+
+# Import config
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.model_registry import registry
+from components.media_ingest import decode_audio, iter_audio_blocks, probe_duration, SAMPLE_RATE
+from components.tflite_runner import TFLiteRunner
+from components.thread_budget import configure_tensorflow, stage_threads
+from components.vad import FRAME_HOP, detect_speech, noise_floor_of_blocks
+
+# Test-time augmentation policies: which feature sets are computed per segment
+TTA_POLICIES = {
+    'none': ('original',),
+    'cheap': ('original', 'noise', 'shift'),
+    'full': ('original', 'noise', 'stretch', 'shift', 'pitch'),
+}
+
+FEATURE_MODES = ('whole_signal', 'per_segment')
+# "keras" imports TensorFlow; "tflite" runs the exported model (scripts/export_emotion_tflite.py) without it
+BACKENDS = ('keras', 'tflite')
+N_FFT = 2048      # librosa's default STFT size and hop, which the model was trained with
+HOP_LENGTH = 512
+EDGE_FRAMES = N_FFT // (2 * HOP_LENGTH)  # frames at each segment end that reach past it
+TOP_DB = 80.0     # librosa.power_to_db default dynamic range
+
+
+@lru_cache(maxsize=4)
+def mel_basis(sr: int) -> np.ndarray:
+    """Mel filterbank used by librosa.feature.mfcc, built once per sample rate"""
+    return librosa.filters.mel(sr=sr, n_fft=N_FFT)
+
+
+def merge_runs(bounds: np.ndarray, indices=None) -> list:
+    """Group (start, end) segments into runs of overlapping/touching ones; returns index arrays"""
+    if indices is None:
+        indices = np.arange(len(bounds))
+    indices = np.asarray(indices)[np.argsort(bounds[indices, 0], kind='stable')]
+    runs, run_end = [], -1
+    for i in indices:
+        if runs and bounds[i, 0] <= run_end:
+            runs[-1].append(i)
+            run_end = max(run_end, bounds[i, 1])
+        else:
+            runs.append([i])
+            run_end = bounds[i, 1]
+    return [np.array(run) for run in runs]
+
+
+def mel_db(y: np.ndarray, sr: int, center: bool = True) -> np.ndarray:
+    """Unclipped log-mel power spectrogram, as inside librosa.feature.mfcc (leading batch axes allowed)"""
+    S = np.abs(librosa.stft(y, n_fft=N_FFT, hop_length=HOP_LENGTH, center=center))**2
+    return librosa.power_to_db(np.einsum("...ft,mf->...mt", S, mel_basis(sr), optimize=True), top_db=None)
+
 
 class EmotionAnalyzer:
-    def __init__(self, model_path, scaler_path, encoder_path):
+    def __init__(self, model_path, scaler_path, encoder_path, tta_policy=None, feature_mode=None, backend=None,
+                 batch_sizes=None):
+        self.tta_policy = tta_policy or Config.EMOTION_TTA_POLICY
+        if self.tta_policy not in TTA_POLICIES:
+            raise ValueError(f"Unknown TTA policy '{self.tta_policy}'. Choose from: {', '.join(TTA_POLICIES)}")
+        self.feature_mode = feature_mode or Config.EMOTION_FEATURE_MODE
+        if self.feature_mode not in FEATURE_MODES:
+            raise ValueError(f"Unknown feature mode '{self.feature_mode}'. Choose from: {', '.join(FEATURE_MODES)}")
+        self.backend = backend or Config.EMOTION_BACKEND
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown emotion backend '{self.backend}'. Choose from: {', '.join(BACKENDS)}")
         self.model_path = model_path
         self.scaler_path = scaler_path
         self.encoder_path = encoder_path
-        self.model = self.load_model()
-        self.scaler = self.load_scaler()
-        self.encoder = self.load_encoder()
+        self.tflite_path = Config.EMOTION_TFLITE_PATH
         self.n_mfcc = 40
         self.max_frames = 100
+        self.batch_sizes = sorted(set(batch_sizes or Config.EMOTION_BATCH_SIZES))
+        self.max_batch = self.batch_sizes[-1]
+        batch_key = ",".join(map(str, self.batch_sizes))
+        # Shared, process-wide instances (loaded once, reused across analyses)
+        self.scaler = registry.get(f"emotion_scaler:{scaler_path}", self.load_scaler)
+        self.encoder = registry.get(f"emotion_encoder:{encoder_path}", self.load_encoder)
+        if self.backend == 'tflite':
+            # The Keras model is never loaded, so TensorFlow is never imported
+            self.model = None
+            self._infer = registry.get(f"emotion_tflite:{self.tflite_path}:{batch_key}", self.load_tflite)
+        else:
+            self.model = registry.get(f"emotion_model:{model_path}", self.load_model)
+            # Compiled once per process and batch size in `batch_sizes`
+            self._infer = registry.get(f"emotion_infer:{model_path}:{batch_key}", self._compile_inference)
 
     def load_model(self):
         """Load the pre-trained emotion classification model"""
+        configure_tensorflow()
+        from tensorflow.keras.models import load_model
         return load_model(self.model_path)
 
+    def load_tflite(self):
+        """Load the exported TFLite model for the batch sizes in `batch_sizes`"""
+        if not os.path.exists(self.tflite_path):
+            raise FileNotFoundError(
+                f"TFLite model not found: {self.tflite_path}. Run scripts/export_emotion_tflite.py first."
+            )
+        return TFLiteRunner(self.tflite_path, self.batch_sizes,
+                            num_threads=Config.EMOTION_TFLITE_THREADS or stage_threads('emotion'))
+
+    def _compile_inference(self):
+        """Build a compiled forward pass with one concrete function per batch size (traced once each)"""
+        import tensorflow as tf
+        n_features = (self.n_mfcc + 2) * self.max_frames
+        model = self.model
+        
+        @tf.function
+        def infer(x):
+            return model(x, training=False)
+        
+        concrete = {size: infer.get_concrete_function(tf.TensorSpec([size, n_features, 1], tf.float32))
+                    for size in self.batch_sizes}
+        return lambda batch: concrete[len(batch)](tf.constant(batch)).numpy()
+
+    def predict_batched(self, X: np.ndarray) -> np.ndarray:
+        """
+        Run the model over all rows of X in as few forward passes as possible.
+        Rows go in chunks of `max_batch`; each chunk is zero-padded to the smallest
+        size in `batch_sizes` that fits, so only a few static shapes are ever run.
+        Padded rows are dropped from the output.
+        """
+        n = X.shape[0]
+        if n == 0:
+            return np.zeros((0, len(self.encoder.categories_[0])), dtype=np.float32)
+        
+        outputs = []
+        for start in range(0, n, self.max_batch):
+            chunk = X[start:start + self.max_batch]
+            size = next(b for b in self.batch_sizes if b >= len(chunk))
+            batch = np.zeros((size,) + X.shape[1:], dtype=np.float32)
+            batch[:len(chunk)] = chunk
+            outputs.append(self._infer(batch)[:len(chunk)])
+        return np.concatenate(outputs, axis=0)
+
     def load_scaler(self):
         """Load the StandardScaler"""
         with open(self.scaler_path, 'rb') as f:
@@ -92,6 +213,104 @@ class EmotionAnalyzer:
         
         return np.vstack((mfcc, zcr, rms)).flatten()
 
+    def extract_features_windows(self, y: np.ndarray, sr: int, bounds) -> np.ndarray:
+        """
+        Fixed-length features for many segments of one signal in a single pass.
+
+        The mel spectrogram, ZCR and RMS are computed once over each contiguous
+        stretch of segments (overlapping windows share their frames) and each
+        segment's (n_mfcc+2, max_frames) window is sliced out of them; the dB
+        floor, DCT and MFCC normalization are then applied to all windows at
+        once. `bounds` holds (start, end) sample offsets per segment. The result
+        matches `extract_features_fixed` on the individual segments to float32
+        precision; segments that are not on a common hop grid are grouped into
+        separate passes.
+        """
+        bounds = np.asarray(bounds, dtype=np.int64).reshape(-1, 2)
+        feats = np.zeros((len(bounds), (self.n_mfcc+2)*self.max_frames), dtype=np.float32)
+        if y.size == 0 or len(bounds) == 0:
+            return feats
+
+        offsets = bounds[:, 0] % HOP_LENGTH
+        for offset in np.unique(offsets):
+            group = np.nonzero(offsets == offset)[0]
+            for run in merge_runs(bounds, group):
+                lo, hi = bounds[run, 0].min(), bounds[run, 1].max()
+                feats[run] = self._extract_span_windows(y[lo:hi], sr, bounds[run] - lo)
+        return feats
+
+    def _extract_span_windows(self, y: np.ndarray, sr: int, bounds: np.ndarray) -> np.ndarray:
+        """`extract_features_windows` for segments of `y` starting on its hop grid"""
+        n_windows = len(bounds)
+        mel = mel_db(y, sr)
+        zcr = librosa.feature.zero_crossing_rate(y=y, hop_length=HOP_LENGTH)
+        rms = librosa.feature.rms(y=y, hop_length=HOP_LENGTH)
+        n_mels, n_frames = mel.shape
+
+        # Segment i covers frames first[i] .. first[i]+n_total[i]-1 (same count as a per-segment STFT)
+        first = np.minimum(bounds[:, 0] // HOP_LENGTH, n_frames)
+        n_total = np.clip(1 + (bounds[:, 1] - bounds[:, 0]) // HOP_LENGTH, 0, n_frames - first)
+        n_valid = np.minimum(n_total, self.max_frames)
+
+        # One (features, max_frames) view per frame offset; gather the ones the segments start at
+        stacked = np.pad(np.vstack((mel, zcr, rms)), ((0, 0), (0, self.max_frames)))
+        windows = np.lib.stride_tricks.sliding_window_view(stacked, self.max_frames, axis=1)
+        windows = windows[:, first, :].transpose(1, 0, 2)
+        self._replace_edge_frames(windows, y, sr, bounds, n_total)
+        valid = (np.arange(self.max_frames)[None, :] < n_valid[:, None])[:, None, :]
+
+        # power_to_db clips each segment to TOP_DB below its own peak, not the whole signal's
+        frame_peak = mel.max(axis=0)
+        seg_peak = np.where(valid, windows[:, :n_mels], -np.inf).max(axis=(1, 2))
+        unused_peak = [frame_peak[f+self.max_frames:f+n-EDGE_FRAMES].max(initial=-np.inf)
+                       for f, n in zip(first, n_total)]
+        seg_peak = np.maximum(seg_peak, unused_peak)
+
+        mel_win = np.maximum(windows[:, :n_mels], (seg_peak - TOP_DB)[:, None, None])
+        mfcc = librosa.feature.mfcc(S=mel_win, n_mfcc=self.n_mfcc) * valid
+        mean = mfcc.mean(axis=(1, 2), keepdims=True)
+        std = mfcc.std(axis=(1, 2), keepdims=True)
+        mfcc = (mfcc - mean)/(std+1e-6)
+
+        feats = np.concatenate((mfcc, windows[:, n_mels:] * valid), axis=1)
+        return feats.reshape(n_windows, -1)
+
+    def _replace_edge_frames(self, windows, y, sr, bounds, n_total):
+        """
+        Overwrite, in place, the frames whose analysis window crosses a segment
+        boundary. A per-segment STFT pads those with zeros (the edge sample for
+        ZCR) instead of reading the neighbouring audio, so they are recomputed
+        from short snippets, batched over all windows.
+        """
+        half = N_FFT // 2
+        span = (EDGE_FRAMES - 1) * HOP_LENGTH + N_FFT
+        heads, tails_zero, tails_edge = [], [], []
+        for (start, end), n in zip(bounds, n_total):
+            seg = y[start:end]
+            heads.append(np.pad(seg[:N_FFT], (0, max(0, N_FFT - len(seg)))))
+            # Last EDGE_FRAMES frames, centred at (n-EDGE_FRAMES)*hop onwards, without centre padding
+            tail = seg[max(0, (n - EDGE_FRAMES) * HOP_LENGTH - half):]
+            tail_pad = (max(0, half - (n - EDGE_FRAMES) * HOP_LENGTH), max(0, span - len(tail)))
+            tails_zero.append(np.pad(tail, tail_pad)[:span])
+            tails_edge.append(np.pad(tail, tail_pad, mode='edge')[:span])
+        heads, tails_zero, tails_edge = np.stack(heads), np.stack(tails_zero), np.stack(tails_edge)
+
+        def edge_features(y_zero, y_edge, center):
+            mel = mel_db(y_zero, sr, center=center)
+            zcr = librosa.feature.zero_crossing_rate(y=y_edge, hop_length=HOP_LENGTH, center=center)
+            rms = librosa.feature.rms(y=y_zero, hop_length=HOP_LENGTH, center=center)
+            return np.concatenate((mel, zcr, rms), axis=1)[..., :EDGE_FRAMES]
+
+        # ZCR pads with the edge sample; at the head that is what centre padding already does
+        head_feats = edge_features(heads, heads, center=True)
+        tail_feats = edge_features(tails_zero, tails_edge, center=False)
+
+        n_head = min(EDGE_FRAMES, self.max_frames)
+        windows[:, :, :n_head] = head_feats[..., :n_head]
+        cols = (n_total - EDGE_FRAMES)[:, None] + np.arange(EDGE_FRAMES)[None, :]
+        rows, j = np.nonzero((cols >= EDGE_FRAMES) & (cols < self.max_frames))
+        windows[rows, :, cols[rows, j]] = tail_feats[rows, :, j]
+
     def add_noise(self, x):
         return x + 0.035*np.random.uniform()*np.max(x)*np.random.normal(size=x.shape)
 
@@ -104,63 +323,143 @@ class EmotionAnalyzer:
     def pitch(self, x, sr, steps=0.7):
         return librosa.effects.pitch_shift(y=x, sr=sr, n_steps=steps)
 
+    def augment(self, y: np.ndarray, sr: int, kind: str) -> np.ndarray:
+        """Apply one named test-time augmentation"""
+        if kind == 'original':
+            return y
+        if kind == 'noise':
+            return self.add_noise(y)
+        if kind == 'stretch':
+            return self.stretch(y, 0.8)
+        if kind == 'shift':
+            return self.shift(y)
+        if kind == 'pitch':
+            return self.pitch(y, sr, 0.7)
+        raise ValueError(f"Unknown augmentation '{kind}'")
+
     def get_features_from_wave(self, y: np.ndarray, sr: int) -> np.ndarray:
-        """Extract augmented features from audio wave"""
-        feats = [self.extract_features_fixed(y, sr)]
-        
-        # Add augmented versions
-        feats.append(self.extract_features_fixed(self.add_noise(y), sr))
-        feats.append(self.extract_features_fixed(self.stretch(y, 0.8), sr))
-        feats.append(self.extract_features_fixed(self.shift(y), sr))
-        feats.append(self.extract_features_fixed(self.pitch(y, sr, 0.7), sr))
+        """Extract features from audio wave plus the augmented copies of the TTA policy"""
+        feats = [self.extract_features_fixed(self.augment(y, sr, kind), sr)
+                 for kind in TTA_POLICIES[self.tta_policy]]
         
         return np.stack(feats, axis=0)
 
-    def segment_audio(self, audio_path, chunk_duration=6.0):
+    def get_features_for_segments(self, y: np.ndarray, sr: int, bounds) -> np.ndarray:
+        """
+        Whole-signal counterpart of `get_features_from_wave`: each augmentation is
+        applied once per contiguous run of segments (audio outside the segments is
+        never augmented) and every segment is sliced out of it.
+        Returns an array of shape (segments, feature sets, features).
+        """
+        bounds = np.asarray(bounds, dtype=np.int64).reshape(-1, 2)
+        kinds = TTA_POLICIES[self.tta_policy]
+        feats = np.zeros((len(bounds), len(kinds), (self.n_mfcc+2)*self.max_frames), dtype=np.float32)
+        for run in merge_runs(bounds):
+            lo, hi = bounds[run, 0].min(), bounds[run, 1].max()
+            y_run, run_bounds = y[lo:hi], bounds[run] - lo
+            for k, kind in enumerate(kinds):
+                y_aug = self.augment(y_run, sr, kind)
+                # Time-stretching changes the length; move the segment bounds with it
+                scale = len(y_aug) / len(y_run) if len(y_run) else 1.0
+                feats[run, k] = self.extract_features_windows(y_aug, sr, np.round(run_bounds * scale))
+
+        return feats
+
+    def window_length(self) -> int:
+        """Samples in one model window: a per-segment STFT of this length yields exactly max_frames frames"""
+        return (self.max_frames - 1) * HOP_LENGTH
+
+    def window_hop(self, sr: int = SAMPLE_RATE, overlap=None) -> int:
+        """Samples between window starts, kept on the STFT hop grid so windows share frames"""
+        if Config.EMOTION_WINDOW_HOP_SECONDS and overlap is None:
+            hop = Config.EMOTION_WINDOW_HOP_SECONDS * sr
+        else:
+            overlap = Config.EMOTION_WINDOW_OVERLAP if overlap is None else overlap
+            if not 0.0 <= overlap < 1.0:
+                raise ValueError(f"Window overlap must be in [0, 1), got {overlap}")
+            hop = self.window_length() * (1.0 - overlap)
+        return max(HOP_LENGTH, int(round(hop / HOP_LENGTH)) * HOP_LENGTH)
+
+    def segment_audio(self, audio_path, overlap=None):
         """Segment the audio for analysis using energy-based and silence-based methods"""
         # Load audio
         y, sr = librosa.load(audio_path, sr=16000)
-        
-        # Energy-based coarse segmentation
-        cs = int(chunk_duration * sr)
-        chunks = []
-        
-        for i in range(0, len(y), cs):
-            seg = y[i:i+cs]
-            if len(seg) > sr * 0.5:  # At least 0.5 seconds
-                energy = np.mean(seg**2)
-                chunks.append({
-                    'start': i/sr, 
-                    'end': min((i+cs)/sr, len(y)/sr), 
-                    'energy': energy,
-                    'audio': seg
-                })
-        
-        # Keep top 60% by energy
-        chunks.sort(key=lambda x: x['energy'], reverse=True)
-        keep = chunks[:int(len(chunks)*0.6)]
-        keep.sort(key=lambda x: x['start'])
-        
-        return keep
-
-    def classify_emotions(self, audio_segments):
-        """Classify emotions based on the extracted audio features"""
+        regions = detect_speech(y, sr) if Config.VAD_ENABLED else None
+        return self.segment_waveform(y, sr, overlap, regions)
+
+    def segment_waveform(self, y: np.ndarray, sr: int, overlap=None, regions=None):
+        """
+        Segment an in-memory waveform (same rules as `segment_audio`) into windows
+        of exactly the model's input length, so every analyzed sample reaches the model.
+
+        With speech `regions` (see components.vad) windows are tiled over each region
+        only and all of them are kept. Without, the whole signal is tiled and the
+        highest-energy share is kept. The last window of a span ends at the span's
+        end. Windows shorter than 0.5 s are dropped (classify_emotions skips them
+        too), so up to 0.5 s at the end of a span and spans shorter than 0.5 s are
+        not analyzed.
+        """
+        win = self.window_length()
+        hop = self.window_hop(sr, overlap)
+        spans = [(0, len(y))] if regions is None else regions
+
+        starts, ends = [], []
+        for span_start, span_end in spans:
+            for i in range(span_start, span_end, hop):
+                if span_end - i > sr * 0.5:  # At least 0.5 seconds
+                    starts.append(i)
+                    ends.append(min(i + win, span_end))
+                if i + win >= span_end:
+                    break
+        if not starts:
+            return []
+
+        # Energy per window (mean power from one cumulative sum)
+        starts, ends = np.array(starts), np.array(ends)
+        power = np.concatenate(([0.0], np.cumsum(np.square(y, dtype=np.float64))))
+        energies = (power[ends] - power[starts]) / (ends - starts)
+
+        if regions is None:
+            # No VAD: keep the highest-energy windows (at least one)
+            n_keep = max(1, int(len(starts) * Config.EMOTION_KEEP_TOP_FRACTION))
+            keep = np.sort(np.argsort(-energies, kind='stable')[:n_keep])
+        else:
+            keep = np.arange(len(starts))
+
+        return [{
+            'start': starts[i]/sr,
+            'end': ends[i]/sr,
+            'energy': energies[i],
+            'audio': y[starts[i]:ends[i]]
+        } for i in keep]
+
+    def classify_emotions(self, audio_segments, signal=None):
+        """
+        Classify emotions based on the extracted audio features.
+        Pass the full `signal` the segments were cut from to use whole-signal extraction.
+        """
         emotions = []
         confidences = []
+        sr = 16000
         
-        for segment in audio_segments:
-            y = segment['audio']
-            sr = 16000
-            
-            if len(y)/sr < 0.5:  # Skip very short segments
-                continue
-                
-            # Extract features
-            feats = self.get_features_from_wave(y, sr)
-            X = self.scaler.transform(feats)[..., None]
-            
-            # Predict
-            probs = self.model.predict(X, verbose=0)
+        segments = [s for s in audio_segments if len(s['audio'])/sr >= 0.5]  # Skip very short segments
+        
+        # Extract features for every segment, then classify them all at once
+        if signal is not None and self.feature_mode == 'whole_signal' and segments:
+            bounds = [(int(round(s['start']*sr)), int(round(s['end']*sr))) for s in segments]
+            feature_sets = list(self.get_features_for_segments(signal, sr, bounds))
+        else:
+            feature_sets = [self.get_features_from_wave(s['audio'], sr) for s in segments]
+        
+        if not feature_sets:
+            return emotions, confidences
+        
+        X = self.scaler.transform(np.concatenate(feature_sets, axis=0))[..., None]
+        all_probs = self.predict_batched(X.astype(np.float32))
+        
+        # Split predictions back per segment (original + augmented copies)
+        bounds = np.cumsum([len(f) for f in feature_sets])[:-1]
+        for probs in np.split(all_probs, bounds):
             preds = np.argmax(probs, axis=1)
             lab_idx = np.bincount(preds).argmax()
             conf = float(np.max(np.mean(probs, axis=0)))
@@ -174,43 +473,137 @@ class EmotionAnalyzer:
 
     def analyze(self, video_path):
         """Main analysis function"""
-        # Extract audio from video
-        audio_path = self.extract_audio(video_path)
+        # Long recordings are streamed so memory stays bounded
+        if probe_duration(video_path) >= Config.EMOTION_STREAM_MIN_SECONDS:
+            return self.analyze_stream(video_path)
         
-        try:
-            # Segment audio
-            audio_segments = self.segment_audio(audio_path)
-            
-            # Classify emotions
-            emotions, confidences = self.classify_emotions(audio_segments)
+        # Decode the audio track in memory (no temp WAV)
+        audio = decode_audio(video_path, SAMPLE_RATE)
+        return self.analyze_audio(audio.samples, audio.sample_rate)
+
+    def analyze_audio(self, y: np.ndarray, sr: int = SAMPLE_RATE, regions=None):
+        """
+        Analyze emotions from an already decoded 16 kHz mono waveform.
+        `regions` are the recording's speech regions; detected here when not given.
+        """
+        if regions is None and Config.VAD_ENABLED:
+            regions = detect_speech(y, sr)
+        
+        # Segment audio
+        audio_segments = self.segment_waveform(y, sr, regions=regions)
+        
+        # Classify emotions
+        emotions, confidences = self.classify_emotions(audio_segments, signal=y)
+        
+        return self.summarize(emotions, confidences)
+
+    def analyze_stream(self, media_path, block_seconds=None):
+        """
+        Streaming counterpart of `analyze` for long recordings. The audio is read in
+        fixed blocks and classified as it arrives (see `stream_windows`); only a
+        rolling buffer, the frame energies and the per-window labels are kept, so
+        peak memory does not grow with the recording length.
+        """
+        emotions, confidences = [], []
+        for buffer, _, segments in self.stream_windows(media_path, block_seconds):
+            block_emotions, block_confidences = self.classify_emotions(segments, signal=buffer)
+            emotions.extend(block_emotions)
+            confidences.extend(block_confidences)
+        return self.summarize(emotions, confidences)
+
+    def stream_windows(self, media_path, block_seconds=None):
+        """
+        Model windows of `media_path`, cut block by block. Yields (buffer, offset,
+        segments) per block: the rolling buffer (the block plus the unfinished
+        speech region carried over from the previous one), its offset in samples
+        and its `segment_waveform` windows (times relative to the buffer).
+
+        Speech is judged against the noise floor of the whole recording, taken in
+        a first pass over the blocks, not of the buffer alone: a block of
+        continuous speech would otherwise be compared with its own speech-level
+        floor. With that floor, and the buffer cut on the VAD frame grid, the
+        windows are the ones `analyze` cuts (scripts/check_emotion_stream.py).
+        Without VAD every window is kept, since energies cannot be ranked across
+        the whole recording.
+        """
+        sr = SAMPLE_RATE
+        block_samples = int((block_seconds or Config.EMOTION_STREAM_BLOCK_SECONDS) * sr)
+        win, hop = self.window_length(), self.window_hop(sr)
+        # A speech region ending this close to the buffer end may continue in the next block
+        guard = int((Config.VAD_MIN_SILENCE + Config.VAD_PADDING) * sr) if Config.VAD_ENABLED else 0
+        
+        # `done` is where the buffer's unprocessed audio starts
+        buffer, offset, done = np.zeros(0, dtype=np.float32), 0, 0
+        if Config.VAD_ENABLED:
+            # First pass: the recording's noise floor, without holding the recording
+            noise_floor = noise_floor_of_blocks(iter_audio_blocks(media_path, block_samples, sr))
+        blocks = iter_audio_blocks(media_path, block_samples, sr)
+        current = next(blocks, None)
+        while current is not None:
+            following = next(blocks, None)
+            is_last = following is None
+            buffer = np.concatenate((buffer, current))
             
-            # Aggregate results
-            if emotions:
-                emotion_counts = Counter(emotions)
-                dominant_emotion = emotion_counts.most_common(1)[0][0]
-                avg_confidence = np.mean(confidences)
-                
-                result = {
-                    'dominant_emotion': dominant_emotion,
-                    'avg_confidence': avg_confidence,
-                    'emotion_distribution': dict(emotion_counts),
-                    'total_segments': len(emotions),
-                    'all_emotions': emotions,
-                    'all_confidences': confidences
-                }
+            if Config.VAD_ENABLED:
+                regions = detect_speech(buffer, sr, noise_floor=noise_floor)
             else:
-                result = {
-                    'dominant_emotion': 'unknown',
-                    'avg_confidence': 0.0,
-                    'emotion_distribution': {},
-                    'total_segments': 0,
-                    'all_emotions': [],
-                    'all_confidences': []
-                }
+                regions = np.array([[0, len(buffer)]])
+            
+            spans, resume = [], []
+            for start, end in regions:
+                if end <= done:
+                    continue
+                # A region carried over resumes where its windows stopped
+                start = max(start, done)
+                if is_last or end < len(buffer) - guard:
+                    spans.append((start, end))
+                    continue
+                # Still open: analyze its complete windows now and carry the rest over
+                n_full = max(0, (end - start - win) // hop + 1)
+                if n_full:
+                    spans.append((start, start + (n_full - 1) * hop + win))
+                resume.append(start + n_full * hop)
+            # Keep the open region from its next window, else just the guard
+            keep_from = min(resume) if resume else max(done, len(buffer) - guard)
             
-            return result
+            if spans:
+                segments = self.segment_waveform(buffer, sr, regions=np.array(spans))
+                if segments:
+                    yield buffer, offset, segments
             
-        finally:
-            # Clean up temporary audio file
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
\ No newline at end of file
+            # Keep `guard` of context so the carried region is detected as in one pass,
+            # cut on the VAD frame grid so frames line up with the in-memory pass,
+            # and copy so the processed part of the buffer can be freed
+            cut = max(0, keep_from - guard)
+            cut -= cut % FRAME_HOP
+            buffer = buffer[cut:].copy()
+            offset += cut
+            done = keep_from - cut
+            current = following
+
+    def summarize(self, emotions, confidences):
+        """Aggregate per-window labels and confidences into the analysis result"""
+        if emotions:
+            emotion_counts = Counter(emotions)
+            dominant_emotion = emotion_counts.most_common(1)[0][0]
+            avg_confidence = np.mean(confidences)
+            
+            result = {
+                'dominant_emotion': dominant_emotion,
+                'avg_confidence': avg_confidence,
+                'emotion_distribution': dict(emotion_counts),
+                'total_segments': len(emotions),
+                'all_emotions': emotions,
+                'all_confidences': confidences
+            }
+        else:
+            result = {
+                'dominant_emotion': 'unknown',
+                'avg_confidence': 0.0,
+                'emotion_distribution': {},
+                'total_segments': 0,
+                'all_emotions': [],
+                'all_confidences': []
+            }
+        
+        return result
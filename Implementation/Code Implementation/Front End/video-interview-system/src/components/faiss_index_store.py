@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+from typing import List
+
+import numpy as np
+import faiss
+from langchain.vectorstores import FAISS
+from langchain.docstore.document import Document
+from langchain.docstore.in_memory import InMemoryDocstore
+
+INDEX_FILENAME = "index.faiss"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def row_hash(text: str) -> str:
+    """Content hash of a single indexed row"""
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+def _source_hash(row_hashes: List[str]) -> str:
+    """Hash of the whole bank (row hashes in order)"""
+    return hashlib.sha256("\n".join(row_hashes).encode("utf-8")).hexdigest()
+
+
+def _read_manifest(index_dir):
+    path = os.path.join(index_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("version") == MANIFEST_VERSION else None
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable FAISS manifest {path}: {e}")
+        return None
+
+
+def _read_index(index_dir, mmap=True):
+    """Read a saved index, memory-mapped when the FAISS build supports it"""
+    path = os.path.join(index_dir, INDEX_FILENAME)
+    if mmap:
+        try:
+            return faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            # Older FAISS builds can only mmap IVF lists; fall back to a normal read
+            pass
+    return faiss.read_index(path)
+
+
+def _write_index(index_dir, index, texts, row_hashes, model_name):
+    os.makedirs(index_dir, exist_ok=True)
+    index_path = os.path.join(index_dir, INDEX_FILENAME)
+    manifest_path = os.path.join(index_dir, MANIFEST_FILENAME)
+
+    # Write to temp files first so a crash never leaves a half-written index behind
+    faiss.write_index(index, index_path + ".tmp")
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "embedding_model": model_name,
+        "dimension": index.d,
+        "source_hash": _source_hash(row_hashes),
+        "rows": [{"hash": h, "text": t} for h, t in zip(row_hashes, texts)],
+    }
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+    os.replace(index_path + ".tmp", index_path)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def _to_vectorstore(index, texts, embeddings) -> FAISS:
+    """Wrap a raw FAISS index in the LangChain vector store used by the retrievers"""
+    docstore = InMemoryDocstore({str(i): Document(page_content=t) for i, t in enumerate(texts)})
+    index_to_docstore_id = {i: str(i) for i in range(len(texts))}
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
+
+def load_or_build_faiss(texts: List[str], embeddings, index_dir, model_name: str) -> FAISS:
+    """
+    Return a FAISS vector store for `texts`, persisted under `index_dir`.
+
+    The saved index is reused as-is when the manifest's source hash and embedding
+    model match. If only some rows changed, vectors of unchanged rows are copied
+    from the saved index and only new/edited rows are sent to the embeddings
+    endpoint. A different embedding model forces a full rebuild.
+    """
+    index_dir = str(index_dir)
+    row_hashes = [row_hash(t) for t in texts]
+    manifest = _read_manifest(index_dir)
+
+    reusable = {}
+    old_index = None
+    if manifest and manifest.get("embedding_model") == model_name:
+        try:
+            if manifest.get("source_hash") == _source_hash(row_hashes):
+                index = _read_index(index_dir)
+                if index.ntotal == len(texts):
+                    print(f"Loaded FAISS index from {index_dir} ({index.ntotal} rows)")
+                    return _to_vectorstore(index, texts, embeddings)
+
+            # Bank changed: keep vectors for rows whose content is unchanged
+            old_index = _read_index(index_dir, mmap=False)
+            for pos, row in enumerate(manifest.get("rows", [])):
+                if pos < old_index.ntotal:
+                    reusable.setdefault(row["hash"], pos)
+        except Exception as e:
+            print(f"Warning: could not reuse FAISS index in {index_dir}: {e}")
+            reusable = {}
+
+    to_embed = sorted({h: t for h, t in zip(row_hashes, texts) if h not in reusable}.items())
+    new_vectors = {}
+    if to_embed:
+        print(f"Embedding {len(to_embed)} new/changed rows for {index_dir}")
+        vectors = embeddings.embed_documents([t for _, t in to_embed])
+        new_vectors = {h: np.asarray(v, dtype="float32") for (h, _), v in zip(to_embed, vectors)}
+
+    rows = [
+        new_vectors[h] if h in new_vectors else old_index.reconstruct(reusable[h])
+        for h in row_hashes
+    ]
+    matrix = np.vstack(rows).astype("float32") if rows else np.zeros((0, 1), dtype="float32")
+
+    index = faiss.IndexFlatL2(matrix.shape[1])
+    index.add(matrix)
+    _write_index(index_dir, index, texts, row_hashes, model_name)
+    print(f"Saved FAISS index to {index_dir} ({index.ntotal} rows, {len(to_embed)} embedded)")
+
+    return _to_vectorstore(index, texts, embeddings)
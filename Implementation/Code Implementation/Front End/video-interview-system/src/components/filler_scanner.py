@@ -0,0 +1,153 @@
+import re
+import bisect
+from typing import Dict, List, Tuple
+
+# (label, pattern, only when another word follows) for every speech filler, in
+# priority order. A space in a pattern matches any whitespace run. Fillers never
+# match inside a hyphenated word ("uh-huh", "so-so", "well-known").
+FILLER_PATTERNS = [
+    ('uh', r'uh+', False),
+    ('um', r'um+', False),
+    ('umm', r'umm+', False),
+    ('uhhh', r'uhhh+', False),
+    ('er', r'er+', False),
+    ('like', r'like', True),
+    ('you know', r'you know', False),
+    ('well', r'well', True),
+    ('so', r'so', True),
+    ('actually', r'actually', True),
+    ('basically', r'basically', True),
+    ('hm', r'hm+', False),
+    ('hmm', r'hmm+', False),
+    ('ah', r'ah+', False),
+    ('oh', r'oh+', False),
+]
+
+FILLER_LABELS = {f"f{i}": label for i, (label, _, _) in enumerate(FILLER_PATTERNS)}
+
+
+def _word_regex(pattern: str) -> str:
+    """`pattern` as a whole word, not part of a hyphenated one"""
+    return r'(?<![\w-])%s(?![\w-])' % pattern.replace(' ', r'\s+')
+
+
+def _filler_regex(index: int) -> str:
+    """
+    Regex of filler `index`, matching where the former one-pattern-at-a-time
+    removal would have deleted it. "Followed by a word" skips every filler
+    listed before it that that removal had already deleted when this pattern
+    ran: the unconditional ones, and the conditional ones that were themselves
+    followed by a word (checked recursively, in the same way).
+    """
+    _, pattern, needs_word = FILLER_PATTERNS[index]
+    regex = _word_regex(pattern)
+    if not needs_word:
+        return regex
+    skip = "|".join(_filler_regex(i) for i in range(index))
+    return regex + r'(?=\s+(?:(?:%s)\s+)*(?!(?:%s))\w)' % (skip, skip)
+
+
+# Whitespace runs that need rewriting, and every filler (only tried at word starts
+# with a possible first letter), in one alternation: a single left-to-right scan
+SCAN_RE = re.compile(
+    r"(?P<ws>\s{2,}|[^\S ])|(?<![\w-])(?=[%s])(?:%s)" % (
+        "".join(sorted({pattern[0] for _, pattern, _ in FILLER_PATTERNS})),
+        "|".join("(?P<f%d>%s)" % (i, _filler_regex(i)) for i in range(len(FILLER_PATTERNS)))
+    ),
+    re.IGNORECASE
+)
+# Space before sentence punctuation (dropped) / punctuation glued to a capital (space inserted)
+TIDY_RE = re.compile(r'\s+(?=[.!?])|(?<=[.!?])(?=[A-Z])')
+
+
+class FillerScan:
+    """
+    Cleaned transcript, the fillers removed from it and a cleaned -> original
+    offset map. The map is piecewise: each pass records where its copied runs
+    start, and lookups compose the two passes with a bisect.
+    """
+
+    def __init__(self, text: str, spans: List[Tuple[int, int, str]], scan_map, tidy_map, lead: int):
+        self.text = text
+        self.spans = spans              # (start, end, label) of every filler in the original transcript
+        self._scan_map = scan_map       # ([scanned offsets], [original offsets]) of each copied run
+        self._tidy_map = tidy_map       # ([tidied offsets], [scanned offsets]) of each copied run
+        self._lead = lead               # whitespace stripped from the front of the tidied text
+
+    @property
+    def count(self) -> int:
+        return len(self.spans)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Occurrences per filler label"""
+        counts = {}
+        for _, _, label in self.spans:
+            counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    @staticmethod
+    def _lookup(run_map, offset: int) -> int:
+        starts, targets = run_map
+        i = bisect.bisect_right(starts, offset) - 1
+        return targets[i] + offset - starts[i]
+
+    def to_original(self, offset: int) -> int:
+        """Offset in the original transcript of cleaned-text `offset`"""
+        if not self.text:
+            return 0
+        if offset >= len(self.text):
+            return self.to_original(len(self.text) - 1) + 1
+        return self._lookup(self._scan_map, self._lookup(self._tidy_map, offset + self._lead))
+
+    def to_original_span(self, offset: int, length: int) -> Tuple[int, int]:
+        """(offset, length) in the original transcript of a cleaned-text span (e.g. a LanguageTool match)"""
+        start = self.to_original(offset)
+        if length <= 0:
+            return start, 0
+        return start, self.to_original(offset + length - 1) + 1 - start
+
+
+def _rewrite(text: str, matches, replace) -> Tuple[str, Tuple[List[int], List[int]]]:
+    """
+    Apply `replace(match)` (replacement string) to each match and record the
+    output offset of every copied run and replacement with its input offset.
+    """
+    pieces, out_starts, in_starts = [], [], []
+    position = written = 0
+    for match in matches:
+        start, end = match.span()
+        for chunk, source in ((text[position:start], position), (replace(match), start)):
+            if chunk:
+                pieces.append(chunk)
+                out_starts.append(written)
+                in_starts.append(source)
+                written += len(chunk)
+        position = end
+    pieces.append(text[position:])
+    out_starts.append(written)
+    in_starts.append(position)
+    return "".join(pieces), (out_starts, in_starts)
+
+
+def scan_fillers(text: str) -> FillerScan:
+    """
+    Remove speech fillers and normalize whitespace in one pass over `text`.
+
+    Same result as collapsing whitespace, deleting each filler pattern in turn
+    and then tidying the spacing around sentence punctuation.
+    """
+    spans = []
+
+    def scan_replace(match):
+        if match.lastgroup == 'ws':
+            return ' '
+        spans.append((match.start(), match.end(), FILLER_LABELS[match.lastgroup]))
+        return ''
+
+    scanned, scan_map = _rewrite(text, SCAN_RE.finditer(text), scan_replace)
+    # Punctuation spacing (the only other rewrite), keeping the offset map aligned
+    tidied, tidy_map = _rewrite(scanned, TIDY_RE.finditer(scanned), lambda m: ' ' if m.start() == m.end() else '')
+
+    cleaned = tidied.strip()
+    return FillerScan(cleaned, spans, scan_map, tidy_map, len(tidied) - len(tidied.lstrip()))
@@ -3409,15 +3409,27 @@
 #             'ai_provider': 'Azure OpenAI' if self.ai_available else 'None'
 #         }
 
-import language_tool_python
 from langchain_openai import AzureChatOpenAI
 from langchain_core.messages import HumanMessage
 import json
 import re
 import time
+import asyncio
+import threading
 from typing import Dict, List, Optional, Tuple
 import streamlit as st
 from config.settings import Config
+from components.model_registry import registry
+from components.sentence_match_cache import SentenceMatchCache, check_sharded
+from components.language_tool_pool import LanguageToolPool
+from components.speech_rule_filter import SpeechRuleFilter
+from components.filler_scanner import scan_fillers
+
+LANGUAGE_TOOL_KEY = "language_tool:en-US"
+LANGUAGE_TOOL_MATCHES_KEY = "language_tool_matches:en-US"
+SPEECH_RULE_FILTER_KEY = "speech_rule_filter"
+AZURE_GRAMMAR_LLM_KEY = "azure_grammar_llm"
+GRAMMAR_EVENT_LOOP_KEY = "grammar_event_loop"
 
 def _extract_json_from_text(raw: str) -> Optional[str]:
     """
@@ -3446,33 +3458,36 @@ def _extract_json_from_text(raw: str) -> Optional[str]:
 class HybridGrammarChecker:
     def __init__(self):
         """Initialize hybrid grammar checker focused ONLY on grammar (not spelling)"""
-        # Initialize LanguageTool (always available)
+        # Initialize LanguageTool (always available) - client of the shared, health-checked server pool
         try:
-            self.language_tool = language_tool_python.LanguageTool('en-US')
+            self.language_tool = registry.get(
+                LANGUAGE_TOOL_KEY, lambda: LanguageToolPool.from_config('en-US').start()
+            )
             self.local_available = True
         except Exception as e:
             print(f"Warning: LanguageTool initialization failed: {e}")
             self.language_tool = None
             self.local_available = False
         
+        # Per-sentence match cache shared across checks, so re-checks only send changed sentences
+        self.match_cache = None
+        if self.local_available and Config.GRAMMAR_MATCH_CACHE_SIZE:
+            self.match_cache = registry.get(
+                LANGUAGE_TOOL_MATCHES_KEY, lambda: SentenceMatchCache(Config.GRAMMAR_MATCH_CACHE_SIZE)
+            )
+        
+        # Compiled speech-aware filter table; shared so its per-rule decisions are memoized across checks
+        self.rule_filter = registry.get(SPEECH_RULE_FILTER_KEY, SpeechRuleFilter)
+        
         # Initialize Azure OpenAI client (optional)
         self.ai_available = False
+        self.azure_llm = None
         if Config.is_azure_openai_available():
             try:
-                # Setup environment variables
-                Config.setup_azure_openai_env()
-                
-                # Initialize Azure OpenAI client
-                self.azure_llm = AzureChatOpenAI(
-                    openai_api_version=Config.AZURE_OPENAI_API_VERSION,
-                    azure_deployment=Config.AZURE_DEPLOYMENT_NAME,
-                    temperature=0.1,
-                    max_tokens=600
+                # Client and connection test are shared, so the test call runs once per process
+                self.azure_llm, self.ai_available = registry.get(
+                    AZURE_GRAMMAR_LLM_KEY, self._load_azure_llm
                 )
-                
-                # Test the connection
-                if self._test_azure_openai_connection():
-                    self.ai_available = True
                     
             except Exception as e:
                 print(f"Warning: Azure OpenAI initialization failed: {e}")
@@ -3487,11 +3502,40 @@ class HybridGrammarChecker:
             'incomplete_sentences': True    # Allow sentence fragments
         }
     
-    def _test_azure_openai_connection(self):
+    @classmethod
+    def _load_azure_llm(cls):
+        """Create the Azure OpenAI client and test it; returns (client, available)"""
+        # Setup environment variables
+        Config.setup_azure_openai_env()
+        
+        # Initialize Azure OpenAI client
+        azure_llm = AzureChatOpenAI(
+            openai_api_version=Config.AZURE_OPENAI_API_VERSION,
+            azure_deployment=Config.AZURE_DEPLOYMENT_NAME,
+            temperature=0.1,
+            max_tokens=600
+        )
+        
+        # Test the connection
+        return azure_llm, cls._test_azure_openai_connection(azure_llm)
+    
+    @staticmethod
+    def _start_event_loop():
+        """
+        Event loop for the grammar pipeline, run forever on a daemon thread. The shared
+        Azure client's async connections stay bound to the loop they were opened on,
+        so every check runs on this one loop instead of a new one per call.
+        """
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="grammar-event-loop", daemon=True).start()
+        return loop
+    
+    @staticmethod
+    def _test_azure_openai_connection(azure_llm):
         """Test Azure OpenAI connection"""
         try:
             message = HumanMessage(content="Test")
-            response = self.azure_llm.invoke([message])
+            response = azure_llm.invoke([message])
             return True
         except Exception as e:
             print(f"Azure OpenAI connection test failed: {e}")
@@ -3511,59 +3555,83 @@ class HybridGrammarChecker:
         if not text or not text.strip():
             return self._empty_result()
         
-        # Clean and prepare text, get filler count
-        cleaned_text, filler_count = self._clean_text(text)
+        # Clean and prepare text, get filler count (one scan, which also maps offsets back to `text`)
+        scan = scan_fillers(text)
+        cleaned_text, filler_count = scan.text, scan.count
         word_count = len(cleaned_text.split())
         original_word_count = len(text.split())
         
         if word_count < 5:  # Too short for meaningful analysis
             return self._minimal_result(cleaned_text, word_count, filler_count)
         
+        # Local check and AI assessment run concurrently on the shared event loop
+        loop = registry.get(GRAMMAR_EVENT_LOOP_KEY, self._start_event_loop)
+        pipeline = self._check_grammar_async(text, scan, word_count, original_word_count, force_ai)
+        result, ai_error = asyncio.run_coroutine_threadsafe(pipeline, loop).result()
+        if ai_error is not None:
+            # Reported here: Streamlit calls only render from the script's own thread
+            st.warning(f"AI analysis failed, using local results: {str(ai_error)}")
+        return result
+    
+    async def _check_grammar_async(self, text: str, scan, word_count: int, original_word_count: int,
+                                   force_ai: bool) -> Dict:
+        """
+        The AI request only needs the cleaned text and filler count, so it is started
+        speculatively before the local check and cancelled if the local results show
+        AI is not needed. Wall time is max(local, AI) instead of their sum.
+        Returns (result, error of the AI request or None).
+        """
+        cleaned_text, filler_count = scan.text, scan.count
+        
+        ai_task = None
+        if self.ai_available and Config.GRAMMAR_AI_SPECULATIVE and (force_ai or Config.GRAMMAR_AI_AUTO_TRIGGER):
+            ai_task = asyncio.create_task(self._acheck_with_azure_openai(cleaned_text, filler_count))
+        
         # Step 1: Local grammar check (LanguageTool) - filter out spelling errors
-        local_results = self._check_with_language_tool(cleaned_text)
+        try:
+            local_results = await asyncio.to_thread(self._check_with_language_tool, cleaned_text)
+        except BaseException:
+            await self._cancel(ai_task)
+            raise
         
         # Add filler word information to local results
         local_results['filler_count'] = filler_count
+        local_results['filler_breakdown'] = scan.counts
         local_results['original_word_count'] = original_word_count
         
+        # Error positions in the transcript as spoken (before filler removal)
+        for error in local_results['errors']:
+            error['original_offset'], error['original_length'] = scan.to_original_span(error['offset'], error['length'])
+        
         # Step 2: Decide if AI analysis is needed
         use_ai = force_ai or self._should_use_ai(cleaned_text, local_results, word_count)
         
         # Step 3: Enhanced AI analysis if conditions are met
         if use_ai and self.ai_available:
             try:
-                ai_results = self._check_with_azure_openai(cleaned_text, local_results)
-                return self._merge_results(local_results, ai_results, cleaned_text, text)
+                if ai_task is None:
+                    ai_task = asyncio.create_task(self._acheck_with_azure_openai(cleaned_text, filler_count))
+                ai_results = await ai_task
+                return self._merge_results(local_results, ai_results, cleaned_text, text), None
             except Exception as e:
-                st.warning(f"AI analysis failed, using local results: {str(e)}")
-                return self._finalize_local_results(local_results, cleaned_text, text)
+                return self._finalize_local_results(local_results, cleaned_text, text), e
         
-        return self._finalize_local_results(local_results, cleaned_text, text)
+        # AI not needed: drop the speculative request
+        await self._cancel(ai_task)
+        return self._finalize_local_results(local_results, cleaned_text, text), None
+    
+    @staticmethod
+    async def _cancel(task):
+        """Cancel a speculative AI request and wait until it has stopped"""
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
     
     def _clean_text(self, text: str) -> Tuple[str, int]:
         """Clean and normalize text for analysis, return cleaned text and filler count"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Count and remove common speech filler words
-        fillers = [
-            r'\buh+\b', r'\bum+\b', r'\bumm+\b', r'\buhhh+\b', r'\ber+\b', 
-            r'\blike\b(?=\s+\w)', r'\byou know\b', r'\bwell\b(?=\s+\w)', 
-            r'\bso\b(?=\s+\w)', r'\bactually\b(?=\s+\w)', r'\bbasically\b(?=\s+\w)',
-            r'\bhm+\b', r'\bhmm+\b', r'\bah+\b', r'\boh+\b'
-        ]
-        
-        filler_count = 0
-        for filler in fillers:
-            matches = re.findall(filler, text, flags=re.IGNORECASE)
-            filler_count += len(matches)
-            text = re.sub(filler, '', text, flags=re.IGNORECASE)
-        
-        # Clean up punctuation spacing
-        text = re.sub(r'\s+([.!?])', r'\1', text)
-        text = re.sub(r'([.!?])([A-Z])', r'\1 \2', text)
-        
-        return text.strip(), filler_count
+        # Whitespace, all speech fillers and punctuation spacing in one scan (components/filler_scanner.py)
+        scan = scan_fillers(text)
+        return scan.text, scan.count
 
     def _should_use_ai(self, text: str, local_results: Dict, word_count: int) -> bool:
         """Intelligent decision on when to use AI analysis"""
@@ -3588,16 +3656,13 @@ class HybridGrammarChecker:
             return {'errors': [], 'error_count': 0, 'available': False}
 
         try:
-            matches = self.language_tool.check(text)
+            # Matches are computed once and shared by filtering and correction
+            matches = self._get_matches(text)
             errors = []
 
             for match in matches:
-                # SKIP ALL SPELLING ERRORS - Enhanced filtering
-                if self._is_spelling_error(match):
-                    continue
-                    
-                # Filter out speech-inappropriate errors
-                if self._should_ignore_error(match, text):
+                # Skip spelling and speech-inappropriate errors (Config.GRAMMAR_SPEECH_FILTERS)
+                if self.rule_filter.should_drop(match, text):
                     continue
 
                 error = {
@@ -3624,156 +3689,17 @@ class HybridGrammarChecker:
             print(f"LanguageTool error: {e}")
             return {'errors': [], 'error_count': 0, 'available': False}
     
-    def _is_spelling_error(self, match) -> bool:
-        """Check if the error is a spelling error that should be ignored - ENHANCED"""
-        # Categories that indicate spelling errors
-        spelling_categories = ['TYPOS']
-        
-        # Rule IDs that are spelling-related - EXPANDED LIST
-        spelling_rule_ids = [
-            'MORFOLOGIK_RULE_EN_US',
-            'HUNSPELL_RULE',
-            'SPELLING_RULE',
-            'POSSIBLE_SPELLING_MISTAKE',
-            'MORFOLOGIK_RULE',
-            'SPELLER_RULE',
-            'DICTIONARY_RULE'
-        ]
-        
-        # Messages that indicate spelling errors - EXPANDED LIST
-        spelling_messages = [
-            'possible spelling mistake',
-            'spelling mistake found',
-            'use a different word',
-            'did you mean',
-            'misspelled',
-            'not found in dictionary',
-            'unknown word',
-            'correct spelling',
-            'typo',
-            'misspelling'
-        ]
-        
-        message_lower = match.message.lower()
-        
-        # Check if it's a spelling error based on category, rule ID, or message
-        is_spelling = (match.category in spelling_categories or 
-                      match.ruleId in spelling_rule_ids or
-                      any(msg in message_lower for msg in spelling_messages))
-        
-        # Additional check: if it's about proper names/capitalized words (often names)
-        if not is_spelling:
-            error_text = match.context[match.offset:match.offset + match.errorLength] if hasattr(match, 'context') else ""
-            if error_text and error_text[0].isupper() and any(msg in message_lower for msg in ['spelling', 'unknown']):
-                is_spelling = True
-        
-        return is_spelling
-
-    def _should_ignore_error(self, match, text: str) -> bool:
-        """Determine if an error should be ignored for speech analysis"""
-        rule_id = match.ruleId
-        category = match.category
-        error_text = text[match.offset:match.offset + match.errorLength].strip()
-        message = match.message.lower()
-
-        # 1. Ignore casual punctuation rules for speech
-        if self._is_casual_punctuation_error(rule_id, message):
-            return True
-
-        # 2. Ignore overly formal grammar rules
-        if self._is_overly_formal_rule(rule_id, message):
-            return True
-
-        # 3. Ignore common speech patterns
-        if self._is_natural_speech_pattern(error_text, message):
-            return True
-
-        # 4. Ignore transcription artifacts
-        if self._is_transcription_artifact(error_text, message):
-            return True
-
-        return False
-
-    def _is_casual_punctuation_error(self, rule_id: str, message: str) -> bool:
-        """Check if error is about casual punctuation acceptable in speech"""
-        casual_punctuation_rules = [
-            'COMMA_COMPOUND_SENTENCE',      # Comma before 'and' in compound sentences
-            'OXFORD_COMMA',                 # Oxford comma usage
-            'COMMA_PARENTHETICAL',          # Commas around parenthetical phrases
-            'SEMICOLON_COMPOUND',           # Semicolon usage
-            'EN_QUOTES',                    # Quote mark consistency
-            'ELLIPSIS',                     # Ellipsis usage
-        ]
-
-        casual_messages = [
-            "comma before 'and'",
-            "use a comma before",
-            "comma after",
-            "semicolon instead",
-            "quotation marks",
-            "ellipsis"
-        ]
-
-        return (rule_id in casual_punctuation_rules or 
-                any(msg in message for msg in casual_messages))
-
-    def _is_overly_formal_rule(self, rule_id: str, message: str) -> bool:
-        """Check if error is about overly formal grammar rules"""
-        formal_rules = [
-            'SENTENCE_FRAGMENT',            # Allow fragments in speech
-            'INFORMAL_CONTRACTIONS',        # Allow contractions
-            'COLLOQUIAL_WORD',             # Allow colloquial language
-            'PASSIVE_VOICE',               # Don't enforce active voice
-            'WORDINESS',                   # Allow some redundancy in speech
-        ]
-
-        formal_messages = [
-            'sentence fragment',
-            'avoid using',
-            'too informal',
-            'passive voice',
-            'wordy',
-            'redundant'
-        ]
-
-        return (rule_id in formal_rules or 
-                any(msg in message for msg in formal_messages))
-
-    def _is_natural_speech_pattern(self, error_text: str, message: str) -> bool:
-        """Check if error represents natural speech patterns"""
-        # Common speech patterns that shouldn't be flagged
-        natural_patterns = [
-            'um', 'uh', 'er', 'ah',        # Filler words
-            'like', 'you know', 'so',      # Common speech connectors
-            'well', 'actually', 'basically' # Discourse markers
-        ]
-
-        # Repetition patterns (common in speech)
-        if any(pattern in error_text.lower() for pattern in natural_patterns):
-            return True
-
-        # Check for natural repetition
-        words = error_text.lower().split()
-        if len(words) >= 2 and words[0] == words[1]:  # Word repetition
-            return True
-
-        return False
-
-    def _is_transcription_artifact(self, error_text: str, message: str) -> bool:
-        """Check if error is likely a transcription artifact"""
-        transcription_artifacts = [
-            'single letter errors',         # OCR/ASR single character mistakes
-            'missing space',                # Word concatenation
-            'extra space',                  # Word separation
-            'capitalization'                # Inconsistent caps from ASR
-        ]
-
-        # Very short errors (1-2 characters) are often transcription issues
-        if len(error_text.strip()) <= 2:
-            return True
-
-        return any(artifact in message for artifact in transcription_artifacts)
-
+    def _get_matches(self, text: str) -> List:
+        """LanguageTool matches for `text`, served per sentence from the match cache when enabled"""
+        if self.match_cache is None:
+            return self._check_sharded(text)
+        return self.match_cache.check(text, self._check_sharded)
+    
+    def _check_sharded(self, text: str) -> List:
+        """Long texts go to the LanguageTool pool as concurrent sentence batches (offsets rebased)"""
+        workers = Config.GRAMMAR_SHARD_WORKERS or Config.LANGUAGE_TOOL_CONNECTIONS
+        return check_sharded(text, self.language_tool.check, Config.GRAMMAR_SHARD_CHARS, workers)
+    
     def _categorize_error_severity_for_speech(self, category: str, rule_id: str) -> str:
         """Categorize error severity specifically for speech context - GRAMMAR ONLY"""
         # More lenient severity for speech - ONLY GRAMMAR MATTERS
@@ -3797,7 +3723,10 @@ class HybridGrammarChecker:
             return 'low'
 
     def _speech_aware_correction(self, text: str, errors: List[Dict]) -> str:
-        """Apply only appropriate corrections for speech context - GRAMMAR ONLY"""
+        """
+        Apply only appropriate corrections for speech context - GRAMMAR ONLY.
+        `errors` are the already filtered (no spelling, speech-appropriate) LanguageTool errors.
+        """
         # For speech, only apply corrections for:
         # 1. Clear grammatical errors (verb tense, subject-verb agreement)
         # 2. Obvious grammatical mistakes (NOT spelling)
@@ -3813,21 +3742,13 @@ class HybridGrammarChecker:
 
         # Only apply corrections for high-confidence, speech-appropriate grammar rules
         try:
-            if self.local_available:
-                # Get all matches again
-                matches = self.language_tool.check(text)
-
-                # Filter to only speech-appropriate corrections
-                for match in reversed(matches):  # Reverse to maintain offsets
-                    if (match.ruleId in high_confidence_rules and 
-                        not self._is_spelling_error(match) and  # Skip spelling
-                        not self._should_ignore_error(match, text) and
-                        match.replacements):
-
-                        # Apply the correction
-                        start = match.offset
-                        end = match.offset + match.errorLength
-                        corrected = corrected[:start] + match.replacements[0] + corrected[end:]
+            for error in reversed(errors):  # Reverse to maintain offsets
+                if error['rule_id'] in high_confidence_rules and error['suggestions']:
+
+                    # Apply the correction
+                    start = error['offset']
+                    end = error['offset'] + error['length']
+                    corrected = corrected[:start] + error['suggestions'][0] + corrected[end:]
 
         except Exception:
             return text  # Return original if correction fails
@@ -3836,12 +3757,40 @@ class HybridGrammarChecker:
 
     def _check_with_azure_openai(self, text: str, local_results: Dict) -> Dict:
         """Enhanced grammar analysis using Azure OpenAI - GRAMMAR ONLY"""
-        error_count = local_results.get('error_count', 0)
+        prompt = self._build_ai_prompt(text, local_results.get('filler_count', 0))
+        raw_content = ""
+        try:
+            response = self.azure_llm.invoke([HumanMessage(content=prompt)])
+            raw_content = response.content.strip()
+            return self._parse_ai_response(raw_content)
+        except Exception as e:
+            print(f"Azure parsing/extraction error: {e}")
+            return self._parse_ai_response_fallback(raw_content)
+
+    async def _acheck_with_azure_openai(self, text: str, filler_count: int) -> Dict:
+        """
+        Async variant of _check_with_azure_openai (cancellable while the request is in flight).
+        A failed request raises, so the caller falls back to the local results.
+        """
+        prompt = self._build_ai_prompt(text, filler_count)
+        response = await self.azure_llm.ainvoke([HumanMessage(content=prompt)])
+        raw_content = response.content.strip()
+        try:
+            return self._parse_ai_response(raw_content)
+        except Exception as e:
+            print(f"Azure parsing/extraction error: {e}")
+            return self._parse_ai_response_fallback(raw_content)
+
+    @staticmethod
+    def _build_ai_prompt(text: str, filler_count: int) -> str:
+        """
+        Grammar assessment prompt. It leaves out the local error count so the
+        request can start before LanguageTool has finished.
+        """
         word_count = len(text.split())
-        filler_count = local_results.get('filler_count', 0)
 
         # Updated prompt to focus ONLY on grammar, completely ignore spelling
-        prompt = f"""
+        return f"""
 You are an expert English grammar assessor. Respond *only* with valid JSON—no extra explanation, no markdown fences, no comments.
 
 Analyze this interview transcript for GRAMMAR ONLY (completely ignore spelling and word choice). Provide a JSON object with these exact keys:
@@ -3857,7 +3806,7 @@ Analyze this interview transcript for GRAMMAR ONLY (completely ignore spelling a
 TEXT TO ANALYZE: "{text}"
 
 CONTEXT:
-- Local grammar tool flagged {error_count} grammar issues in {word_count} words.
+- The transcript has {word_count} words.
 - {filler_count} filler words were detected and removed from the original text.
 - Focus ONLY on: verb tenses, subject-verb agreement, sentence structure, punctuation for clarity, grammar rules.
 - COMPLETELY IGNORE: spelling errors, word choice, vocabulary, proper names.
@@ -3866,23 +3815,16 @@ CONTEXT:
 - Do NOT output anything other than a single JSON object with those five keys.
 """
 
-        try:
-            message = HumanMessage(content=prompt)
-            response = self.azure_llm.invoke([message])
-            raw_content = response.content.strip()
-
-            # Extract JSON
-            json_substr = _extract_json_from_text(raw_content)
-            if not json_substr:
-                raise ValueError("No JSON object found in LLM response.")
-
-            # Parse it
-            ai_analysis = json.loads(json_substr)
-            return ai_analysis
+    @staticmethod
+    def _parse_ai_response(raw_content: str) -> Dict:
+        """JSON object of the LLM response; raises ValueError if there is none"""
+        # Extract JSON
+        json_substr = _extract_json_from_text(raw_content)
+        if not json_substr:
+            raise ValueError("No JSON object found in LLM response.")
 
-        except Exception as e:
-            print(f"Azure parsing/extraction error: {e}")
-            return self._parse_ai_response_fallback(raw_content if 'raw_content' in locals() else "")
+        # Parse it
+        return json.loads(json_substr)
 
     def _parse_ai_response_fallback(self, raw: str) -> Dict:
         """Fallback parser when we cannot extract valid JSON from the LLM."""
@@ -3913,6 +3855,7 @@ CONTEXT:
             'error_count': local_results.get('error_count', 0),
             'filler_count': filler_count,
             'filler_rate': round((filler_count / original_word_count * 100), 1) if original_word_count > 0 else 0,
+            'filler_breakdown': local_results.get('filler_breakdown', {}),
             'word_count': word_count,
             'original_word_count': original_word_count,
             'sentence_count': sentence_count,
@@ -3951,6 +3894,7 @@ CONTEXT:
             'error_count': error_count,
             'filler_count': filler_count,
             'filler_rate': round((filler_count / original_word_count * 100), 1) if original_word_count > 0 else 0,
+            'filler_breakdown': local_results.get('filler_breakdown', {}),
             'word_count': word_count,
             'original_word_count': original_word_count,
             'sentence_count': sentence_count,
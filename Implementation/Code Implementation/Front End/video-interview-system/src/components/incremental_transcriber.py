@@ -0,0 +1,157 @@
+import os
+import sys
+import threading
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.media_ingest import SAMPLE_RATE
+from components.vad import detect_speech, noise_floor_db, quietest_point
+
+
+class IncrementalTranscriber:
+    """
+    Transcribes a recording while it is still being captured.
+
+    The recorder's audio callback hands every block to `feed` (an append, no
+    work on the audio thread). A background worker buffers the audio and, once
+    INCREMENTAL_MIN_CHUNK_SECONDS are pending, transcribes everything up to the
+    last finished pause and drops it from the buffer. Without a pause the
+    buffer is cut at its quietest point when it reaches TRANSCRIPTION_CHUNK_SECONDS.
+    After `finish` only the audio since the last pause is left to transcribe;
+    `result` waits for it and returns the assembled {'text', 'segments'}.
+    """
+
+    def __init__(self, transcription, sample_rate=SAMPLE_RATE):
+        self.transcription = transcription
+        self.sample_rate = sample_rate
+        self.min_chunk = int(Config.INCREMENTAL_MIN_CHUNK_SECONDS * sample_rate)
+        self.max_chunk = int(Config.TRANSCRIPTION_CHUNK_SECONDS * sample_rate)
+        # A region is finished once this much audio follows it (VAD could still extend it otherwise)
+        self.guard = int((Config.VAD_MIN_SILENCE + Config.VAD_PADDING) * sample_rate)
+
+        self._pending = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._finishing = False
+        self._thread = None
+
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._offset = 0            # samples already transcribed (or skipped as silence)
+        # Quietest level seen so far: a buffer of continuous speech has no pause to estimate it from
+        self._noise_floor = None
+        self._texts = []
+        self._segments = []
+        self._failed = False
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def feed(self, samples):
+        """Queue captured mono samples (called from the audio callback)"""
+        with self._lock:
+            self._pending.append(np.array(samples, dtype=np.float32).reshape(-1))
+        self._wake.set()
+
+    def finish(self):
+        """No more audio: the worker transcribes what is left and exits"""
+        self._finishing = True
+        self._wake.set()
+
+    def result(self, timeout=None):
+        """
+        Wait for the final chunk; returns {'text', 'segments'}, or None if transcription
+        failed or no speech was detected (callers then transcribe the whole recording)
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                print("Incremental transcription did not finish in time")
+                return None
+        if self._failed or not self._texts:
+            return None
+        return {'text': " ".join(t for t in self._texts if t), 'segments': list(self._segments)}
+
+    def transcribe_blocks(self, blocks):
+        """
+        Transcribe a finished recording given as blocks (e.g. media_ingest.iter_audio_blocks)
+        on the calling thread, chunked exactly as while recording, so only the pending
+        chunk is ever held. Returns what `result` returns.
+        """
+        try:
+            for block in blocks:
+                self.feed(block)
+                self._drain()
+                while len(self._buffer) >= self.min_chunk and self._commit_ready():
+                    pass
+            self._transcribe(len(self._buffer), self._detect())
+        except Exception as e:
+            print(f"Incremental transcription failed: {e}")
+            self._failed = True
+        return self.result()
+
+    def close(self):
+        """Stop the worker (if still running)"""
+        self.finish()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        while True:
+            self._wake.wait(0.5)
+            self._wake.clear()
+            finishing = self._finishing
+            self._drain()
+            try:
+                if finishing:
+                    self._transcribe(len(self._buffer), self._detect())
+                    return
+                while len(self._buffer) >= self.min_chunk and self._commit_ready():
+                    pass
+            except Exception as e:
+                print(f"Incremental transcription failed: {e}")
+                self._failed = True
+                return
+
+    def _drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self._buffer = np.concatenate([self._buffer] + pending)
+
+    def _commit_ready(self):
+        """Transcribe the buffer up to the last finished pause; False when there is none yet"""
+        regions = self._detect()
+        closed = regions[regions[:, 1] <= len(self._buffer) - self.guard]
+        if len(closed):
+            cut = int(closed[-1, 1])
+        elif len(regions) == 0:
+            cut = len(self._buffer) - self.guard  # only silence so far: skip it
+        elif len(self._buffer) >= self.max_chunk:
+            cut = quietest_point(self._buffer, self.max_chunk // 2, self.max_chunk, self.sample_rate)
+        else:
+            return False
+
+        head = regions[regions[:, 0] < cut].copy()
+        head[:, 1] = np.minimum(head[:, 1], cut)
+        self._transcribe(cut, head)
+        return True
+
+    def _detect(self):
+        """Speech regions of the buffer, judged against the recording's noise floor so far"""
+        if len(self._buffer) == 0:
+            return np.zeros((0, 2), dtype=np.int64)
+        floor = noise_floor_db(self._buffer)
+        self._noise_floor = floor if self._noise_floor is None else min(self._noise_floor, floor)
+        return detect_speech(self._buffer, self.sample_rate, noise_floor=self._noise_floor)
+
+    def _transcribe(self, cut, regions):
+        if len(regions):
+            result = self.transcription.transcribe_chunked(self._buffer[:cut], regions=regions)
+            start = self._offset / self.sample_rate
+            self._texts.append(result['text'])
+            self._segments.extend(dict(s, start=s['start'] + start, end=s['end'] + start) for s in result['segments'])
+        self._buffer = self._buffer[cut:]
+        self._offset += cut
@@ -0,0 +1,226 @@
+import os
+import sys
+import time
+import atexit
+import threading
+import subprocess
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+
+SERVER_CLASS = "org.languagetool.server.HTTPServer"
+SERVER_JAR = "languagetool-server.jar"
+
+
+class LTMatch:
+    """A LanguageTool match parsed from /v2/check JSON (same attributes as language_tool_python.Match)"""
+
+    def __init__(self, attrib: dict):
+        rule = attrib['rule']
+        context = attrib['context']
+        self.ruleId = rule['id']
+        self.category = rule['category']['id']
+        self.ruleIssueType = rule.get('issueType', '')
+        self.message = attrib['message']
+        self.replacements = [r['value'] for r in attrib.get('replacements', [])]
+        self.offset = attrib['offset']
+        self.errorLength = attrib['length']
+        self.context = context['text']
+        self.offsetInContext = context['offset']
+        self.sentence = attrib.get('sentence', '')
+
+    def __repr__(self):
+        return f"LTMatch({self.ruleId!r}, offset={self.offset}, errorLength={self.errorLength})"
+
+
+def language_tool_directory() -> str:
+    """Unpacked LanguageTool release (Config.LANGUAGE_TOOL_DIR, else language_tool_python's download)"""
+    if Config.LANGUAGE_TOOL_DIR:
+        return str(Config.LANGUAGE_TOOL_DIR)
+    from language_tool_python.download_lt import download_lt
+    from language_tool_python.utils import get_language_tool_directory
+    download_lt()
+    return str(get_language_tool_directory())
+
+
+class LanguageToolServer:
+    """
+    One LanguageTool HTTP server. Managed servers (with a port) are started on
+    demand as a Java process, stopped when this process exits; if the port
+    already answers, e.g. a server started by another worker process, that
+    server is used instead.
+    """
+
+    def __init__(self, url: str, port: Optional[int] = None):
+        self.url = url.rstrip('/')
+        self.port = port
+        self.process = None
+        self.healthy = False
+        self.last_checked = 0.0
+        self.reviving = False
+        self._stop_registered = False
+        self._lock = threading.Lock()
+
+    @property
+    def managed(self) -> bool:
+        return self.port is not None
+
+    def is_healthy(self, session=None) -> bool:
+        """True if the server answers /v2/languages"""
+        try:
+            response = (session or requests).get(f"{self.url}/v2/languages", timeout=2)
+            self.healthy = response.ok
+        except requests.RequestException:
+            self.healthy = False
+        self.last_checked = time.time()
+        return self.healthy
+
+    def ensure_running(self, session=None) -> bool:
+        """Health-check the server and (re)start it if it is managed and down"""
+        with self._lock:
+            if self.is_healthy(session):
+                return True
+            if not self.managed:
+                return False
+            self._start()
+            deadline = time.time() + Config.LANGUAGE_TOOL_START_TIMEOUT
+            while time.time() < deadline:
+                time.sleep(0.5)
+                if self.is_healthy(session):
+                    print(f"LanguageTool server ready at {self.url}")
+                    return True
+                if self.process is not None and self.process.poll() is not None:
+                    # Lost the port to another process starting the same server; keep waiting for it
+                    self.process = None
+            print(f"LanguageTool server at {self.url} did not start within {Config.LANGUAGE_TOOL_START_TIMEOUT}s")
+            return False
+
+    def _start(self):
+        directory = language_tool_directory()
+        command = [Config.LANGUAGE_TOOL_JAVA, *Config.LANGUAGE_TOOL_JAVA_OPTS,
+                   "-cp", os.path.join(directory, SERVER_JAR), SERVER_CLASS, "--port", str(self.port)]
+        print(f"Starting LanguageTool server on port {self.port}...")
+        # Own session so a Ctrl+C in the terminal does not kill it mid-check; it is stopped at exit instead
+        self.process = subprocess.Popen(
+            command, cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+        )
+        if not self._stop_registered:
+            atexit.register(self.stop)
+            self._stop_registered = True
+
+    def stop(self):
+        """Stop the server if this process started it"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+class LanguageToolPool:
+    """
+    Client for a pool of LanguageTool servers, used in place of
+    language_tool_python.LanguageTool (same `check(text)` call).
+
+    Requests go round-robin over the healthy servers through one requests.Session
+    whose keep-alive connection pool is shared by all threads. A server that fails
+    is health-checked (and restarted if managed) in the background, at most every
+    LANGUAGE_TOOL_HEALTH_INTERVAL seconds, while requests move on to the others.
+    Only when no server is healthy does a request wait for a restart.
+    """
+
+    def __init__(self, servers: List[LanguageToolServer], language: str = 'en-US'):
+        if not servers:
+            raise ValueError("LanguageToolPool needs at least one server")
+        self.servers = servers
+        self.language = language
+        self._next = 0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(servers), pool_maxsize=Config.LANGUAGE_TOOL_CONNECTIONS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_config(cls, language: str = 'en-US'):
+        """External servers from LANGUAGE_TOOL_URLS, else LANGUAGE_TOOL_SERVERS managed local servers"""
+        if Config.LANGUAGE_TOOL_URLS:
+            servers = [LanguageToolServer(url) for url in Config.LANGUAGE_TOOL_URLS]
+        else:
+            ports = range(Config.LANGUAGE_TOOL_PORT, Config.LANGUAGE_TOOL_PORT + max(1, Config.LANGUAGE_TOOL_SERVERS))
+            servers = [LanguageToolServer(f"http://127.0.0.1:{port}", port) for port in ports]
+        return cls(servers, language)
+
+    def start(self):
+        """Bring every server up (managed ones are started in parallel); fails if none is reachable"""
+        threads = [threading.Thread(target=server.ensure_running, args=(self.session,)) for server in self.servers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if not any(server.healthy for server in self.servers):
+            raise RuntimeError("No LanguageTool server available")
+        return self
+
+    def check(self, text: str) -> List[LTMatch]:
+        last_error = None
+        servers = self._rotation()
+        for server in servers:
+            if not server.healthy and time.time() - server.last_checked >= Config.LANGUAGE_TOOL_HEALTH_INTERVAL:
+                self._revive(server)
+        for server in [s for s in servers if s.healthy] or servers:
+            if not server.healthy and not server.ensure_running(self.session):
+                continue
+            try:
+                response = self.session.post(
+                    f"{server.url}/v2/check",
+                    data={'language': self.language, 'text': text},
+                    timeout=Config.LANGUAGE_TOOL_REQUEST_TIMEOUT
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                print(f"LanguageTool server {server.url} failed: {e}")
+                server.healthy = False
+                self._revive(server)
+                last_error = e
+                continue
+            response.raise_for_status()
+            return [LTMatch(match) for match in response.json()['matches']]
+        raise RuntimeError(f"No LanguageTool server available: {last_error}")
+
+    def _revive(self, server: LanguageToolServer):
+        """Health-check / restart `server` on a background thread (one at a time per server)"""
+        with self._lock:
+            if server.reviving:
+                return
+            server.reviving = True
+
+        def _run():
+            try:
+                server.ensure_running(self.session)
+            finally:
+                server.reviving = False
+
+        threading.Thread(target=_run, name="language-tool-revive", daemon=True).start()
+
+    def _rotation(self) -> List[LanguageToolServer]:
+        """Every server once, starting at the next one in round-robin order"""
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.servers)
+        return self.servers[start:] + self.servers[:start]
+
+    def status(self) -> Dict[str, bool]:
+        return {server.url: server.is_healthy(self.session) for server in self.servers}
+
+    def close(self):
+        """Close pooled connections and stop the servers this process started"""
+        self.session.close()
+        for server in self.servers:
+            server.stop()
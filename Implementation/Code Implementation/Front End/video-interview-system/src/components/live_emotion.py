@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import threading
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.media_ingest import SAMPLE_RATE
+from components.vad import detect_speech
+
+
+class LiveEmotionMeter:
+    """
+    Background consumer that classifies the most recent model window of the
+    recorder's audio ring every `interval_ms` and publishes the distribution.
+
+    Each update is timed. When an update exceeds `budget_ms` the interval is
+    doubled (up to LIVE_EMOTION_MAX_BACKOFF times the base) and it recovers
+    gradually once updates fit again; the thread also never spends more than
+    LIVE_EMOTION_MAX_DUTY of wall time working, so capture is never starved.
+    """
+
+    def __init__(self, analyzer, ring, interval_ms=None, budget_ms=None):
+        self.analyzer = analyzer
+        self.ring = ring
+        self.base_interval = (interval_ms or Config.LIVE_EMOTION_INTERVAL_MS) / 1000.0
+        self.budget = (budget_ms or Config.LIVE_EMOTION_BUDGET_MS) / 1000.0
+        self.interval = self.base_interval
+        self.window = analyzer.window_length()
+        self._state = {
+            'distribution': {},
+            'dominant_emotion': None,
+            'speech': False,
+            'updated_at': None,
+            'latency_ms': 0.0,
+            'interval_ms': self.interval * 1000,
+            'overruns': 0,
+        }
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_total = 0
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the loop"""
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+    def latest(self):
+        """Snapshot of the most recently published state"""
+        with self._lock:
+            return dict(self._state)
+
+    def _run(self):
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                self._update()
+            except Exception as e:
+                print(f"Live emotion update failed: {e}")
+            elapsed = time.perf_counter() - start
+
+            # Enforce the budget: back off while updates are too slow, recover when they fit
+            if elapsed > self.budget:
+                self.interval = min(self.interval * 2, self.base_interval * Config.LIVE_EMOTION_MAX_BACKOFF)
+                with self._lock:
+                    self._state['overruns'] += 1
+            elif self.interval > self.base_interval:
+                self.interval = max(self.base_interval, self.interval * 0.8)
+
+            # Never busy more than the duty limit, whatever the interval
+            duty_sleep = elapsed * (1.0 - Config.LIVE_EMOTION_MAX_DUTY) / Config.LIVE_EMOTION_MAX_DUTY
+            with self._lock:
+                self._state['interval_ms'] = self.interval * 1000
+            self._stop.wait(max(self.interval - elapsed, duty_sleep))
+
+    def _update(self):
+        total = self.ring.total_written
+        if total == self._last_total or total < SAMPLE_RATE * 0.5:
+            return  # no new audio, or not enough yet
+        self._last_total = total
+
+        start = time.perf_counter()
+        y = self.ring.latest(self.window)
+        if len(detect_speech(y, SAMPLE_RATE)) == 0:
+            self._publish({}, None, speech=False, latency=time.perf_counter() - start)
+            return
+
+        features = self.analyzer.extract_features_fixed(y, SAMPLE_RATE)[None, :]
+        X = self.analyzer.scaler.transform(features)[..., None].astype(np.float32)
+        probs = self.analyzer.predict_batched(X)[0]
+        labels = self.analyzer.encoder.categories_[0]
+        distribution = {str(label): float(p) for label, p in zip(labels, probs)}
+        self._publish(distribution, str(labels[int(np.argmax(probs))]), speech=True,
+                      latency=time.perf_counter() - start)
+
+    def _publish(self, distribution, dominant, speech, latency):
+        with self._lock:
+            self._state.update({
+                'distribution': distribution if speech else self._state['distribution'],
+                'dominant_emotion': dominant if speech else self._state['dominant_emotion'],
+                'speech': speech,
+                'updated_at': time.time(),
+                'latency_ms': latency * 1000,
+            })
@@ -0,0 +1,150 @@
+import os
+import wave
+import subprocess
+import numpy as np
+
+SAMPLE_RATE = 16000  # Whisper and the emotion model both expect 16 kHz mono
+
+
+class DecodedAudio:
+    """Mono float32 PCM for one recording, decoded once and shared by every analysis stage"""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE, source: str = None):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.source = source
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def has_audio(self) -> bool:
+        return self.samples.size > 0
+
+
+def pcm16_to_float32(pcm: np.ndarray) -> np.ndarray:
+    """Scale int16 PCM to float32 in [-1, 1) the same way librosa/whisper do"""
+    return pcm.astype(np.float32) / 32768.0
+
+
+def decode_audio(media_path, sample_rate: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    Decode the audio track of `media_path` to mono PCM in memory.
+
+    ffmpeg writes raw s16le samples to stdout, which are wrapped without a copy
+    by `np.frombuffer`; the only copy is the single int16 -> float32 conversion.
+    A file without an audio stream yields an empty buffer instead of an error.
+    """
+    proc = _start_ffmpeg_pcm(media_path, sample_rate)
+    raw, err = proc.communicate()
+    if proc.returncode != 0:
+        if _is_missing_audio(err):
+            return DecodedAudio(np.zeros(0, dtype=np.float32), sample_rate, str(media_path))
+        raise RuntimeError(f"Failed to decode audio. FFmpeg error: {err.decode('utf-8', errors='replace')}")
+
+    pcm = np.frombuffer(raw, dtype=np.int16, count=len(raw) // 2)
+    return DecodedAudio(pcm16_to_float32(pcm), sample_rate, str(media_path))
+
+
+def _start_ffmpeg_pcm(media_path, sample_rate: int) -> subprocess.Popen:
+    """Start ffmpeg writing the audio of `media_path` as raw mono s16le PCM to stdout"""
+    if not os.path.exists(media_path):
+        raise FileNotFoundError(f"Media file not found: {media_path}")
+
+    cmd = [
+        'ffmpeg', '-nostdin', '-v', 'error',
+        '-i', os.path.abspath(media_path),
+        '-vn',                   # no video
+        '-f', 's16le',           # raw PCM on stdout
+        '-acodec', 'pcm_s16le',
+        '-ar', str(sample_rate),
+        '-ac', '1',              # mono
+        'pipe:1'
+    ]
+
+    try:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError as e:
+        raise RuntimeError(f"FFmpeg not found. Please install FFmpeg: {e}")
+
+
+def _is_missing_audio(stderr: bytes) -> bool:
+    message = stderr.decode('utf-8', errors='replace')
+    return 'does not contain any stream' in message or 'matches no streams' in message
+
+
+def load_audio(audio_path, sample_rate: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    Load the recorder's native PCM WAV directly (no ffmpeg, no lossy round trip).
+    Files that are not 16-bit mono at `sample_rate` go through `decode_audio`.
+    """
+    try:
+        with wave.open(str(audio_path), 'rb') as wf:
+            if wf.getnchannels() == 1 and wf.getsampwidth() == 2 and wf.getframerate() == sample_rate:
+                raw = wf.readframes(wf.getnframes())
+                pcm = np.frombuffer(raw, dtype=np.int16, count=len(raw) // 2)
+                return DecodedAudio(pcm16_to_float32(pcm), sample_rate, str(audio_path))
+    except (wave.Error, EOFError):
+        pass
+    return decode_audio(audio_path, sample_rate)
+
+
+def _open_native_wav(audio_path, sample_rate: int):
+    """Open `audio_path` with `wave` if it is 16-bit mono at `sample_rate`, else return None"""
+    try:
+        wf = wave.open(str(audio_path), 'rb')
+    except (wave.Error, EOFError, FileNotFoundError):
+        return None
+    if wf.getnchannels() == 1 and wf.getsampwidth() == 2 and wf.getframerate() == sample_rate:
+        return wf
+    wf.close()
+    return None
+
+
+def iter_audio_blocks(media_path, block_samples: int, sample_rate: int = SAMPLE_RATE):
+    """
+    Yield the audio of `media_path` as float32 blocks of `block_samples` (the last
+    one shorter) without ever holding the whole recording in memory. Native PCM
+    WAVs are read directly; anything else is streamed through an ffmpeg pipe.
+    """
+    wf = _open_native_wav(media_path, sample_rate)
+    if wf is not None:
+        with wf:
+            while True:
+                raw = wf.readframes(block_samples)
+                if not raw:
+                    return
+                yield pcm16_to_float32(np.frombuffer(raw, dtype=np.int16, count=len(raw) // 2))
+
+    proc = _start_ffmpeg_pcm(media_path, sample_rate)
+    try:
+        while True:
+            raw = proc.stdout.read(block_samples * 2)
+            if not raw:
+                break
+            yield pcm16_to_float32(np.frombuffer(raw, dtype=np.int16, count=len(raw) // 2))
+        err = proc.stderr.read()
+        if proc.wait() != 0 and not _is_missing_audio(err):
+            raise RuntimeError(f"Failed to decode audio. FFmpeg error: {err.decode('utf-8', errors='replace')}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def probe_duration(media_path) -> float:
+    """Duration in seconds, from the WAV header or ffprobe (0.0 if unknown)"""
+    wf = _open_native_wav(media_path, SAMPLE_RATE)
+    if wf is not None:
+        with wf:
+            return wf.getnframes() / wf.getframerate()
+    try:
+        res = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0',
+             os.path.abspath(media_path)],
+            capture_output=True, text=True
+        )
+        return float(res.stdout.strip() or 0.0)
+    except (FileNotFoundError, ValueError):
+        return 0.0
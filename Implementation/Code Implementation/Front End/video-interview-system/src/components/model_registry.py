@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Callable, Dict
+
+
+class _RegistryEntry:
+    """A model slot, loaded under its own lock"""
+
+    def __init__(self):
+        self.value = None
+        self.loaded = False
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of heavy models (Whisper, Keras, LanguageTool, FAISS...).
+
+    Models are loaded lazily on first `get`, at most once per process, and are
+    shared by every caller (Streamlit sessions and reruns included). They stay
+    loaded for the life of the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _RegistryEntry] = {}
+        self._warmup_thread = None
+
+    def get(self, key: str, loader: Callable):
+        """Return the shared instance for `key`, calling `loader` on first use"""
+        with self._lock:
+            entry = self._entries.setdefault(key, _RegistryEntry())
+
+        # Per-entry lock so one slow loader does not block unrelated models
+        with entry.lock:
+            if not entry.loaded:
+                print(f"Loading model '{key}'...")
+                start = time.time()
+                entry.value = loader()
+                entry.loaded = True
+                print(f"Model '{key}' loaded in {time.time() - start:.1f}s")
+            return entry.value
+
+    def warm_up_in_background(self, warm_fn: Callable) -> bool:
+        """
+        Run `warm_fn` on a daemon thread, at most once per process.
+        Returns False if a warm-up was already started (e.g. by an earlier rerun).
+        """
+        with self._lock:
+            if self._warmup_thread is not None:
+                return False
+            self._warmup_thread = threading.Thread(target=warm_fn, name="model-warm-up", daemon=True)
+            self._warmup_thread.start()
+        return True
+
+
+# Single process-global registry. Module state survives Streamlit reruns and is
+# shared by every browser session served by the same process.
+registry = ModelRegistry()
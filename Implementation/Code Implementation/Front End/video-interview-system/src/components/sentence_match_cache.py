@@ -0,0 +1,114 @@
+import re
+import copy
+import bisect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+# A sentence runs from a non-space character to terminal punctuation followed by
+# whitespace (so "3.5" or "node.js" do not split) or to the end of the text.
+# Abbreviations are not recognized: "e.g. far" splits after "e.g."
+SENTENCE_RE = re.compile(r'\S.*?(?:[.!?]+(?=\s|$)|$)', re.S)
+
+
+def sentence_spans(text: str) -> List[Tuple[int, str]]:
+    """(offset, sentence) for every sentence of `text`"""
+    return [(m.start(), m.group()) for m in SENTENCE_RE.finditer(text) if m.group()]
+
+
+def rebase_match(match, offset: int):
+    """Copy of a LanguageTool match moved to `offset`"""
+    moved = copy.copy(match)
+    moved.offset = offset
+    return moved
+
+
+def sentence_batches(spans: List[Tuple[int, str]], max_chars: int) -> List[Tuple[int, int]]:
+    """
+    (start, end) of runs of consecutive sentences of at most about `max_chars`
+    characters each (a longer sentence is a batch of its own)
+    """
+    batches = []
+    for start, sentence in spans:
+        end = start + len(sentence)
+        if batches and end - batches[-1][0] <= max_chars:
+            batches[-1] = (batches[-1][0], end)
+        else:
+            batches.append((start, end))
+    return batches
+
+
+def check_sharded(text: str, check_fn: Callable[[str], List], max_chars: int, workers: int) -> List:
+    """
+    LanguageTool matches for `text`, checked as sentence batches of about
+    `max_chars` characters sent concurrently, with offsets rebased onto `text`.
+    Texts that fit in one batch are checked with a single call.
+    """
+    batches = sentence_batches(sentence_spans(text), max_chars)
+    if len(batches) <= 1:
+        return check_fn(text)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+        results = executor.map(check_fn, [text[start:end] for start, end in batches])
+        return [rebase_match(match, start + match.offset) for (start, _), matches in zip(batches, results) for match in matches]
+
+
+class SentenceMatchCache:
+    """
+    Bounded LRU of LanguageTool matches per sentence (offsets relative to the sentence).
+
+    `check` splits a text into sentences, sends only the sentences it has not seen
+    to LanguageTool (joined into one text) and rebases the cached matches onto
+    the text. Matches spanning two sentences of a request are dropped, since they
+    depend on neighbours that differ from text to text.
+    """
+
+    def __init__(self, max_sentences: int = 5000):
+        self.max_sentences = max_sentences
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def check(self, text: str, check_fn: Callable[[str], List]) -> List:
+        spans = sentence_spans(text)
+        sentences = list(dict.fromkeys(sentence for _, sentence in spans))
+
+        with self._lock:
+            known = {}
+            for sentence in sentences:
+                if sentence in self._entries:
+                    self._entries.move_to_end(sentence)
+                    known[sentence] = self._entries[sentence]
+            self.hits += len(known)
+        missing = [s for s in sentences if s not in known]
+
+        if missing:
+            found = self._check_sentences(missing, check_fn)
+            known.update(found)
+            with self._lock:
+                self.misses += len(missing)
+                self._entries.update(found)
+                while len(self._entries) > self.max_sentences:
+                    self._entries.popitem(last=False)
+
+        return [rebase_match(match, start + match.offset) for start, sentence in spans for match in known[sentence]]
+
+    @staticmethod
+    def _check_sentences(sentences: List[str], check_fn: Callable[[str], List]) -> dict:
+        """One LanguageTool request for all `sentences`; matches split back per sentence"""
+        batch = " ".join(sentences)
+        starts, position = [], 0
+        for sentence in sentences:
+            starts.append(position)
+            position += len(sentence) + 1
+
+        found = {sentence: [] for sentence in sentences}
+        for match in check_fn(batch):
+            i = bisect.bisect_right(starts, match.offset) - 1
+            offset = match.offset - starts[i]
+            if offset + match.errorLength > len(sentences[i]):
+                continue  # crosses into the next sentence
+            found[sentences[i]].append(rebase_match(match, offset))
+        return found
@@ -0,0 +1,76 @@
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+
+
+def _phrase_regex(phrases) -> re.Pattern:
+    """One alternation matching any of `phrases` as a substring (never matches if there are none)"""
+    if not phrases:
+        return re.compile(r'(?!)')
+    # Longest first so overlapping phrases cannot shadow each other
+    return re.compile("|".join(re.escape(p) for p in sorted(set(phrases), key=len, reverse=True)))
+
+
+class SpeechRuleFilter:
+    """
+    Decides which LanguageTool matches to drop for spoken answers: spelling,
+    casual punctuation, overly formal rules, transcription artifacts and natural
+    speech patterns.
+
+    The filter table comes from Config (GRAMMAR_SPEECH_FILTERS and friends) and
+    is compiled once into frozensets of categories / rule IDs and one regex over
+    the lower-cased message. The rule-level decision is memoized per
+    (ruleId, category, message); only the checks on the flagged text run per match.
+    """
+
+    def __init__(self, filters: dict = None, natural_patterns=None, memo_size: int = None):
+        filters = Config.GRAMMAR_SPEECH_FILTERS if filters is None else filters
+        natural_patterns = Config.GRAMMAR_NATURAL_SPEECH_PATTERNS if natural_patterns is None else natural_patterns
+
+        self.categories = frozenset(c for group in filters.values() for c in group.get('categories', ()))
+        self.rule_ids = frozenset(r for group in filters.values() for r in group.get('rule_ids', ()))
+        self.message_re = _phrase_regex([m for group in filters.values() for m in group.get('messages', ())])
+        # Spelling-like messages on a capitalized word (usually a name)
+        self.capitalized_re = _phrase_regex(Config.GRAMMAR_CAPITALIZED_SPELLING_MESSAGES)
+        self.natural_re = _phrase_regex(natural_patterns)
+        self.artifact_max_length = Config.GRAMMAR_ARTIFACT_MAX_LENGTH
+
+        self._decide_rule = lru_cache(maxsize=memo_size or Config.GRAMMAR_RULE_MEMO_SIZE)(self._decide_rule)
+
+    def _decide_rule(self, rule_id: str, category: str, message: str) -> Tuple[bool, bool]:
+        """(drop whatever the text, drop if the flagged word is capitalized)"""
+        message = message.lower()
+        if category in self.categories or rule_id in self.rule_ids or self.message_re.search(message):
+            return True, False
+        return False, bool(self.capitalized_re.search(message))
+
+    def should_drop(self, match, text: str) -> bool:
+        """True if `match` (a LanguageTool match on `text`) should not count for speech"""
+        drop, drop_if_capitalized = self._decide_rule(match.ruleId, match.category, match.message)
+        if drop:
+            return True
+
+        if drop_if_capitalized:
+            flagged = match.context[match.offset:match.offset + match.errorLength]
+            if flagged and flagged[0].isupper():
+                return True
+
+        error_text = text[match.offset:match.offset + match.errorLength].strip()
+        # Very short errors (1-2 characters) are usually transcription artifacts
+        if len(error_text) <= self.artifact_max_length:
+            return True
+
+        lowered = error_text.lower()
+        if self.natural_re.search(lowered):
+            return True
+        # Natural repetition ("I I think")
+        words = lowered.split(None, 2)
+        return len(words) >= 2 and words[0] == words[1]
+
+    def memo_info(self):
+        return self._decide_rule.cache_info()
@@ -0,0 +1,88 @@
+import threading
+import numpy as np
+
+
+def interpreter_class():
+    """
+    Return a TFLite Interpreter class, preferring the standalone runtimes so
+    TensorFlow itself is never imported.
+    """
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        # Still works, but without the import-time/RSS savings of the standalone runtime
+        import tensorflow as tf
+        return tf.lite.Interpreter
+    except ImportError:
+        raise RuntimeError("No TFLite runtime found. Install it with: pip install tflite-runtime")
+
+
+class TFLiteRunner:
+    """
+    Fixed-batch TFLite model with a numpy-in / numpy-out call.
+
+    A call's batch must have one of the sizes in `batch_sizes`. The interpreter
+    is allocated for the largest one up front and its input tensor resized when
+    the batch size changes, which reuses that arena (well under a millisecond,
+    and one interpreter's memory instead of one per size). Quantized (int8)
+    inputs/outputs are converted with the tensor's scale and zero point, so
+    callers always pass and get float32. Calls are serialized because an
+    interpreter is not thread-safe.
+    """
+
+    def __init__(self, model_path, batch_sizes, num_threads: int = None):
+        Interpreter = interpreter_class()
+        self.model_path = str(model_path)
+        self.batch_sizes = sorted(batch_sizes)
+        self.interpreter = Interpreter(model_path=self.model_path, num_threads=num_threads)
+
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = None
+        self._lock = threading.Lock()
+        self._resize(self.batch_sizes[-1])
+
+    def _resize(self, batch_size: int):
+        if batch_size == self._batch_size:
+            return
+        if batch_size not in self.batch_sizes:
+            raise ValueError(f"Batch size {batch_size} not in {self.batch_sizes}")
+        shape = list(self._input['shape'])
+        shape[0] = batch_size
+        self.interpreter.resize_tensor_input(self._input['index'], shape)
+        self.interpreter.allocate_tensors()
+        self._batch_size = batch_size
+
+    @property
+    def input_dtype(self):
+        return self._input['dtype']
+
+    def _quantize(self, x: np.ndarray) -> np.ndarray:
+        dtype = self._input['dtype']
+        if dtype == np.float32:
+            return x.astype(np.float32, copy=False)
+        scale, zero_point = self._input['quantization']
+        info = np.iinfo(dtype)
+        return np.clip(np.round(x / scale + zero_point), info.min, info.max).astype(dtype)
+
+    def _dequantize(self, y: np.ndarray) -> np.ndarray:
+        if self._output['dtype'] == np.float32:
+            return y
+        scale, zero_point = self._output['quantization']
+        return (y.astype(np.float32) - zero_point) * scale
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        with self._lock:
+            self._resize(len(batch))
+            self.interpreter.set_tensor(self._input['index'], self._quantize(batch))
+            self.interpreter.invoke()
+            # Copy out: the output buffer is overwritten by the next invoke
+            return np.array(self._dequantize(self.interpreter.get_tensor(self._output['index'])))
@@ -0,0 +1,69 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+
+# Fraction of CPU_THREADS given to a stage when its THREADS_* setting is None
+DEFAULT_SHARES = {
+    'whisper': 0.5,     # torch / CTranslate2
+    'emotion': 0.25,    # TensorFlow intra-op / TFLite
+    'blas': 0.25,       # numpy / scipy BLAS (librosa, scikit-learn)
+}
+BLAS_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "VECLIB_MAXIMUM_THREADS")
+
+_configured = set()
+
+
+def stage_threads(stage: str) -> int:
+    """Threads the CPU budget in Config assigns to `stage` ('whisper', 'emotion' or 'blas')"""
+    explicit = {
+        'whisper': Config.THREADS_WHISPER,
+        'emotion': Config.THREADS_EMOTION,
+        'blas': Config.THREADS_BLAS,
+    }[stage]
+    if explicit:
+        return explicit
+    total = Config.CPU_THREADS or os.cpu_count() or 1
+    return max(1, int(total * DEFAULT_SHARES[stage]))
+
+
+def configure_torch():
+    """Limit torch to the Whisper share (call before the first forward pass)"""
+    if 'torch' in _configured:
+        return
+    import torch
+    torch.set_num_threads(stage_threads('whisper'))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # can only be set once, before any inter-op work
+    _configured.add('torch')
+
+
+def configure_tensorflow():
+    """Limit TensorFlow intra/inter-op pools (only effective before the runtime starts)"""
+    if 'tensorflow' in _configured:
+        return
+    import tensorflow as tf
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(stage_threads('emotion'))
+        tf.config.threading.set_inter_op_parallelism_threads(Config.THREADS_TF_INTER_OP)
+    except RuntimeError as e:
+        print(f"TensorFlow thread budget not applied: {e}")
+    _configured.add('tensorflow')
+
+
+def configure_blas():
+    """Limit BLAS/OpenMP pools of the already loaded libraries and of libraries/processes started later"""
+    if 'blas' in _configured:
+        return
+    threads = str(stage_threads('blas'))
+    for var in BLAS_ENV_VARS:
+        os.environ.setdefault(var, threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=int(threads), user_api='blas')
+    except ImportError:
+        pass
+    _configured.add('blas')
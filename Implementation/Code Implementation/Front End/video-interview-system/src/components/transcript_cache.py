@@ -0,0 +1,76 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Optional
+
+import numpy as np
+
+INDEX_FILENAME = "transcripts.sqlite"
+
+
+def audio_digest(samples: np.ndarray) -> str:
+    """sha256 of the float32 PCM samples"""
+    return hashlib.sha256(np.ascontiguousarray(samples, dtype=np.float32).tobytes()).hexdigest()
+
+
+class TranscriptCache:
+    """
+    Local, size-bounded store of transcription results ({'text', 'segments'},
+    segments optionally carrying word timestamps) keyed by audio content and
+    transcription settings.
+
+    Results are stored as JSON rows in SQLite with their size and last-use time.
+    When the stored total exceeds `max_bytes`, least recently used rows are evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, INDEX_FILENAME), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(digest: str, settings: dict) -> str:
+        """Combine the audio digest with everything that can change the transcript"""
+        payload = f"{digest}\0{json.dumps(settings, sort_keys=True, default=str)}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict):
+        """Store a result, then evict least recently used rows beyond `max_bytes`"""
+        payload = json.dumps(result)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                evict = []
+                for old_key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_used ASC").fetchall():
+                    if total <= self.max_bytes or old_key == key:
+                        break
+                    evict.append((old_key,))
+                    total -= size
+                self._db.executemany("DELETE FROM entries WHERE key = ?", evict)
+            self._db.commit()
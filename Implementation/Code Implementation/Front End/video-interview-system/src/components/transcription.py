@@ -107,19 +107,49 @@
 
 
 ## without cleaning
-import whisper
 import os
 import tempfile
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Import config
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.model_registry import registry
+from components.media_ingest import decode_audio, SAMPLE_RATE
+from components.vad import detect_speech, join_regions, joined_to_original, plan_chunks, speech_duration
+from components.transcription_backends import load_backend
+from components.transcript_cache import TranscriptCache, audio_digest
+from components.thread_budget import stage_threads
+
+# Gain applied before Whisper to recordings (same as the previous ffmpeg `volume=2.0` filter of
+# transcribe_video); audio files given to transcribe_audio are transcribed unamplified, as before
+TRANSCRIPTION_GAIN = 2.0
+TRANSCRIPT_CACHE_KEY = "transcript_cache"
 
 class Transcription:
-    def __init__(self, model_name="large"):
+    def __init__(self, model_name="large", backend=None):
         """Initialize Whisper model for transcription"""
+        self.backend = backend or Config.TRANSCRIPTION_BACKEND
+        registry_key = f"whisper:{self.backend}:{model_name}"
+        if self.backend == "openai-whisper" and Config.WHISPER_QUANTIZE_INT8:
+            registry_key += ":int8"
         try:
-            self.model = whisper.load_model(model_name)
-            print(f"Whisper model '{model_name}' loaded successfully")
+            # Whisper is loaded once per process and shared by all instances
+            self.model = registry.get(registry_key, lambda: load_backend(self.backend, model_name))
+            print(f"Whisper model '{model_name}' ready ({self.backend})")
         except Exception as e:
             print(f"Error loading Whisper model: {e}")
             raise
+        
+        self.cache = None
+        if Config.TRANSCRIPT_CACHE_ENABLED:
+            try:
+                self.cache = registry.get(TRANSCRIPT_CACHE_KEY, lambda: TranscriptCache(
+                    Config.TRANSCRIPT_CACHE_DIR, max_bytes=Config.TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024))
+            except Exception as e:
+                print(f"Transcript cache unavailable: {e}")
     
     def transcribe_audio(self, audio_path, language="en"):
         """Transcribe audio file to text"""
@@ -128,30 +158,161 @@ class Transcription:
                 raise FileNotFoundError(f"Audio file not found: {audio_path}")
             
             print(f"Transcribing audio: {audio_path}")
+            if self._chunked() or self.cache is not None:
+                # Decode once and go through the cached / chunked (parallel) path; files were
+                # always transcribed as recorded, so no gain here
+                audio = decode_audio(audio_path, SAMPLE_RATE)
+                regions = detect_speech(audio.samples) if Config.VAD_ENABLED else None
+                return self.transcribe_array(audio.samples, language, regions=regions, gain=1.0)
+            return self._run_whisper(audio_path, language)
             
-            # Force English language and add other parameters for better accuracy
-            result = self.model.transcribe(
-                audio_path,
-                language="en",  # Force English
-                task="transcribe",  # Not translate
-                verbose=False,
-                word_timestamps=False,
-                temperature=0.0,  # More deterministic
-                no_speech_threshold=0.6,  # Adjust silence detection
-                logprob_threshold=-1.0,
-                compression_ratio_threshold=2.4
-            )
-            
-            transcript = result["text"].strip()
-            
-            # Return transcript as-is without cleaning (for grammar checker to handle filler words)
-            print(f"Transcription completed. Length: {len(transcript)} characters")
-            return transcript
+        except Exception as e:
+            print(f"Error during transcription: {e}")
+            return f"Transcription failed: {str(e)}"
+    
+    def transcribe_array(self, samples: np.ndarray, language="en", regions=None, gain=TRANSCRIPTION_GAIN):
+        """
+        Transcribe an already decoded 16 kHz mono float32 waveform.
+        With speech `regions` (see components.vad) only those are sent to Whisper.
+        The audio is amplified by `gain` and clipped to [-1, 1] first.
+        """
+        try:
+            return self.transcribe_result(samples, language, regions, gain)['text']
             
         except Exception as e:
             print(f"Error during transcription: {e}")
             return f"Transcription failed: {str(e)}"
     
+    def transcribe_result(self, samples: np.ndarray, language="en", regions=None, gain=TRANSCRIPTION_GAIN):
+        """
+        Transcribe a waveform to {'text', 'segments'}. Results are cached by audio
+        content and transcription settings, so re-analysing a recording skips Whisper.
+        """
+        key = self._cache_key(samples, regions, gain) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                print(f"Transcript cache hit ({len(cached['text'])} characters)")
+                return cached
+        
+        if self._chunked():
+            result = self.transcribe_chunked(samples, language, regions, gain)
+        else:
+            result = self._transcribe_whole(samples, language, regions, gain)
+        
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+    
+    def _transcribe_whole(self, samples, language="en", regions=None, gain=TRANSCRIPTION_GAIN):
+        """Single Whisper call over the (speech-only) waveform"""
+        regions = self._regions_to_transcribe(samples, regions)
+        if len(regions) == 0:
+            return {'text': "", 'segments': []}
+        if len(regions) > 1 or regions[0, 0] > 0 or regions[0, 1] < len(samples):
+            print(f"Keeping {speech_duration(regions):.1f}s of speech out of {len(samples) / SAMPLE_RATE:.1f}s")
+        
+        print(f"Transcribing {len(samples) / SAMPLE_RATE:.1f}s of decoded audio")
+        result = self._transcribe_chunk(samples, regions, language, gain)
+        print(f"Transcription completed. Length: {len(result['text'])} characters")
+        return result
+    
+    @staticmethod
+    def _regions_to_transcribe(samples, regions):
+        """
+        Speech `regions` when speech-only transcription applies, else the whole
+        waveform. When VAD found no speech the whole waveform is transcribed too,
+        so a quiet recording is never silently reduced to an empty transcript.
+        """
+        if regions is not None and Config.TRANSCRIBE_SPEECH_ONLY and len(regions):
+            return regions
+        if regions is not None and Config.TRANSCRIBE_SPEECH_ONLY and len(samples):
+            print("No speech detected, transcribing the full recording")
+        if not len(samples):
+            return np.zeros((0, 2), dtype=np.int64)
+        return np.array([[0, len(samples)]], dtype=np.int64)
+    
+    def _cache_key(self, samples, regions, gain=TRANSCRIPTION_GAIN):
+        """Audio content hash + backend, model, decoding and preprocessing settings"""
+        speech_only = regions is not None and Config.TRANSCRIBE_SPEECH_ONLY
+        settings = {
+            **self.model.settings(),
+            'language': "en",
+            'gain': gain,
+            'chunk_seconds': Config.TRANSCRIPTION_CHUNK_SECONDS if self._chunked() else None,
+            'join_gap': Config.VAD_JOIN_GAP if speech_only else None,
+            'regions': regions.tolist() if speech_only else None,
+        }
+        return TranscriptCache.make_key(audio_digest(samples), settings)
+    
+    def transcribe_chunked(self, samples: np.ndarray, language="en", regions=None, gain=TRANSCRIPTION_GAIN):
+        """
+        Split the waveform at pauses into chunks of at most TRANSCRIPTION_CHUNK_SECONDS,
+        transcribe them concurrently and stitch the results back in order.
+        Returns {'text', 'segments'} with segment times in seconds of `samples`.
+        """
+        regions = self._regions_to_transcribe(samples, regions)
+        if len(regions) == 0:
+            return {'text': "", 'segments': []}
+        
+        chunks = plan_chunks(samples, regions, Config.TRANSCRIPTION_CHUNK_SECONDS)
+        workers = self._chunk_workers(len(chunks))
+        print(f"Transcribing {speech_duration(regions):.1f}s of speech in {len(chunks)} chunk(s) on {workers} worker(s)")
+        
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda chunk: self._transcribe_chunk(samples, chunk, language, gain), chunks))
+        else:
+            results = [self._transcribe_chunk(samples, chunk, language, gain) for chunk in chunks]
+        
+        # pool.map preserves chunk order, so stitching is a concatenation
+        transcript = " ".join(r['text'] for r in results if r['text'])
+        segments = [segment for r in results for segment in r['segments']]
+        print(f"Transcription completed. Length: {len(transcript)} characters")
+        return {'text': transcript, 'segments': segments}
+    
+    def _transcribe_chunk(self, samples, chunk_regions, language="en", gain=TRANSCRIPTION_GAIN):
+        """Transcribe one chunk of speech regions; segment times are mapped back to `samples`"""
+        audio, layout = join_regions(samples, chunk_regions, return_layout=True)
+        boosted = np.clip(audio * gain, -1.0, 1.0).astype(np.float32)
+        result = self.model.transcribe(boosted, language="en")
+        segments = []
+        for s in result.get('segments', []):
+            segment = {
+                'start': joined_to_original(s['start'], layout),
+                'end': joined_to_original(s['end'], layout),
+                'text': s['text'].strip(),
+            }
+            if 'words' in s:
+                segment['words'] = [dict(w, start=joined_to_original(w['start'], layout),
+                                         end=joined_to_original(w['end'], layout)) for w in s['words']]
+            segments.append(segment)
+        return {'text': result["text"].strip(), 'segments': segments}
+    
+    def _chunked(self):
+        """
+        Chunk only where the chunks decode concurrently: a backend that is not thread-safe
+        (openai-whisper) would run them one by one, slower than its single transcribe call
+        """
+        return Config.TRANSCRIPTION_CHUNKED and getattr(self.model, 'thread_safe', False)
+    
+    def _chunk_workers(self, n_chunks):
+        """Concurrent chunk decodes; backends that are not thread-safe run chunks one by one"""
+        if not getattr(self.model, 'thread_safe', False):
+            return 1
+        return max(1, min(n_chunks, Config.TRANSCRIPTION_WORKERS or stage_threads('whisper')))
+    
+    def _run_whisper(self, audio, language="en"):
+        """Run Whisper on a file path or waveform and return the transcript"""
+        # Force English language (decoding parameters are shared by all backends)
+        result = self.model.transcribe(audio, language="en")
+        
+        transcript = result["text"].strip()
+        
+        # Return transcript as-is without cleaning (for grammar checker to handle filler words)
+        print(f"Transcription completed. Length: {len(transcript)} characters")
+        return transcript
+    
     def _clean_transcript(self, text):
         """Clean up the transcript text - MINIMAL CLEANING ONLY"""
         import re
@@ -172,38 +333,11 @@ class Transcription:
     def transcribe_video(self, video_path):
         """Extract audio from video and transcribe"""
         try:
-            # Create temporary audio file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-                temp_audio_path = temp_audio.name
-            
-            # Extract audio using ffmpeg
-            import subprocess
-            
-            cmd = [
-                'ffmpeg', '-y',
-                '-i', video_path,
-                '-vn',  # no video
-                '-acodec', 'pcm_s16le',
-                '-ar', '16000',  # 16kHz for Whisper
-                '-ac', '1',  # mono
-                '-af', 'volume=2.0',  # Boost volume
-                temp_audio_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg failed: {result.stderr}")
-            
-            # Transcribe the extracted audio
-            transcript = self.transcribe_audio(temp_audio_path, language="en")
-            
-            # Clean up temp file
-            if os.path.exists(temp_audio_path):
-                os.unlink(temp_audio_path)
-            
-            return transcript
+            # Decode the audio track in memory (no temp WAV)
+            audio = decode_audio(video_path, SAMPLE_RATE)
+            regions = detect_speech(audio.samples) if Config.VAD_ENABLED else None
+            return self.transcribe_array(audio.samples, language="en", regions=regions)
             
         except Exception as e:
             print(f"Error transcribing video: {e}")
-            return f"Video transcription failed: {str(e)}"
\ No newline at end of file
+            return f"Video transcription failed: {str(e)}"
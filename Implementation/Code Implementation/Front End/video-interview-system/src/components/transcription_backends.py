@@ -0,0 +1,138 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.thread_budget import configure_torch, stage_threads
+
+# Decoding settings shared by every backend (English, greedy, Whisper's default fallbacks)
+DECODE_OPTIONS = {
+    'task': "transcribe",               # Not translate
+    'temperature': 0.0,                 # More deterministic
+    'no_speech_threshold': 0.6,         # Adjust silence detection
+    'logprob_threshold': -1.0,
+    'compression_ratio_threshold': 2.4,
+}
+
+
+def quantize_whisper_int8(model):
+    """
+    Dynamic int8 quantization of every Linear layer (CPU only): weights are
+    quantized once here, activations on the fly at each call.
+    """
+    import torch
+    import whisper.model
+    for module in model.modules():
+        # whisper's Linear only adds a dtype cast, which float32 CPU inference never needs;
+        # quantize_dynamic only swaps exact nn.Linear instances
+        if type(module) is whisper.model.Linear:
+            module.__class__ = torch.nn.Linear
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+class WhisperBackend:
+    """Reference openai-whisper (PyTorch) implementation"""
+
+    name = "openai-whisper"
+    # transcribe() installs kv-cache hooks on the shared model, so calls must not overlap
+    thread_safe = False
+
+    def __init__(self, model_name):
+        import whisper
+        configure_torch()
+        self.model_name = model_name
+        # One model per process, used by every session, the warm-up and the incremental transcriber
+        self._lock = threading.Lock()
+        self.quantized = Config.WHISPER_QUANTIZE_INT8
+        if self.quantized:
+            self.model = quantize_whisper_int8(whisper.load_model(model_name, device="cpu"))
+        else:
+            self.model = whisper.load_model(model_name)
+
+    def settings(self):
+        """Everything besides the audio that determines the output (transcript cache key)"""
+        return {'backend': self.name, 'model': self.model_name, 'word_timestamps': Config.TRANSCRIPTION_WORD_TIMESTAMPS,
+                'int8': self.quantized, **DECODE_OPTIONS}
+
+    def transcribe(self, audio, language="en"):
+        """Transcribe a file path or 16 kHz float32 waveform; returns {'text', 'segments'}"""
+        with self._lock:
+            result = self.model.transcribe(
+                audio,
+                language=language,
+                verbose=False,
+                word_timestamps=Config.TRANSCRIPTION_WORD_TIMESTAMPS,
+                **DECODE_OPTIONS
+            )
+        segments = []
+        for s in result.get('segments', []):
+            segment = {'start': s['start'], 'end': s['end'], 'text': s['text']}
+            if 'words' in s:
+                segment['words'] = [{'start': w['start'], 'end': w['end'], 'word': w['word']} for w in s['words']]
+            segments.append(segment)
+        return {'text': result["text"], 'segments': segments}
+
+
+class FasterWhisperBackend:
+    """CTranslate2 implementation (faster-whisper), int8 on CPU by default"""
+
+    name = "faster-whisper"
+    # CTranslate2 runs up to `num_workers` transcriptions in parallel from different threads
+    thread_safe = True
+
+    def __init__(self, model_name):
+        from faster_whisper import WhisperModel
+        self.model_name = model_name
+        budget = stage_threads('whisper')
+        workers, cpu_threads = 1, Config.FASTER_WHISPER_CPU_THREADS or budget
+        if Config.TRANSCRIPTION_CHUNKED:
+            # Split the Whisper thread budget between the concurrent chunk decodes
+            workers = max(1, Config.TRANSCRIPTION_WORKERS or budget)
+            cpu_threads = Config.FASTER_WHISPER_CPU_THREADS or max(1, budget // workers)
+        self.model = WhisperModel(
+            model_name,
+            device=Config.FASTER_WHISPER_DEVICE,
+            compute_type=Config.FASTER_WHISPER_COMPUTE_TYPE,
+            cpu_threads=cpu_threads,
+            num_workers=workers
+        )
+
+    def settings(self):
+        """Everything besides the audio that determines the output (transcript cache key)"""
+        return {'backend': self.name, 'model': self.model_name, 'word_timestamps': Config.TRANSCRIPTION_WORD_TIMESTAMPS,
+                'device': Config.FASTER_WHISPER_DEVICE, 'compute_type': Config.FASTER_WHISPER_COMPUTE_TYPE,
+                'beam_size': Config.FASTER_WHISPER_BEAM_SIZE, **DECODE_OPTIONS}
+
+    def transcribe(self, audio, language="en"):
+        """Transcribe a file path or 16 kHz float32 waveform; returns {'text', 'segments'}"""
+        options = dict(DECODE_OPTIONS)
+        options['log_prob_threshold'] = options.pop('logprob_threshold')
+        segments, _ = self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=Config.FASTER_WHISPER_BEAM_SIZE,
+            word_timestamps=Config.TRANSCRIPTION_WORD_TIMESTAMPS,
+            **options
+        )
+        # Segments are generated lazily while decoding
+        result = []
+        for s in segments:
+            segment = {'start': s.start, 'end': s.end, 'text': s.text}
+            if s.words:
+                segment['words'] = [{'start': w.start, 'end': w.end, 'word': w.word} for w in s.words]
+            result.append(segment)
+        return {'text': "".join(s['text'] for s in result), 'segments': result}
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def load_backend(backend_name, model_name):
+    """Instantiate the transcription backend registered under `backend_name`"""
+    if backend_name not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend '{backend_name}'. Choose from: {', '.join(BACKENDS)}")
+    return BACKENDS[backend_name](model_name)
@@ -0,0 +1,208 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from config.settings import Config
+from components.media_ingest import SAMPLE_RATE
+
+FRAME_LENGTH = 512      # 32 ms at 16 kHz
+FRAME_HOP = 256
+BLOCK_FRAMES = 4096     # frames analyzed per vectorized block (bounds the temporary arrays)
+SPEECH_BAND = (300.0, 3400.0)
+NOISE_PERCENTILE = 10   # frame-energy percentile taken as the noise floor
+
+
+def frame_features(y: np.ndarray, sr: int = SAMPLE_RATE):
+    """
+    Per-frame log energy (dBFS), spectral flatness and share of power in the
+    speech band, computed in one pass over the buffer.
+    """
+    if len(y) < FRAME_LENGTH:
+        y = np.pad(y, (0, FRAME_LENGTH - len(y)))
+    frames = np.lib.stride_tricks.sliding_window_view(y, FRAME_LENGTH)[::FRAME_HOP]
+    window = np.hanning(FRAME_LENGTH).astype(np.float32)
+    freqs = np.fft.rfftfreq(FRAME_LENGTH, 1.0 / sr)
+    band = (freqs >= SPEECH_BAND[0]) & (freqs <= SPEECH_BAND[1])
+
+    energy_db = np.empty(len(frames), dtype=np.float32)
+    flatness = np.empty(len(frames), dtype=np.float32)
+    band_ratio = np.empty(len(frames), dtype=np.float32)
+    for i in range(0, len(frames), BLOCK_FRAMES):
+        block = frames[i:i + BLOCK_FRAMES]
+        energy_db[i:i + len(block)] = 10 * np.log10(np.mean(np.square(block, dtype=np.float32), axis=1) + 1e-10)
+
+        power = np.abs(np.fft.rfft(block * window, axis=1))**2 + 1e-12
+        flatness[i:i + len(block)] = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+        band_ratio[i:i + len(block)] = power[:, band].sum(axis=1) / power.sum(axis=1)
+
+    return energy_db, flatness, band_ratio
+
+
+def _mask_to_runs(mask: np.ndarray):
+    """(start, end) frame indices (end exclusive) of the True runs in `mask`"""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]
+
+
+def _merge_close(starts: np.ndarray, ends: np.ndarray, min_gap: int):
+    """Merge runs separated by fewer than `min_gap` units"""
+    if len(starts) < 2:
+        return starts, ends
+    split = (starts[1:] - ends[:-1]) >= min_gap
+    return starts[np.concatenate(([True], split))], ends[np.concatenate((split, [True]))]
+
+
+def frame_energy_db(y: np.ndarray) -> np.ndarray:
+    """Per-frame log energy (dBFS) on the `detect_speech` frame grid"""
+    if len(y) < FRAME_LENGTH:
+        y = np.pad(y, (0, FRAME_LENGTH - len(y)))
+    frames = np.lib.stride_tricks.sliding_window_view(y, FRAME_LENGTH)[::FRAME_HOP]
+    return 10 * np.log10(np.mean(np.square(frames, dtype=np.float32), axis=1) + 1e-10)
+
+
+def noise_floor_db(y: np.ndarray) -> float:
+    """Noise floor of a buffer (dBFS), as estimated by `detect_speech`"""
+    return float(np.percentile(frame_energy_db(y), NOISE_PERCENTILE))
+
+
+def noise_floor_of_blocks(blocks) -> float:
+    """
+    `noise_floor_db` of the concatenated `blocks` (e.g. from media_ingest.iter_audio_blocks),
+    computed block by block: only the frame energies are kept, 256 times less than the samples.
+    """
+    energies, tail = [], np.zeros(0, dtype=np.float32)
+    for block in blocks:
+        y = np.concatenate((tail, block))
+        if len(y) < FRAME_LENGTH:
+            tail = y
+            continue
+        energies.append(frame_energy_db(y))
+        # Frames continue on the same grid in the next block
+        tail = y[len(energies[-1]) * FRAME_HOP:]
+    if not energies:
+        energies.append(frame_energy_db(tail))
+    return float(np.percentile(np.concatenate(energies), NOISE_PERCENTILE))
+
+
+def detect_speech(y: np.ndarray, sr: int = SAMPLE_RATE, noise_floor: float = None) -> np.ndarray:
+    """
+    Voice activity detection over a whole buffer.
+
+    A frame is speech when it is VAD_ENERGY_MARGIN_DB above the recording's
+    noise floor (10th percentile of frame energy; with VAD_MIN_ENERGY_DB set,
+    never below that) and looks voiced: tonal (low spectral flatness) or concentrated in the
+    speech band. Gaps shorter than VAD_MIN_SILENCE are bridged, regions shorter
+    than VAD_MIN_SPEECH dropped and the rest padded by VAD_PADDING.
+
+    A `noise_floor` (dBFS) may be passed instead for buffers that are part of a
+    longer recording, e.g. the quietest level seen so far in a live recording,
+    or the whole recording's floor (`noise_floor_of_blocks`).
+
+    Returns an int array of shape (regions, 2) with [start, end) sample offsets.
+    """
+    if y.size == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    energy_db, flatness, band_ratio = frame_features(y, sr)
+    floor = float(np.percentile(energy_db, NOISE_PERCENTILE)) if noise_floor is None else noise_floor
+    threshold = floor + Config.VAD_ENERGY_MARGIN_DB
+    if Config.VAD_MIN_ENERGY_DB is not None:
+        threshold = max(threshold, Config.VAD_MIN_ENERGY_DB)
+    voiced = (flatness < Config.VAD_MAX_FLATNESS) | (band_ratio > Config.VAD_MIN_BAND_RATIO)
+    speech = (energy_db > threshold) & voiced
+
+    frames_per_second = sr / FRAME_HOP
+    starts, ends = _mask_to_runs(speech)
+    starts, ends = _merge_close(starts, ends, int(Config.VAD_MIN_SILENCE * frames_per_second))
+    long_enough = (ends - starts) >= int(Config.VAD_MIN_SPEECH * frames_per_second)
+    starts, ends = starts[long_enough], ends[long_enough]
+
+    # Frames -> samples, padded, clipped and re-merged where the padding made them touch
+    pad = int(Config.VAD_PADDING * sr)
+    sample_starts = np.maximum(starts * FRAME_HOP - pad, 0)
+    sample_ends = np.minimum((ends - 1) * FRAME_HOP + FRAME_LENGTH + pad, len(y))
+    sample_starts, sample_ends = _merge_close(sample_starts, sample_ends, 1)
+
+    return np.stack((sample_starts, sample_ends), axis=1).astype(np.int64)
+
+
+def speech_duration(regions: np.ndarray, sr: int = SAMPLE_RATE) -> float:
+    """Total seconds covered by `regions`"""
+    return float(np.sum(regions[:, 1] - regions[:, 0])) / sr if len(regions) else 0.0
+
+
+def join_regions(y: np.ndarray, regions: np.ndarray, sr: int = SAMPLE_RATE, gap: float = None,
+                 return_layout: bool = False):
+    """
+    Concatenate the speech regions of `y`, separated by short silences so words are not glued together.
+    With `return_layout`, also return (joined_start, original_start, length) per region, in samples,
+    for mapping times in the joined audio back to the recording (see `joined_to_original`).
+    """
+    gap = Config.VAD_JOIN_GAP if gap is None else gap
+    silence = np.zeros(int(gap * sr), dtype=y.dtype)
+    parts, layout, position = [], [], 0
+    for start, end in regions:
+        if parts:
+            parts.append(silence)
+            position += len(silence)
+        parts.append(y[start:end])
+        layout.append((position, int(start), int(end - start)))
+        position += int(end - start)
+    joined = np.concatenate(parts) if parts else np.zeros(0, dtype=y.dtype)
+    return (joined, layout) if return_layout else joined
+
+
+def joined_to_original(t: float, layout, sr: int = SAMPLE_RATE) -> float:
+    """Map a time (seconds) in audio built by `join_regions` back to the original recording"""
+    sample = t * sr
+    for joined_start, original_start, length in layout:
+        if sample < joined_start:
+            return original_start / sr  # inside an inserted gap: snap to the next region
+        if sample <= joined_start + length:
+            return (original_start + sample - joined_start) / sr
+    if not layout:
+        return t
+    joined_start, original_start, length = layout[-1]
+    return (original_start + length) / sr
+
+
+def quietest_point(y: np.ndarray, lo: int, hi: int, sr: int = SAMPLE_RATE) -> int:
+    """Sample offset of the centre of the lowest-energy 25 ms frame in y[lo:hi]"""
+    frame = max(1, int(0.025 * sr))
+    n = (hi - lo) // frame
+    if n < 1:
+        return hi
+    energies = np.mean(np.square(y[lo:lo + n * frame].reshape(n, frame)), axis=1)
+    return lo + int(np.argmin(energies)) * frame + frame // 2
+
+
+def plan_chunks(y: np.ndarray, regions: np.ndarray, max_seconds: float, sr: int = SAMPLE_RATE) -> list:
+    """
+    Group consecutive speech regions into chunks of at most `max_seconds` of joined
+    audio (regions plus VAD_JOIN_GAP silences), so every chunk boundary falls in a
+    pause. Regions longer than `max_seconds` are first cut at their quietest point
+    in the second half of the limit. Returns one (n, 2) region array per chunk.
+    """
+    max_len = int(max_seconds * sr)
+    gap = int(Config.VAD_JOIN_GAP * sr)
+
+    pieces = []
+    for start, end in regions:
+        while end - start > max_len:
+            cut = quietest_point(y, start + max_len // 2, start + max_len, sr)
+            pieces.append((start, cut))
+            start = cut
+        pieces.append((start, end))
+
+    chunks, current, length = [], [], 0
+    for start, end in pieces:
+        added = (end - start) + (gap if current else 0)
+        if current and length + added > max_len:
+            chunks.append(np.array(current, dtype=np.int64))
+            current, length, added = [], 0, end - start
+        current.append((start, end))
+        length += added
+    if current:
+        chunks.append(np.array(current, dtype=np.int64))
+    return chunks